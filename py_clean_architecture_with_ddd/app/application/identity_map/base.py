@@ -1,4 +1,7 @@
+import threading
+import time
 from abc import ABC
+from collections import OrderedDict
 from typing import Generic, TypeVar
 from uuid import UUID
 
@@ -6,6 +9,11 @@ from app.domain.entity.base import Entity
 
 T = TypeVar("T", bound=Entity)
 
+# 保持する最大エンティティ数の既定値
+DEFAULT_MAX_ENTRIES = 10_000
+# エンティティを保持する秒数の既定値
+DEFAULT_TTL = 60.0
+
 
 class IdentityMap(Generic[T], ABC):
     """IdentityMapパターンの基底クラス
@@ -13,22 +21,56 @@ class IdentityMap(Generic[T], ABC):
     同一エンティティの複数インスタンス生成を防ぎ、整合性を保持します。
     UUIDをキーとしてエンティティを管理し、同一IDのエンティティの
     重複生成を防止します。
+    リクエストを跨いだ二次キャッシュとしても機能するため、保持数をLRUで、
+    保持期間をTTLで制限します。
 
     型パラメータ:
         T: 管理対象のエンティティの型
     """
 
-    def __init__(self) -> None:
-        """新しいIdentityMapを初期化します。"""
-        self._entities: dict[UUID, T] = {}
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL) -> None:
+        """新しいIdentityMapを初期化します。
 
-    def add(self, entity: T) -> None:
+        Args:
+            max_entries: 保持する最大エンティティ数 超えた場合は最も使われていないものから削除します
+            ttl: エンティティを保持する秒数
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entities: OrderedDict[UUID, tuple[T, float]] = OrderedDict()
+        self._generation = 0
+        # ID毎の最後に削除した世代 古い記録から最大エンティティ数まで保持する
+        self._removed_at: OrderedDict[UUID, int] = OrderedDict()
+        # 記録から削除したIDが削除された可能性のある最新の世代
+        self._forgotten_generation = 0
+        # スレッドプール型サーバーでは複数スレッドから呼ばれるため保護する
+        self._lock = threading.RLock()
+
+    @property
+    def generation(self) -> int:
+        """削除が行われる度に進む世代
+
+        DBから取得したエンティティを登録する際、取得開始時の世代を`add`に渡すことで、
+        取得中に削除された古いエンティティを登録し直すことを防ぎます。
+        削除はID毎に記録するため、無関係なエンティティの削除では登録を取りやめません。
+        """
+        return self._generation
+
+    def add(self, entity: T, generation: int | None = None) -> None:
         """エンティティをマップに追加します。
 
         Args:
             entity: 追加するエンティティ
+            generation: DBからの取得開始時の世代 指定した場合、取得中に同じIDが削除されていれば追加しません
         """
-        self._entities[entity.id] = entity
+        with self._lock:
+            if generation is not None and not self._is_fresh(entity.id, generation):
+                return
+            self._entities[entity.id] = (entity, time.monotonic() + self._ttl)
+            self._entities.move_to_end(entity.id)
+            while len(self._entities) > self._max_entries:
+                _, (evicted, _) = self._entities.popitem(last=False)
+                self._on_removed(evicted)
 
     def get(self, id: UUID) -> T | None:
         """IDによりエンティティを取得します。
@@ -39,7 +81,17 @@ class IdentityMap(Generic[T], ABC):
         Returns:
             Optional[T]: 見つかった場合はエンティティ、見つからない場合はNone
         """
-        return self._entities.get(id)
+        with self._lock:
+            item = self._entities.get(id)
+            if item is None:
+                return None
+            entity, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._entities[id]
+                self._on_removed(entity)
+                return None
+            self._entities.move_to_end(id)
+            return entity
 
     def remove(self, id: UUID) -> None:
         """IDによりエンティティをマップから削除します。
@@ -47,12 +99,24 @@ class IdentityMap(Generic[T], ABC):
         Args:
             id: 削除対象エンティティのID
         """
-        if id in self._entities:
-            del self._entities[id]
+        with self._lock:
+            self._generation += 1
+            self._removed_at[id] = self._generation
+            self._removed_at.move_to_end(id)
+            while len(self._removed_at) > self._max_entries:
+                _, self._forgotten_generation = self._removed_at.popitem(last=False)
+            item = self._entities.pop(id, None)
+            if item is not None:
+                self._on_removed(item[0])
 
     def clear(self) -> None:
         """全てのエンティティをマップから削除します。"""
-        self._entities.clear()
+        with self._lock:
+            # 全てのIDが削除されたため、これ以前に開始した取得は全て登録しない
+            self._generation += 1
+            self._forgotten_generation = self._generation
+            self._removed_at.clear()
+            self._entities.clear()
 
     def contains(self, id: UUID) -> bool:
         """指定されたIDのエンティティが存在するか確認します。
@@ -63,7 +127,7 @@ class IdentityMap(Generic[T], ABC):
         Returns:
             bool: エンティティが存在する場合はTrue、そうでない場合はFalse
         """
-        return id in self._entities
+        return self.get(id) is not None
 
     def get_all(self) -> list[T]:
         """マップ内の全エンティティを取得します。
@@ -71,4 +135,23 @@ class IdentityMap(Generic[T], ABC):
         Returns:
             list[T]: マップ内の全エンティティのリスト
         """
-        return list(self._entities.values())
+        with self._lock:
+            return [entity for entity, _ in self._entities.values()]
+
+    def _is_fresh(self, id: UUID, generation: int) -> bool:
+        """取得開始後にIDが削除されていないかどうか
+
+        記録から削除したIDは判定できないため、削除以前に開始した取得は削除されたものとして扱います。
+        """
+        if generation < self._forgotten_generation:
+            return False
+        return self._removed_at.get(id, 0) <= generation
+
+    def _on_removed(self, entity: T) -> None:
+        """エンティティがマップから削除された際に呼び出されます。
+
+        サブクラスで追加のインデックスを持つ場合にオーバーライドします。
+
+        Args:
+            entity: 削除されたエンティティ
+        """
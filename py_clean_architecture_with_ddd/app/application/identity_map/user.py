@@ -1,8 +1,11 @@
-from uuid import UUID
+from typing import TYPE_CHECKING
 
 from app.domain.entity.user import User
 
-from .base import IdentityMap
+from .base import DEFAULT_MAX_ENTRIES, DEFAULT_TTL, IdentityMap
+
+if TYPE_CHECKING:
+    from uuid import UUID
 
 
 class UserIdentityMap(IdentityMap[User]):
@@ -10,22 +13,36 @@ class UserIdentityMap(IdentityMap[User]):
 
     ユーザーエンティティの一意性を保証し、メモリ内キャッシュとして機能します。
     UUIDだけでなく、メールアドレスによる検索もサポートします。
+    メールアドレスのインデックスはIDのみを保持するため、LRUとTTLはIDのエントリーに従います。
     """
 
-    def __init__(self) -> None:
-        """新しいUserIdentityMapを初期化します。"""
-        super().__init__()
-        self._email_index: dict[str, User] = {}
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL) -> None:
+        """新しいUserIdentityMapを初期化します。
 
-    def add(self, user: User) -> None:
+        Args:
+            max_entries: 保持する最大エンティティ数
+            ttl: エンティティを保持する秒数
+        """
+        super().__init__(max_entries=max_entries, ttl=ttl)
+        self._email_index: dict[str, UUID] = {}
+
+    def add(self, user: User, generation: int | None = None) -> None:
         """ユーザーエンティティをマップに追加します。
 
         Args:
             user: 追加するユーザーエンティティ
+            generation: DBからの取得開始時の世代
         """
-        super().add(user)
-        # メールアドレスによるインデックスも更新
-        self._email_index[user.email.value] = user
+        with self._lock:
+            if generation is not None and not self._is_fresh(user.id, generation):
+                return
+            # メールアドレスが変更されていた場合は古いインデックスを削除
+            previous = self._entities.get(user.id)
+            if previous is not None and previous[0].email.value != user.email.value:
+                self._email_index.pop(previous[0].email.value, None)
+            super().add(user, generation)
+            # メールアドレスによるインデックスも更新
+            self._email_index[user.email.value] = user.id
 
     def get_by_email(self, email: str) -> User | None:
         """メールアドレスによりユーザーエンティティを取得します。
@@ -36,20 +53,19 @@ class UserIdentityMap(IdentityMap[User]):
         Returns:
             Optional[User]: 見つかった場合はユーザーエンティティ、見つからない場合はNone
         """
-        return self._email_index.get(email)
-
-    def remove(self, id: UUID) -> None:
-        """IDによりユーザーエンティティをマップから削除します。
-        Args:
-            id: 削除対象ユーザーエンティティのID
-        """
-        user = self.get(id)
-        if user and user.email.value in self._email_index:
-            # メールアドレスインデックスからも削除
-            del self._email_index[user.email.value]
-        super().remove(id)
+        with self._lock:
+            id = self._email_index.get(email)
+            if id is None:
+                return None
+            return self.get(id)
 
     def clear(self) -> None:
         """全てのユーザーエンティティをマップから削除します。"""
-        self._email_index.clear()
-        super().clear()
+        with self._lock:
+            self._email_index.clear()
+            super().clear()
+
+    def _on_removed(self, user: User) -> None:
+        # メールアドレスインデックスからも削除
+        if self._email_index.get(user.email.value) == user.id:
+            del self._email_index[user.email.value]
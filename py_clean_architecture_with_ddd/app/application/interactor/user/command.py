@@ -1,55 +1,70 @@
 import asyncio
+from collections.abc import AsyncIterator
 from datetime import datetime
 from logging import getLogger
+from typing import Any
 from uuid import uuid4
 from zoneinfo import ZoneInfo
 
 from app.application.identity_map.user import UserIdentityMap
-from app.application.unit_of_work.user import UserUnitOfWork
+from app.application.unit_of_work.user import UserUnitOfWorkFactory
 from app.application.usecase.user import (
+    BulkCreateUserResultData,
+    BulkCreateUsersOutputData,
     CreateUserInputData,
     CreateUserOutputData,
+    UpdateUserInputData,
+    UpdateUserOutputData,
     UserCommandInputPort,
     UserCommandOutputPort,
 )
 from app.domain.entity.user import User
+from app.domain.exceptions import InvalidValueObjectError
 from app.domain.repository.user import ReadUserRepository
 from app.domain.value_object.user.email import Email
 from app.domain.value_object.user.name import UserName
 
 logger = getLogger(__name__)
 
+# 一括作成で1トランザクションにまとめる最大件数
+DEFAULT_BULK_CHUNK_SIZE = 500
+
 
 class UserCommandInteractor(UserCommandInputPort):
     """ユーザー関連のコマンド操作を実装するインタラクター
 
     CQRSパターンにおけるCommand責務を担当します。
     状態を変更する操作のみを提供します。
+    プレゼンターはリクエスト毎に引数で受け取り、インスタンスには保持しません。
+    UnitOfWorkも実行毎に作成し、並行するリクエストとトランザクションを共有しません。
     """
 
     def __init__(
         self,
-        presenter: UserCommandOutputPort,
-        uow: UserUnitOfWork,
+        uow_factory: UserUnitOfWorkFactory,
         identity_map: UserIdentityMap,
         read_user_repository: ReadUserRepository,
+        bulk_chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
     ) -> None:
         """コンストラクタ
 
         Args:
-            presenter: コマンド操作の出力ポート
-            uow: ユーザーUnitOfWork
+            uow_factory: ユースケースの実行毎にユーザーUnitOfWorkを作成するファクトリー
             identity_map: ユーザーIdentityMap
+            read_user_repository: 読み取り専用のユーザーリポジトリ
+            bulk_chunk_size: 一括作成で1トランザクションにまとめる最大件数
         """
-        self.presenter = presenter
-        self._uow = uow
+        self._uow_factory = uow_factory
         self._identity_map = identity_map
         self._read_user_repository = read_user_repository
-    async def create_user(self, input_data: CreateUserInputData) -> None:
+        self._bulk_chunk_size = bulk_chunk_size
+
+    async def create_user(self, input_data: CreateUserInputData, presenter: UserCommandOutputPort) -> None:
         """ユーザーを新規作成するユースケース
 
         Args:
             input_data: ユーザー作成に必要な入力データ
+            presenter: コマンド操作の出力ポート
 
         Raises:
             ValueError: 入力データに問題がある場合
@@ -68,8 +83,8 @@ class UserCommandInteractor(UserCommandInputPort):
         now = datetime.now(tz=ZoneInfo("Asia/Tokyo"))
         user = User(
             id=uuid4(),
-            name=UserName(value=input_data.name),
-            email=Email(value=input_data.email),
+            name=UserName.intern(value=input_data.name),
+            email=Email.intern(value=input_data.email),
             created_at=now,
             updated_at=now,
         )
@@ -78,11 +93,143 @@ class UserCommandInteractor(UserCommandInputPort):
         await asyncio.sleep(1)
 
         # UnitOfWork内でトランザクション処理
-        async with self._uow as uow:
+        async with self._uow_factory.create() as uow:
             # リポジトリに保存対象として登録
-            # この段階でIdentityMapにも登録される
+            # IdentityMapには登録せず、コミットの確定後に同じIDのエントリーが削除される
             saved_user = await uow.users.save(user)
 
         # トランザクション完了後の処理
         output_data = CreateUserOutputData.from_entity(saved_user)
-        self.presenter.present_user_created(output_data)
+        presenter.present_user_created(output_data)
+
+    async def update_user(self, input_data: UpdateUserInputData, presenter: UserCommandOutputPort) -> None:
+        """ユーザーの指定された項目を更新するユースケース
+
+        UnitOfWork内で変更前のユーザーを取得し、指定された項目のみを変更します。
+        値が変わらなかった項目は保存されず、何も変わらなければ書き込みも行いません。
+
+        Args:
+            input_data: ユーザー更新に必要な入力データ
+            presenter: コマンド操作の出力ポート
+
+        Raises:
+            EntityNotFoundError: ユーザーが見つからない場合
+            ValueError: 入力データに問題がある場合
+        """
+        # 値オブジェクトの作成 トランザクション外
+        name = UserName.intern(value=input_data.name) if input_data.name is not None else None
+        email = Email.intern(value=input_data.email) if input_data.email is not None else None
+
+        # UnitOfWork内でトランザクション処理
+        async with self._uow_factory.create() as uow:
+            user = await uow.users.find_for_update(input_data.id)
+
+            changes: dict[str, Any] = {}
+            if name is not None and not name.equals(user.name):
+                changes["name"] = name
+            if email is not None and not email.equals(user.email):
+                if await self._read_user_repository.exists_by_email(email.value):
+                    msg = f"Email {email.value} is already created"
+                    raise ValueError(msg)
+                changes["email"] = email
+            if changes:
+                changes["updated_at"] = datetime.now(tz=ZoneInfo("Asia/Tokyo"))
+                user = user.model_copy(update=changes)
+
+            # 変更されなかった場合はコミット時に書き込まれない
+            saved_user = await uow.users.save(user)
+
+        # トランザクション完了後の処理
+        output_data = UpdateUserOutputData.from_entity(saved_user)
+        presenter.present_user_updated(output_data)
+
+    async def bulk_create_users(
+        self,
+        inputs: AsyncIterator[CreateUserInputData],
+        presenter: UserCommandOutputPort,
+    ) -> None:
+        """ユーザーを一括作成するユースケース
+
+        入力をチャンク単位にまとめ、チャンク毎にメールアドレスの重複を一度のクエリで確認し、
+        1トランザクションで一括INSERTします。
+        バリデーションや重複で失敗した行はエラーとして報告し、他の行の作成は継続します。
+
+        Args:
+            inputs: ユーザー作成に必要な入力データのストリーム
+            presenter: コマンド操作の出力ポート
+        """
+        results: list[BulkCreateUserResultData] = []
+        chunk: list[tuple[int, CreateUserInputData]] = []
+        index = 0
+        async for input_data in inputs:
+            chunk.append((index, input_data))
+            index += 1
+            if len(chunk) >= self._bulk_chunk_size:
+                results.extend(await self._create_chunk(chunk))
+                chunk = []
+        if chunk:
+            results.extend(await self._create_chunk(chunk))
+
+        presenter.present_users_bulk_created(BulkCreateUsersOutputData(results=results))
+
+    async def _create_chunk(
+        self,
+        chunk: list[tuple[int, CreateUserInputData]],
+    ) -> list[BulkCreateUserResultData]:
+        """1チャンク分のユーザーを1トランザクションで作成する
+
+        Args:
+            chunk: 入力ストリーム内の位置と入力データの組のリスト
+
+        Returns:
+            list[BulkCreateUserResultData]: 入力と同じ順序の行ごとの結果
+        """
+        errors: dict[int, str] = {}
+        users: dict[int, User] = {}
+
+        # ドメインロジックの実行 Entityの作成 トランザクション外
+        now = datetime.now(tz=ZoneInfo("Asia/Tokyo"))
+        seen_emails: set[str] = set()
+        for index, input_data in chunk:
+            try:
+                name = UserName.intern(value=input_data.name)
+                email = Email.intern(value=input_data.email)
+            except InvalidValueObjectError as e:
+                errors[index] = str(e)
+                continue
+            # チャンク内での重複
+            if email.value in seen_emails:
+                errors[index] = f"Email {email.value} is duplicated in the request"
+                continue
+            seen_emails.add(email.value)
+            users[index] = User(id=uuid4(), name=name, email=email, created_at=now, updated_at=now)
+
+        # 登録済みのメールアドレスをチャンク毎に一度のクエリで確認
+        existing_emails = await self._read_user_repository.find_existing_emails(
+            [user.email.value for user in users.values()],
+        )
+        for index, user in list(users.items()):
+            if user.email.value in existing_emails:
+                errors[index] = f"Email {user.email.value} is already created"
+                del users[index]
+
+        # UnitOfWork内でトランザクション処理 チャンク全体を一括INSERT
+        if users:
+            try:
+                async with self._uow_factory.create() as uow:
+                    await uow.users.save_all(list(users.values()))
+            except Exception as e:
+                # 一括INSERTが失敗した場合はチャンク全体がロールバックされる
+                logger.exception("Failed to bulk create users")
+                for index in users:
+                    errors[index] = str(e)
+                users.clear()
+
+        return [
+            BulkCreateUserResultData(
+                index=index,
+                user=CreateUserOutputData.from_entity(users[index]) if index in users else None,
+                error=errors.get(index),
+            )
+            for index, _ in chunk
+        ]
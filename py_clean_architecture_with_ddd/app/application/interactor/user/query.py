@@ -1,16 +1,25 @@
+from collections.abc import AsyncIterator
 from logging import getLogger
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from pydantic import BaseModel
 
 from app.application.identity_map.user import UserIdentityMap
 from app.application.usecase.user import (
+    BatchGetUsersInputData,
+    BatchGetUsersOutputData,
     GetUserOutputData,
+    ListUsersInputData,
     UserQueryInputPort,
     UserQueryOutputPort,
 )
+from app.domain.read_model.user import UserBatch
 from app.domain.repository.user import ReadUserRepository
 
+if TYPE_CHECKING:
+    from app.domain.entity.user import User
+
 logger = getLogger(__name__)
 
 
@@ -29,30 +38,29 @@ class UserQueryInteractor(UserQueryInputPort):
 
     CQRSパターンにおけるQuery責務を担当します。
     状態を参照する操作のみを提供します。
+    プレゼンターはリクエスト毎に引数で受け取り、インスタンスには保持しません。
     """
 
     def __init__(
         self,
         repositories: Repositories,
-        presenter: UserQueryOutputPort,
         identity_map: UserIdentityMap,
     ) -> None:
         """コンストラクタ
 
         Args:
             repositories: 読み取り用リポジトリ群
-            presenter: クエリ操作の出力ポート
             identity_map: ユーザーIdentityMap
         """
         self.repositories = repositories
-        self.presenter = presenter
         self._identity_map = identity_map
 
-    async def get_user_by_id(self, user_id: UUID) -> None:
+    async def get_user_by_id(self, user_id: UUID, presenter: UserQueryOutputPort) -> None:
         """IDによるユーザー取得
 
         Args:
             user_id: ユーザーID
+            presenter: クエリ操作の出力ポート
 
         Raises:
             EntityNotFoundError: ユーザーが見つからない場合
@@ -61,7 +69,7 @@ class UserQueryInteractor(UserQueryInputPort):
         user = self._identity_map.get(user_id)
         if user:
             output_data = GetUserOutputData.from_entity(user)
-            self.presenter.present_user_get(output_data)
+            presenter.present_user_get(output_data)
             return
 
         # IdentityMapに存在しない場合はリポジトリから取得
@@ -70,14 +78,15 @@ class UserQueryInteractor(UserQueryInputPort):
 
         # 出力データを作成し、プレゼンターに渡す
         output_data = GetUserOutputData.from_entity(user)
-        self.presenter.present_user_get(output_data)
+        presenter.present_user_get(output_data)
 
 
-    async def get_user_by_email(self, email: str) -> None:
+    async def get_user_by_email(self, email: str, presenter: UserQueryOutputPort) -> None:
         """メールアドレスによるユーザー取得
 
         Args:
             email: メールアドレス
+            presenter: クエリ操作の出力ポート
 
         Raises:
             EntityNotFoundError: ユーザーが見つからない場合
@@ -86,7 +95,7 @@ class UserQueryInteractor(UserQueryInputPort):
         user = self._identity_map.get_by_email(email)
         if user:
             output_data = GetUserOutputData.from_entity(user)
-            self.presenter.present_user_get(output_data)
+            presenter.present_user_get(output_data)
             return
 
         # IdentityMapに存在しない場合はリポジトリから取得
@@ -95,5 +104,85 @@ class UserQueryInteractor(UserQueryInputPort):
 
         # 出力データを作成し、プレゼンターに渡す
         output_data = GetUserOutputData.from_entity(user)
-        self.presenter.present_user_get(output_data)
+        presenter.present_user_get(output_data)
+
+    async def list_users(self, input_data: ListUsersInputData) -> AsyncIterator[UserBatch]:
+        """ユーザーを(created_at, id)の順にページ毎に逐次取得する
 
+        page_size件ずつリポジトリから取得し、取得したページを返し終えてから次のページを取得します。
+        保持するのは常に1ページ分のみのため、テーブルの件数に関わらずメモリ使用量は一定です。
+        参照のみのため、エンティティではなく列毎の配列に格納した`UserBatch`として取得します。
+
+        Args:
+            input_data: ユーザー一覧取得の入力データ
+
+        Yields:
+            UserBatch: 取得したユーザーの1ページ
+        """
+        after = None
+        if input_data.after_created_at is not None and input_data.after_id is not None:
+            after = (input_data.after_created_at, input_data.after_id)
+
+        while True:
+            users = await self.repositories.user.find_page_batch(input_data.page_size, after)
+            if users:
+                yield users
+
+            if len(users) < input_data.page_size:
+                return
+            last = users[-1]
+            after = (last.created_at, last.id)
+
+    async def get_users_by_ids(self, input_data: BatchGetUsersInputData, presenter: UserQueryOutputPort) -> None:
+        """複数のIDによるユーザー一括取得
+
+        IdentityMapに存在するユーザーはそのまま使用し、
+        存在しないユーザーのみをリポジトリから一度のクエリで取得します。
+        形式が不正なIDや見つからないIDは、エラーにせずnot_found_idsとして返します。
+        重複したIDは最初に現れた位置で一度だけ返します。
+
+        Args:
+            input_data: ユーザー一括取得の入力データ
+            presenter: クエリ操作の出力ポート
+        """
+        user_ids = [self._parse_user_id(id) for id in input_data.ids]
+
+        # まずIdentityMapから検索 重複したIDは一度だけ検索する
+        users: dict[UUID, User] = {}
+        missing_ids: list[UUID] = []
+        for user_id in dict.fromkeys(user_id for user_id in user_ids if user_id is not None):
+            user = self._identity_map.get(user_id)
+            if user:
+                users[user_id] = user
+            else:
+                missing_ids.append(user_id)
+
+        # IdentityMapに存在しないユーザーはまとめてリポジトリから取得
+        if missing_ids:
+            users.update(await self.repositories.user.find_by_ids(missing_ids))
+
+        # 入力IDの順序で出力データを作成する 大文字・小文字などの表記が異なる同一のIDも重複として扱う
+        found: list[GetUserOutputData] = []
+        not_found_ids: list[str] = []
+        returned_ids: set[UUID] = set()
+        returned_not_found_ids: set[str] = set()
+        for id, parsed_id in zip(input_data.ids, user_ids, strict=True):
+            user = users.get(parsed_id) if parsed_id is not None else None
+            if user is None:
+                if id not in returned_not_found_ids:
+                    returned_not_found_ids.add(id)
+                    not_found_ids.append(id)
+            elif user.id not in returned_ids:
+                returned_ids.add(user.id)
+                found.append(GetUserOutputData.from_entity(user))
+
+        output_data = BatchGetUsersOutputData(users=found, not_found_ids=not_found_ids)
+        presenter.present_users_batch_get(output_data)
+
+    @staticmethod
+    def _parse_user_id(id: str) -> UUID | None:
+        """文字列をユーザーIDに変換する 不正な形式の場合はNoneを返す"""
+        try:
+            return UUID(id)
+        except ValueError:
+            return None
@@ -1,4 +1,4 @@
-from abc import abstractmethod
+from abc import ABC, abstractmethod
 
 from app.domain.repository.user import WriteUserRepository
 
@@ -18,3 +18,16 @@ class UserUnitOfWork(UnitOfWork):
     async def __aenter__(self) -> "UserUnitOfWork":
         """ユーザーリポジトリを取得します。"""
         raise NotImplementedError
+
+
+class UserUnitOfWorkFactory(ABC):
+    """ユーザー関連のUnitOfWorkを作成するファクトリー
+
+    UnitOfWorkはトランザクションと保留中の変更を保持するため、並行するリクエスト間で共有せず、
+    ユースケースの実行毎に作成します。
+    """
+
+    @abstractmethod
+    def create(self) -> UserUnitOfWork:
+        """新しいUnitOfWorkを作成します。"""
+        raise NotImplementedError
@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.domain.entity.user import User
+from app.domain.read_model.user import UserBatch
 
 # -- Command関連のデータクラスとインターフェース --
 
@@ -37,6 +39,59 @@ class CreateUserOutputData(BaseModel):
         )
 
 
+class UpdateUserInputData(BaseModel):
+    """ユーザー更新の入力データ
+
+    Noneの項目は変更しません。
+    """
+    model_config = ConfigDict(frozen=True)
+
+    id: UUID
+    name: str | None = None
+    email: str | None = None
+
+
+class UpdateUserOutputData(BaseModel):
+    """ユーザー更新の出力データ"""
+    model_config = ConfigDict(frozen=True)
+
+    id: UUID
+    name: str
+    email: str
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_entity(cls, user: User) -> "UpdateUserOutputData":
+        return cls(
+            id=user.id,
+            name=user.name.value,
+            email=user.email.value,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+class BulkCreateUserResultData(BaseModel):
+    """ユーザー一括作成の1行分の結果"""
+    model_config = ConfigDict(frozen=True)
+
+    # 入力ストリーム内の位置(0始まり)
+    index: int
+    # 作成に成功した場合のユーザー
+    user: CreateUserOutputData | None = None
+    # 作成に失敗した場合のエラー内容
+    error: str | None = None
+
+
+class BulkCreateUsersOutputData(BaseModel):
+    """ユーザー一括作成の出力データ"""
+    model_config = ConfigDict(frozen=True)
+
+    # 入力と同じ順序の行ごとの結果
+    results: list[BulkCreateUserResultData]
+
+
 class UserCommandInputPort(ABC):
     """ユーザー関連のコマンド操作入力ポート
 
@@ -45,16 +100,45 @@ class UserCommandInputPort(ABC):
     """
 
     @abstractmethod
-    async def create_user(self, input_data: CreateUserInputData) -> None:
+    async def create_user(self, input_data: CreateUserInputData, presenter: "UserCommandOutputPort") -> None:
         """ユーザーを新規作成する
 
         Args:
             input_data: ユーザー作成に必要な入力データ
+            presenter: リクエスト毎の出力ポート
 
         Raises:
             ValueError: ユーザー作成に失敗した場合
         """
 
+    @abstractmethod
+    async def update_user(self, input_data: UpdateUserInputData, presenter: "UserCommandOutputPort") -> None:
+        """ユーザーの指定された項目を更新する
+
+        Args:
+            input_data: ユーザー更新に必要な入力データ
+            presenter: リクエスト毎の出力ポート
+
+        Raises:
+            EntityNotFoundError: ユーザーが見つからない場合
+            ValueError: ユーザー更新に失敗した場合
+        """
+
+    @abstractmethod
+    async def bulk_create_users(
+        self,
+        inputs: AsyncIterator[CreateUserInputData],
+        presenter: "UserCommandOutputPort",
+    ) -> None:
+        """ユーザーを一括作成する
+
+        行ごとの失敗はエラーにはせず、出力データで報告する
+
+        Args:
+            inputs: ユーザー作成に必要な入力データのストリーム
+            presenter: リクエスト毎の出力ポート
+        """
+
 
 class UserCommandOutputPort(ABC):
     """ユーザー関連のコマンド操作出力ポート"""
@@ -67,6 +151,22 @@ class UserCommandOutputPort(ABC):
             output_data: 作成されたユーザーの出力データ
         """
 
+    @abstractmethod
+    def present_users_bulk_created(self, output_data: BulkCreateUsersOutputData) -> None:
+        """ユーザー一括作成結果を表示する
+
+        Args:
+            output_data: 行ごとの作成結果
+        """
+
+    @abstractmethod
+    def present_user_updated(self, output_data: UpdateUserOutputData) -> None:
+        """ユーザー更新結果を表示する
+
+        Args:
+            output_data: 更新されたユーザーの出力データ
+        """
+
 
 # -- Query関連のデータクラスとインターフェース --
 
@@ -99,6 +199,34 @@ class GetUserOutputData(BaseModel):
         )
 
 
+class BatchGetUsersInputData(BaseModel):
+    """ユーザー一括取得の入力データ"""
+    model_config = ConfigDict(frozen=True)
+
+    ids: list[str]
+
+
+class BatchGetUsersOutputData(BaseModel):
+    """ユーザー一括取得の出力データ"""
+    model_config = ConfigDict(frozen=True)
+
+    # 入力IDの順序を保った、見つかったユーザー
+    users: list[GetUserOutputData]
+    # 見つからなかった、または形式が不正なID
+    not_found_ids: list[str]
+
+
+class ListUsersInputData(BaseModel):
+    """ユーザー一覧取得の入力データ"""
+    model_config = ConfigDict(frozen=True)
+
+    # 1回のDB問い合わせで取得する件数
+    page_size: int = Field(default=100, ge=1, le=1000)
+    # 再開位置 このキー(created_at, id)より後のユーザーを取得する
+    after_created_at: datetime | None = None
+    after_id: UUID | None = None
+
+
 class UserQueryInputPort(ABC):
     """ユーザー関連のクエリ操作入力ポート
 
@@ -107,27 +235,51 @@ class UserQueryInputPort(ABC):
     """
 
     @abstractmethod
-    async def get_user_by_id(self, user_id: UUID) -> None:
+    async def get_user_by_id(self, user_id: UUID, presenter: "UserQueryOutputPort") -> None:
         """IDによりユーザーを取得する
 
         Args:
             user_id: ユーザーID
+            presenter: リクエスト毎の出力ポート
 
         Raises:
             EntityNotFoundError: ユーザーが見つからない場合
         """
 
     @abstractmethod
-    async def get_user_by_email(self, email: str) -> None:
+    async def get_user_by_email(self, email: str, presenter: "UserQueryOutputPort") -> None:
         """メールアドレスによりユーザーを取得する
 
         Args:
             email: メールアドレス
+            presenter: リクエスト毎の出力ポート
 
         Raises:
             EntityNotFoundError: ユーザーが見つからない場合
         """
 
+    @abstractmethod
+    def list_users(self, input_data: ListUsersInputData) -> AsyncIterator[UserBatch]:
+        """ユーザーを(created_at, id)の順にページ毎に逐次取得する
+
+        Args:
+            input_data: ユーザー一覧取得の入力データ
+
+        Returns:
+            AsyncIterator[UserBatch]: 取得したユーザーの1ページ 空のページは返しません
+        """
+
+    @abstractmethod
+    async def get_users_by_ids(self, input_data: BatchGetUsersInputData, presenter: "UserQueryOutputPort") -> None:
+        """複数のIDによりユーザーを一括取得する
+
+        見つからないIDがあってもエラーにはせず、出力データで報告する
+
+        Args:
+            input_data: ユーザー一括取得の入力データ
+            presenter: リクエスト毎の出力ポート
+        """
+
 
 class UserQueryOutputPort(ABC):
     """ユーザー関連のクエリ操作出力ポート"""
@@ -139,3 +291,19 @@ class UserQueryOutputPort(ABC):
         Args:
             output_data: 取得したユーザーの出力データ
         """
+
+    @abstractmethod
+    def present_users_listed(self, users: UserBatch) -> None:
+        """ユーザー一覧の1ページを表示する
+
+        Args:
+            users: (created_at, id)の昇順に並んだユーザー
+        """
+
+    @abstractmethod
+    def present_users_batch_get(self, output_data: BatchGetUsersOutputData) -> None:
+        """ユーザー一括取得結果を表示する
+
+        Args:
+            output_data: 一括取得したユーザーの出力データ
+        """
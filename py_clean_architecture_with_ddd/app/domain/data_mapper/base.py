@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Generic, TypeVar
 
 from tortoise import Model
@@ -45,3 +46,32 @@ class DataMapper(Generic[T, M], ABC):
             変換されたデータベースモデル(保存はまだされていない)
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def to_entities(self, models: Sequence[M]) -> list[T]:
+        """データベースモデルからドメインエンティティへの一括変換
+
+        DBへの問い合わせを行わない同期的な変換です。
+
+        Args:
+            models: 変換元のデータベースモデルのリスト
+
+        Returns:
+            変換されたドメインエンティティのリスト モデルと同じ順に並ぶ
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def to_models(self, entities: Sequence[T]) -> list[M]:
+        """ドメインエンティティからデータベースモデルへの一括変換
+
+        DBへの問い合わせを行わず、エンティティの値のみから保存用のモデルを作成します。
+        既存のレコードを確認する必要がある場合は、呼び出し元で一度のクエリにまとめて取得します。
+
+        Args:
+            entities: 変換元のドメインエンティティのリスト
+
+        Returns:
+            変換されたデータベースモデルのリスト(保存はまだされていない) エンティティと同じ順に並ぶ
+        """
+        raise NotImplementedError
@@ -0,0 +1,136 @@
+from array import array
+from collections.abc import Iterator, Sequence
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+# 日時はUNIXエポックからのマイクロ秒として保持する
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+# UUIDのバイト数
+_ID_SIZE = 16
+
+
+def _to_microseconds(value: datetime) -> int:
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_microseconds(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+class UserView:
+    """参照のみに使用するユーザーの軽量な表現
+
+    エンティティと異なり値オブジェクトを持たず、検証も行いません。
+    日時はUTCで表します。
+    """
+
+    __slots__ = ("created_at", "email", "id", "name", "updated_at")
+
+    def __init__(self, id: UUID, name: str, email: str, created_at: datetime, updated_at: datetime) -> None:
+        """コンストラクタ
+
+        Args:
+            id: ユーザーID
+            name: ユーザー名
+            email: メールアドレス
+            created_at: 作成日時
+            updated_at: 更新日時
+        """
+        self.id = id
+        self.name = name
+        self.email = email
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    def __repr__(self) -> str:
+        return f"UserView(id={self.id!r}, name={self.name!r}, email={self.email!r})"
+
+
+class UserBatch:
+    """ユーザーの一覧を列毎の配列で保持するクラス
+
+    一覧の取得やエクスポートなど多数のユーザーを参照のみに使用する場合に、
+    行毎にエンティティや値オブジェクトを作成せずに保持します。
+    IDは16バイトずつ連結したバイト列、日時はUNIXエポックからのマイクロ秒の配列、
+    名前とメールアドレスは文字列のリストとして保持し、`UserView`は参照時に作成します。
+    """
+
+    def __init__(self) -> None:
+        """コンストラクタ"""
+        self._ids = bytearray()
+        self._names: list[str] = []
+        self._emails: list[str] = []
+        self._created_at = array("q")
+        self._updated_at = array("q")
+
+    def append(self, id: UUID, name: str, email: str, created_at: datetime, updated_at: datetime) -> None:
+        """ユーザーを末尾に追加する
+
+        Args:
+            id: ユーザーID
+            name: ユーザー名
+            email: メールアドレス
+            created_at: 作成日時 タイムゾーン付き
+            updated_at: 更新日時 タイムゾーン付き
+        """
+        self._ids += id.bytes
+        self._names.append(name)
+        self._emails.append(email)
+        self._created_at.append(_to_microseconds(created_at))
+        self._updated_at.append(_to_microseconds(updated_at))
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __getitem__(self, index: int) -> UserView:
+        """指定した位置のユーザーを取得する
+
+        Args:
+            index: 位置 負の値の場合は末尾から数えます
+
+        Returns:
+            UserView: ユーザー
+
+        Raises:
+            IndexError: 位置が範囲外の場合
+        """
+        name = self._names[index]
+        if index < 0:
+            index += len(self)
+        start = index * _ID_SIZE
+        return UserView(
+            id=UUID(bytes=bytes(self._ids[start:start + _ID_SIZE])),
+            name=name,
+            email=self._emails[index],
+            created_at=_from_microseconds(self._created_at[index]),
+            updated_at=_from_microseconds(self._updated_at[index]),
+        )
+
+    def __iter__(self) -> Iterator[UserView]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def names(self) -> Sequence[str]:
+        """ユーザー名の列"""
+        return self._names
+
+    @property
+    def emails(self) -> Sequence[str]:
+        """メールアドレスの列"""
+        return self._emails
+
+    def iter_ids(self) -> Iterator[UUID]:
+        """ユーザーIDの列を順に取得する"""
+        ids = self._ids
+        for start in range(0, len(ids), _ID_SIZE):
+            yield UUID(bytes=bytes(ids[start:start + _ID_SIZE]))
+
+    def iter_created_at(self) -> Iterator[datetime]:
+        """作成日時の列をUTCで順に取得する"""
+        return map(_from_microseconds, self._created_at)
+
+    def iter_updated_at(self) -> Iterator[datetime]:
+        """更新日時の列をUTCで順に取得する"""
+        return map(_from_microseconds, self._updated_at)
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
 from uuid import UUID
 
 from app.domain.entity.user import User
+from app.domain.read_model.user import UserBatch
 from app.domain.repository.base import ReadRepository, WriteRepository
 
 
@@ -27,6 +30,19 @@ class ReadUserRepository(ReadRepository[User], ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def find_by_ids(self, ids: Sequence[UUID]) -> dict[UUID, User]:
+        """複数のIDによるユーザーの一括取得
+
+        Args:
+            ids: ユーザーIDのリスト
+
+        Returns:
+            dict[UUID, User]: 見つかったユーザーのIDとエンティティの対応
+                見つからなかったIDは含まれません
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def find_by_email(self, email: str) -> User:
         """メールアドレスによるユーザーの取得
@@ -42,6 +58,34 @@ class ReadUserRepository(ReadRepository[User], ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def find_page(self, limit: int, after: tuple[datetime, UUID] | None = None) -> list[User]:
+        """(created_at, id)の順でユーザーをキーセットページングにより取得
+
+        Args:
+            limit: 取得する最大件数
+            after: このキー(created_at, id)より後のユーザーを取得する Noneの場合は先頭から
+
+        Returns:
+            list[User]: (created_at, id)の昇順に並んだユーザーエンティティ
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_page_batch(self, limit: int, after: tuple[datetime, UUID] | None = None) -> UserBatch:
+        """(created_at, id)の順でユーザーをキーセットページングにより参照用の形式で取得
+
+        エンティティを作成しないため、参照のみを行う一覧の取得などで`find_page`の代わりに使用します。
+
+        Args:
+            limit: 取得する最大件数
+            after: このキー(created_at, id)より後のユーザーを取得する Noneの場合は先頭から
+
+        Returns:
+            UserBatch: (created_at, id)の昇順に並んだユーザー
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def exists_by_email(self, email: str) -> bool:
         """メールアドレスによるユーザーの存在確認
@@ -51,13 +95,42 @@ class ReadUserRepository(ReadRepository[User], ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def find_existing_emails(self, emails: Sequence[str]) -> set[str]:
+        """複数のメールアドレスのうち、既に登録されているものを取得
+
+        Args:
+            emails: メールアドレスのリスト
+
+        Returns:
+            set[str]: 既に登録されているメールアドレス
+        """
+        raise NotImplementedError
+
 class WriteUserRepository(WriteRepository[User], ABC):
     """書き込み可能なユーザーリポジトリインターフェース
 
     CQRSパターンにおけるCommand責務を担当します。
-    状態を変更する操作のみを提供し、読み取り操作は行いません。
+    状態を変更する操作のみを提供し、変更対象の取得を除いて読み取り操作は行いません。
     """
 
+    @abstractmethod
+    async def find_for_update(self, id: UUID) -> User:
+        """変更するためにIDによりユーザーを取得
+
+        取得したエンティティを変更して`save`した場合、変更された項目のみを保存します。
+
+        Args:
+            id: ユーザーID
+
+        Returns:
+            User: 取得したユーザーエンティティ
+
+        Raises:
+            EntityNotFoundError: ユーザーが見つからない場合
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def save(self, user: User) -> User:
         """ユーザーの保存
@@ -69,3 +142,15 @@ class WriteUserRepository(WriteRepository[User], ABC):
             User: 保存されたユーザーエンティティ
         """
         raise NotImplementedError
+
+    @abstractmethod
+    async def save_all(self, users: Sequence[User]) -> list[User]:
+        """新規ユーザーの一括保存
+
+        Args:
+            users: 保存する新規ユーザーエンティティのリスト
+
+        Returns:
+            list[User]: 保存されたユーザーエンティティ
+        """
+        raise NotImplementedError
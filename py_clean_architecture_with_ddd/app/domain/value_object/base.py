@@ -1,13 +1,56 @@
+import threading
+import weakref
 from abc import ABC
-from typing import Self
+from collections.abc import Hashable
+from typing import Any, Self
 
 from pydantic import BaseModel, ConfigDict
 
+# クラス毎の共有インスタンス 参照されなくなったインスタンスは自動的に削除される
+_pools: dict[type["ValueObject"], weakref.WeakValueDictionary[Hashable, Any]] = {}
+# スレッドプール型サーバーでは複数スレッドから呼ばれるため、登録を保護する
+_pools_lock = threading.Lock()
+
 
 class ValueObject(BaseModel, ABC):
     model_config = ConfigDict(frozen=True)
 
     def equals(self, other: Self) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, self.__class__):
             return False
         return self.model_dump() == other.model_dump()
+
+    @classmethod
+    def intern(cls, **data: Any) -> Self:  # noqa: ANN401
+        """等しい値のインスタンスを共有して取得します
+
+        値オブジェクトは不変のため、同じ値のインスタンスを使い回します。
+        検証は値毎に最初の1回のみ行われます。
+
+        Args:
+            **data: フィールドの値
+
+        Returns:
+            Self: 共有されたインスタンス ハッシュ化できない値の場合は共有せずに作成したインスタンス
+
+        Raises:
+            pydantic.ValidationError: 値が不正な場合(不正な値は共有されません)
+        """
+        pool = _pools.get(cls)
+        if pool is None:
+            with _pools_lock:
+                pool = _pools.setdefault(cls, weakref.WeakValueDictionary())
+        key = tuple(data.items())
+        try:
+            instance = pool.get(key)
+        except TypeError:
+            return cls(**data)
+        if instance is not None:
+            return instance
+        # 検証を通過したインスタンスのみを登録する
+        instance = cls(**data)
+        with _pools_lock:
+            # 他のスレッドが先に登録した場合はそちらを使用する
+            return pool.setdefault(key, instance)
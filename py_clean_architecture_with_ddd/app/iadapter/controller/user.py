@@ -1,55 +1,56 @@
 import logging
+from collections.abc import AsyncIterable, AsyncIterator, Callable
 from uuid import UUID
 
 from app.application.interactor.user.command import UserCommandInteractor
 from app.application.interactor.user.query import UserQueryInteractor
-from app.application.usecase.user import CreateUserInputData
+from app.application.usecase.user import (
+    BatchGetUsersInputData,
+    CreateUserInputData,
+    ListUsersInputData,
+    UpdateUserInputData,
+)
+from app.iadapter.cursor import decode_user_cursor
 from app.iadapter.exceptions import PresenterResponseIsNoneError
 from app.iadapter.presenter.user import UserPresenter
+from app.infrastructure.proto.v1.user.batch_get_pb2 import BatchGetUsersRequest, BatchGetUsersResponse
+from app.infrastructure.proto.v1.user.bulk_create_pb2 import BulkCreateUsersResponse
 from app.infrastructure.proto.v1.user.create_pb2 import CreateUserRequest, CreateUserResponse
 from app.infrastructure.proto.v1.user.get_pb2 import GetUserRequest, GetUserResponse
+from app.infrastructure.proto.v1.user.list_pb2 import ListUsersRequest, ListUsersResponse
+from app.infrastructure.proto.v1.user.update_pb2 import UpdateUserRequest, UpdateUserResponse
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_LIST_PAGE_SIZE = 100
+MAX_LIST_PAGE_SIZE = 1000
+
 
 class UserController:
     """ユーザー関連のコントローラー
 
     CQRSパターンに従い、コマンド操作とクエリ操作のインタラクターを
     それぞれ保持し、適切な操作に対応します。
-    プレゼンターを使用してビューへの変換を行います。
+    プレゼンターはリクエスト毎に生成してインタラクターへ渡すため、
+    コントローラー自体は状態を持たず、並行リクエスト間で共有できます。
     """
 
     def __init__(
         self,
         command_interactor: UserCommandInteractor,
         query_interactor: UserQueryInteractor,
-        presenter: UserPresenter,
+        presenter_factory: Callable[[], UserPresenter] = UserPresenter,
     ) -> None:
         """コンストラクタ
 
         Args:
             command_interactor: コマンド操作のインタラクター
             query_interactor: クエリ操作のインタラクター
-            presenter: プレゼンター
+            presenter_factory: リクエスト毎のプレゼンターを生成する関数
         """
         self._command_interactor = command_interactor
         self._query_interactor = query_interactor
-        self._presenter = presenter
-
-        # インタラクターのプレゼンターを設定
-        self._command_interactor.presenter = self._presenter
-        self._query_interactor.presenter = self._presenter
-
-    def set_presenter(self, presenter: UserPresenter) -> None:
-        """プレゼンターを設定する
-
-        Args:
-            presenter: 新しいプレゼンター
-        """
-        self._presenter = presenter
-        self._command_interactor.presenter = presenter
-        self._query_interactor.presenter = presenter
+        self._presenter_factory = presenter_factory
 
     async def create_user(self, request: CreateUserRequest) -> CreateUserResponse:
         """ユーザーを作成する
@@ -64,8 +65,8 @@ class UserController:
             PresenterResponseIsNoneError: プレゼンターがレスポンスを作成しなかった場合
             Exception: その他の例外
         """
-        # リクエスト前にプレゼンターの状態をリセット
-        self._presenter.reset_create_user_response()
+        # リクエスト専用のプレゼンターを作成
+        presenter = self._presenter_factory()
 
         # 入力データを作成
         input_data = CreateUserInputData(
@@ -75,14 +76,81 @@ class UserController:
 
         # コマンドインタラクターでユースケースを実行
         # インタラクターは内部でプレゼンターにデータを渡す
-        await self._command_interactor.create_user(input_data)
+        await self._command_interactor.create_user(input_data, presenter)
 
         # プレゼンターからレスポンスを取得して返す
-        if self._presenter.create_user_response is None:
+        if presenter.create_user_response is None:
             msg = "Presenter did not create a response"
             raise PresenterResponseIsNoneError(msg)
 
-        return self._presenter.create_user_response
+        return presenter.create_user_response
+
+    async def update_user(self, request: UpdateUserRequest) -> UpdateUserResponse:
+        """ユーザーの指定された項目を更新する
+
+        Args:
+            request (UpdateUserRequest): gRPCリクエスト 設定されていない項目は変更しない
+
+        Returns:
+            UpdateUserResponse: gRPCレスポンス
+
+        Raises:
+            PresenterResponseIsNoneError: プレゼンターがレスポンスを作成しなかった場合
+            Exception: その他の例外
+        """
+        # リクエスト専用のプレゼンターを作成
+        presenter = self._presenter_factory()
+
+        # 入力データを作成 optionalの項目は設定されている場合のみ渡す
+        input_data = UpdateUserInputData(
+            id=UUID(request.id),
+            name=request.name if request.HasField("name") else None,
+            email=request.email if request.HasField("email") else None,
+        )
+
+        # コマンドインタラクターでユースケースを実行
+        await self._command_interactor.update_user(input_data, presenter)
+
+        # プレゼンターからレスポンスを取得して返す
+        if presenter.update_user_response is None:
+            msg = "Presenter did not create a response"
+            raise PresenterResponseIsNoneError(msg)
+
+        return presenter.update_user_response
+
+    async def bulk_create_users(self, requests: AsyncIterable[CreateUserRequest]) -> BulkCreateUsersResponse:
+        """ユーザーを一括作成する
+
+        Args:
+            requests (AsyncIterable[CreateUserRequest]): gRPCリクエストのストリーム
+
+        Returns:
+            BulkCreateUsersResponse: gRPCレスポンス
+
+        Raises:
+            PresenterResponseIsNoneError: プレゼンターがレスポンスを作成しなかった場合
+            Exception: その他の例外
+        """
+        # リクエスト専用のプレゼンターを作成
+        presenter = self._presenter_factory()
+
+        # リクエストのストリームを入力データのストリームに変換
+        async def inputs() -> AsyncIterator[CreateUserInputData]:
+            async for request in requests:
+                yield CreateUserInputData(
+                    name=request.user.name,
+                    email=request.user.email,
+                )
+
+        # コマンドインタラクターでユースケースを実行
+        await self._command_interactor.bulk_create_users(inputs(), presenter)
+
+        # プレゼンターからレスポンスを取得して返す
+        if presenter.bulk_create_users_response is None:
+            msg = "Presenter did not create a response"
+            raise PresenterResponseIsNoneError(msg)
+
+        return presenter.bulk_create_users_response
 
     async def get_user_by_id(self, request: GetUserRequest) -> GetUserResponse:
         """IDによりユーザーを取得する
@@ -97,19 +165,81 @@ class UserController:
             PresenterResponseIsNoneError: プレゼンターがレスポンスを作成しなかった場合
             Exception: その他の例外
         """
-        # リクエスト前にプレゼンターの状態をリセット
-        self._presenter.reset_get_user_response()
+        # リクエスト専用のプレゼンターを作成
+        presenter = self._presenter_factory()
 
         # ユーザーIDを取得
         user_id = UUID(request.id)
 
         # クエリインタラクターでユースケースを実行
         # インタラクターは内部でプレゼンターにデータを渡す
-        await self._query_interactor.get_user_by_id(user_id)
+        await self._query_interactor.get_user_by_id(user_id, presenter)
+
+        # プレゼンターからレスポンスを取得して返す
+        if presenter.get_user_response is None:
+            msg = "Presenter did not create a response"
+            raise PresenterResponseIsNoneError(msg)
+
+        return presenter.get_user_response
+
+    async def batch_get_users(self, request: BatchGetUsersRequest) -> BatchGetUsersResponse:
+        """複数のIDによりユーザーを一括取得する
+
+        Args:
+            request (BatchGetUsersRequest): gRPCリクエスト
+
+        Returns:
+            BatchGetUsersResponse: gRPCレスポンス
+
+        Raises:
+            PresenterResponseIsNoneError: プレゼンターがレスポンスを作成しなかった場合
+            Exception: その他の例外
+        """
+        # リクエスト専用のプレゼンターを作成
+        presenter = self._presenter_factory()
+
+        # 入力データを作成
+        input_data = BatchGetUsersInputData(ids=list(request.ids))
+
+        # クエリインタラクターでユースケースを実行
+        await self._query_interactor.get_users_by_ids(input_data, presenter)
 
         # プレゼンターからレスポンスを取得して返す
-        if self._presenter.get_user_response is None:
+        if presenter.batch_get_users_response is None:
             msg = "Presenter did not create a response"
             raise PresenterResponseIsNoneError(msg)
 
-        return self._presenter.get_user_response
+        return presenter.batch_get_users_response
+
+    async def list_users(self, request: ListUsersRequest) -> AsyncIterator[ListUsersResponse]:
+        """ユーザーを(created_at, id)の順に逐次返す
+
+        Args:
+            request (ListUsersRequest): gRPCリクエスト
+
+        Yields:
+            ListUsersResponse: 1ユーザー分のgRPCレスポンス
+
+        Raises:
+            InvalidCursorError: カーソルの形式が不正な場合
+            PresenterResponseIsNoneError: プレゼンターがレスポンスを作成しなかった場合
+        """
+        # リクエスト専用のプレゼンターを作成
+        presenter = self._presenter_factory()
+
+        # 入力データを作成
+        after_created_at, after_id = decode_user_cursor(request.cursor) if request.cursor else (None, None)
+        input_data = ListUsersInputData(
+            page_size=min(request.page_size or DEFAULT_LIST_PAGE_SIZE, MAX_LIST_PAGE_SIZE),
+            after_created_at=after_created_at,
+            after_id=after_id,
+        )
+
+        # クエリインタラクターから1ページずつ受け取り、プレゼンターで変換して1件ずつ返す
+        async for users in self._query_interactor.list_users(input_data):
+            presenter.present_users_listed(users)
+            if presenter.list_users_responses is None:
+                msg = "Presenter did not create a response"
+                raise PresenterResponseIsNoneError(msg)
+            for response in presenter.list_users_responses:
+                yield response
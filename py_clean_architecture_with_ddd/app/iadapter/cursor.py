@@ -0,0 +1,42 @@
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from app.iadapter.exceptions import InvalidCursorError
+
+_SEPARATOR = "|"
+
+
+def encode_user_cursor(created_at: datetime, id: UUID) -> str:
+    """キーセットページングの位置(created_at, id)をクライアント向けのカーソル文字列に変換する
+
+    Args:
+        created_at: 最後に返したユーザーの作成日時
+        id: 最後に返したユーザーのID
+
+    Returns:
+        str: URLセーフなカーソル文字列
+    """
+    raw = f"{created_at.isoformat()}{_SEPARATOR}{id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_user_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """カーソル文字列をキーセットページングの位置(created_at, id)に変換する
+
+    Args:
+        cursor: encode_user_cursorで作成したカーソル文字列
+
+    Returns:
+        tuple[datetime, UUID]: 再開位置の(created_at, id)
+
+    Raises:
+        InvalidCursorError: カーソルの形式が不正な場合
+    """
+    try:
+        created_at, id = base64.urlsafe_b64decode(cursor.encode()).decode().split(_SEPARATOR)
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        msg = f"Invalid cursor: {cursor}"
+        raise InvalidCursorError(msg) from e
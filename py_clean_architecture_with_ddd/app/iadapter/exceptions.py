@@ -4,3 +4,7 @@ class InterfaceAdapterError(Exception):
 
 class PresenterResponseIsNoneError(InterfaceAdapterError):
     """プレゼンターのレスポンスがNoneの場合の例外"""
+
+
+class InvalidCursorError(InterfaceAdapterError):
+    """ページングのカーソルが不正な場合の例外"""
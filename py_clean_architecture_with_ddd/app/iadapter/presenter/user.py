@@ -1,12 +1,21 @@
 
 from app.application.presenter.user import UserPresenterInterface
 from app.application.usecase.user import (
+    BatchGetUsersOutputData,
+    BulkCreateUsersOutputData,
     CreateUserOutputData,
     GetUserOutputData,
+    UpdateUserOutputData,
 )
+from app.domain.read_model.user import UserBatch
+from app.iadapter.cursor import encode_user_cursor
+from app.infrastructure.proto.v1.user.batch_get_pb2 import BatchGetUsersResponse
+from app.infrastructure.proto.v1.user.bulk_create_pb2 import BulkCreateUserResult, BulkCreateUsersResponse
 from app.infrastructure.proto.v1.user.create_pb2 import CreateUserResponse
 from app.infrastructure.proto.v1.user.get_pb2 import GetUserResponse
+from app.infrastructure.proto.v1.user.list_pb2 import ListUsersResponse
 from app.infrastructure.proto.v1.user.model_pb2 import User as ProtoUser
+from app.infrastructure.proto.v1.user.update_pb2 import UpdateUserResponse
 
 
 class UserPresenter(UserPresenterInterface):
@@ -20,11 +29,19 @@ class UserPresenter(UserPresenterInterface):
         """プレゼンターの初期化"""
         self._create_user_response: CreateUserResponse | None = None
         self._get_user_response: GetUserResponse | None = None
+        self._batch_get_users_response: BatchGetUsersResponse | None = None
+        self._list_users_responses: list[ListUsersResponse] | None = None
+        self._bulk_create_users_response: BulkCreateUsersResponse | None = None
+        self._update_user_response: UpdateUserResponse | None = None
 
     def reset_responses(self) -> None:
         """レスポンスをリセットする"""
         self.reset_create_user_response()
         self.reset_get_user_response()
+        self.reset_batch_get_users_response()
+        self.reset_list_users_response()
+        self.reset_bulk_create_users_response()
+        self.reset_update_user_response()
 
     def reset_create_user_response(self) -> None:
         """ユーザー作成レスポンスをリセットする"""
@@ -34,6 +51,22 @@ class UserPresenter(UserPresenterInterface):
         """ユーザー取得レスポンスをリセットする"""
         self._get_user_response = None
 
+    def reset_batch_get_users_response(self) -> None:
+        """ユーザー一括取得レスポンスをリセットする"""
+        self._batch_get_users_response = None
+
+    def reset_list_users_response(self) -> None:
+        """ユーザー一覧レスポンスをリセットする"""
+        self._list_users_responses = None
+
+    def reset_bulk_create_users_response(self) -> None:
+        """ユーザー一括作成レスポンスをリセットする"""
+        self._bulk_create_users_response = None
+
+    def reset_update_user_response(self) -> None:
+        """ユーザー更新レスポンスをリセットする"""
+        self._update_user_response = None
+
     @property
     def create_user_response(self) -> CreateUserResponse | None:
         """ユーザー作成レスポンスを取得する
@@ -52,6 +85,42 @@ class UserPresenter(UserPresenterInterface):
         """
         return self._get_user_response
 
+    @property
+    def batch_get_users_response(self) -> BatchGetUsersResponse | None:
+        """ユーザー一括取得レスポンスを取得する
+
+        Returns:
+            Optional[BatchGetUsersResponse]: ユーザー一括取得レスポンス
+        """
+        return self._batch_get_users_response
+
+    @property
+    def list_users_responses(self) -> list[ListUsersResponse] | None:
+        """直近に表示したユーザー一覧の1ページ分のレスポンスを取得する
+
+        Returns:
+            Optional[list[ListUsersResponse]]: 1ユーザー毎のユーザー一覧レスポンス
+        """
+        return self._list_users_responses
+
+    @property
+    def bulk_create_users_response(self) -> BulkCreateUsersResponse | None:
+        """ユーザー一括作成レスポンスを取得する
+
+        Returns:
+            Optional[BulkCreateUsersResponse]: ユーザー一括作成レスポンス
+        """
+        return self._bulk_create_users_response
+
+    @property
+    def update_user_response(self) -> UpdateUserResponse | None:
+        """ユーザー更新レスポンスを取得する
+
+        Returns:
+            Optional[UpdateUserResponse]: ユーザー更新レスポンス
+        """
+        return self._update_user_response
+
     def present_user_created(self, output_data: CreateUserOutputData) -> None:
         """ユーザー作成結果を表示する
 
@@ -67,6 +136,43 @@ class UserPresenter(UserPresenterInterface):
             ),
         )
 
+    def present_user_updated(self, output_data: UpdateUserOutputData) -> None:
+        """ユーザー更新結果を表示する
+
+        Args:
+            output_data: 更新されたユーザーの出力データ
+        """
+        # アプリケーション層の出力データからgRPCレスポンスを構築
+        self._update_user_response = UpdateUserResponse(
+            user=ProtoUser(
+                id=str(output_data.id),
+                name=output_data.name,
+                email=output_data.email,
+            ),
+        )
+
+    def present_users_bulk_created(self, output_data: BulkCreateUsersOutputData) -> None:
+        """ユーザー一括作成結果を表示する
+
+        Args:
+            output_data: 行ごとの作成結果
+        """
+        # アプリケーション層の出力データからgRPCレスポンスを構築
+        self._bulk_create_users_response = BulkCreateUsersResponse(
+            results=[
+                BulkCreateUserResult(
+                    index=result.index,
+                    user=ProtoUser(
+                        id=str(result.user.id),
+                        name=result.user.name,
+                        email=result.user.email,
+                    ) if result.user else None,
+                    error=result.error or "",
+                )
+                for result in output_data.results
+            ],
+        )
+
     def present_user_get(self, output_data: GetUserOutputData) -> None:
         """ユーザー取得結果を表示する
 
@@ -81,3 +187,41 @@ class UserPresenter(UserPresenterInterface):
                 email=output_data.email,
             ),
         )
+
+    def present_users_batch_get(self, output_data: BatchGetUsersOutputData) -> None:
+        """ユーザー一括取得結果を表示する
+
+        Args:
+            output_data: 一括取得したユーザーの出力データ
+        """
+        # アプリケーション層の出力データからgRPCレスポンスを構築
+        self._batch_get_users_response = BatchGetUsersResponse(
+            users=[
+                ProtoUser(
+                    id=str(user.id),
+                    name=user.name,
+                    email=user.email,
+                )
+                for user in output_data.users
+            ],
+            not_found_ids=output_data.not_found_ids,
+        )
+
+    def present_users_listed(self, users: UserBatch) -> None:
+        """ユーザー一覧の1ページを表示する
+
+        エンティティを経由せず、列毎の配列から直接gRPCレスポンスを構築します。
+
+        Args:
+            users: (created_at, id)の昇順に並んだユーザー
+        """
+        # 1件ごとに再開用のカーソルを付与する
+        self._list_users_responses = [
+            ListUsersResponse(
+                user=ProtoUser(id=str(id), name=name, email=email),
+                cursor=encode_user_cursor(created_at, id),
+            )
+            for id, name, email, created_at in zip(
+                users.iter_ids(), users.names, users.emails, users.iter_created_at(), strict=True,
+            )
+        ]
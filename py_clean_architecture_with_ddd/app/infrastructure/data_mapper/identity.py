@@ -1,36 +1,54 @@
-from typing import Generic, TypeVar
-from uuid import UUID
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from app.domain.entity.base import Entity
 
+if TYPE_CHECKING:
+    from uuid import UUID
+
 T = TypeVar("T", bound=Entity)
 
 
-class TortoiseIdentityMap(Generic[T]):
-    """エンティティのIdentityMapを管理するクラス"""
+class ChangeTracker(Generic[T]):
+    """読み込んだ時点のエンティティの値を保持し、変更された列を検出するクラス
+
+    エンティティを複製せず、列の値のタプルのみをスナップショットとして保持します。
+    """
+
+    def __init__(self, columns: tuple[str, ...], snapshot: Callable[[T], tuple[Hashable, ...]]) -> None:
+        """コンストラクタ
+
+        Args:
+            columns: 追跡する列名
+            snapshot: エンティティから`columns`の順に並んだ値を取り出す関数
+        """
+        self._columns = columns
+        self._snapshot = snapshot
+        self._snapshots: dict[UUID, tuple[Hashable, ...]] = {}
 
-    def __init__(self) -> None:
-        self._entities: dict[UUID, T] = {}
-        self._originals: dict[UUID, T] = {}
+    def track(self, entity: T) -> None:
+        """読み込んだエンティティの現在の値を記録する"""
+        self._snapshots[entity.id] = self._snapshot(entity)
 
-    def add(self, entity: T) -> None:
-        """エンティティをIdentityMapに追加する"""
-        self._entities[entity.id] = entity
-        self._originals[entity.id] = entity.model_copy(deep=True)
+    def changed_columns(self, entity: T) -> tuple[str, ...] | None:
+        """記録した時点から値が変わった列を取得する
 
-    def get(self, entity_id: UUID) -> T | None:
-        """エンティティIDからエンティティを取得する"""
-        return self._entities.get(entity_id)
+        Args:
+            entity: 確認するエンティティ
 
-    def has_changes(self, entity: T) -> bool:
-        """エンティティに変更があるかを確認する"""
-        original = self._originals.get(entity.id)
+        Returns:
+            tuple[str, ...] | None: 変更された列名 記録していないエンティティの場合はNone
+        """
+        original = self._snapshots.get(entity.id)
         if original is None:
-            # オリジナルがない場合は新規エンティティとみなす
-            return True
-        return original != entity
+            return None
+        current = self._snapshot(entity)
+        return tuple(
+            column
+            for column, before, after in zip(self._columns, original, current, strict=True)
+            if before != after
+        )
 
     def clear(self) -> None:
-        """全てのエンティティをクリアする"""
-        self._entities.clear()
-        self._originals.clear()
+        """全ての記録をクリアする"""
+        self._snapshots.clear()
@@ -1,11 +1,53 @@
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
+from tortoise.fields import Field
+from tortoise.timezone import localtime
+
 from app.domain.data_mapper.base import DataMapper
 from app.domain.entity.user import User
+from app.domain.read_model.user import UserBatch
 from app.domain.value_object.user.email import Email
 from app.domain.value_object.user.name import UserName
 from app.infrastructure.database.model.user import UserModel
 
+# `from_row`が受け取る行の列 この順で取得する
+ROW_COLUMNS = ("id", "name", "email", "created_at", "updated_at")
+# 変更を追跡する列 `to_snapshot`はこの順で値を返す
+SNAPSHOT_COLUMNS = ("name", "email", "updated_at")
+# 日時の列の変換に使用するフィールド
+_CREATED_AT = UserModel._meta.fields_map["created_at"]  # noqa: SLF001
+_UPDATED_AT = UserModel._meta.fields_map["updated_at"]  # noqa: SLF001
+
+
+def _parse_aware(value: str) -> datetime | None:
+    """タイムゾーン付きの日時の文字列を解釈します それ以外の文字列の場合はNoneを返します
+
+    SQLiteは日時を文字列で返します。ciso8601がない環境ではTortoiseのパーサーが低速なため、
+    タイムゾーン付きの文字列は標準ライブラリで解釈し、それ以外はフィールドに任せます。
+    """
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else None
+
+
+def _to_datetime(field: Field, value: Any) -> datetime:  # noqa: ANN401
+    """DBから取得した日時の値を、モデルと同じタイムゾーンのdatetimeに変換します"""
+    if isinstance(value, str) and (parsed := _parse_aware(value)) is not None:
+        return localtime(parsed)
+    return field.to_python_value(value)
+
+
+def _to_aware_datetime(field: Field, value: Any) -> datetime:  # noqa: ANN401
+    """DBから取得した日時の値を、タイムゾーンを変換せずにタイムゾーン付きのdatetimeに変換します"""
+    if isinstance(value, str) and (parsed := _parse_aware(value)) is not None:
+        return parsed
+    return field.to_python_value(value)
+
 
 class UserDataMapper(DataMapper[User, UserModel]):
     """ユーザーエンティティとデータベースモデル間の変換を担当するデータマッパー
@@ -23,14 +65,129 @@ class UserDataMapper(DataMapper[User, UserModel]):
         Returns:
             変換されたドメインエンティティ
         """
+        return self._model_to_entity(model)
+
+    def to_entities(self, models: Sequence[UserModel]) -> list[User]:
+        """データベースモデルからドメインエンティティへの一括変換
+
+        Args:
+            models: 変換元のデータベースモデルのリスト
+
+        Returns:
+            変換されたドメインエンティティのリスト
+        """
+        return [self._model_to_entity(model) for model in models]
+
+    def to_models(self, entities: Sequence[User]) -> list[UserModel]:
+        """ドメインエンティティからデータベースモデルへの一括変換
+
+        DBへの問い合わせを行わないため、新規作成と`ON CONFLICT`による更新のどちらにも使用できます。
+
+        Args:
+            entities: 変換元のドメインエンティティのリスト
+
+        Returns:
+            変換されたデータベースモデルのリスト(保存はまだされていない)
+        """
+        return [
+            UserModel(
+                id=entity.id,
+                name=entity.name.value,
+                email=entity.email.value,
+                created_at=entity.created_at,
+                updated_at=entity.updated_at,
+            )
+            for entity in entities
+        ]
+
+    @staticmethod
+    def _model_to_entity(model: UserModel) -> User:
         return User(
             id=UUID(str(model.id)),
-            name=UserName(value=model.name),
-            email=Email(value=model.email),
             created_at=model.created_at,
             updated_at=model.updated_at,
+            name=UserName.intern(value=model.name),
+            email=Email.intern(value=model.email),
         )
 
+    def from_rows(self, rows: Sequence[Sequence[Any]], *, intern: bool = True) -> list[User]:
+        """`ROW_COLUMNS`の順に並んだ行からドメインエンティティへの一括変換
+
+        Args:
+            rows: 変換元の行のリスト
+            intern: 値オブジェクトを同じ値のインスタンスと共有する場合はTrue
+
+        Returns:
+            変換されたドメインエンティティのリスト
+        """
+        return [self.from_row(row, intern=intern) for row in rows]
+
+    def from_row(self, row: Sequence[Any], *, intern: bool = True) -> User:
+        """`ROW_COLUMNS`の順に並んだ行からドメインエンティティへの変換
+
+        モデルのインスタンスを経由しないため、参照の多い問い合わせで使用します。
+        日時の列は、DBから文字列で返される場合もモデルと同じ値となるように変換します。
+        共有されるインスタンスの登録には作成より時間がかかるため、保持されず値の重複も少ない
+        一覧の取得などでは`intern`をFalseとします。
+
+        Args:
+            row: 変換元の行
+            intern: 値オブジェクトを同じ値のインスタンスと共有する場合はTrue
+
+        Returns:
+            変換されたドメインエンティティ
+        """
+        id, name, email, created_at, updated_at = row
+        if intern:
+            user_name = UserName.intern(value=name)
+            user_email = Email.intern(value=email)
+        else:
+            user_name = UserName(value=name)
+            user_email = Email(value=email)
+        return User(
+            id=UUID(str(id)),
+            created_at=_to_datetime(_CREATED_AT, created_at),
+            updated_at=_to_datetime(_UPDATED_AT, updated_at),
+            name=user_name,
+            email=user_email,
+        )
+
+    def to_batch(self, rows: Sequence[Sequence[Any]]) -> UserBatch:
+        """`ROW_COLUMNS`の順に並んだ行から参照用の`UserBatch`への変換
+
+        エンティティや値オブジェクトを作成せず、列毎の配列に格納します。
+        日時は`UserBatch`がUTCで保持するため、タイムゾーンを変換せずに格納します。
+
+        Args:
+            rows: 変換元の行のリスト
+
+        Returns:
+            UserBatch: 変換されたユーザー
+        """
+        batch = UserBatch()
+        append = batch.append
+        for id, name, email, created_at, updated_at in rows:
+            append(
+                UUID(str(id)),
+                name,
+                email,
+                _to_aware_datetime(_CREATED_AT, created_at),
+                _to_aware_datetime(_UPDATED_AT, updated_at),
+            )
+        return batch
+
+    @staticmethod
+    def to_snapshot(entity: User) -> tuple[str, str, datetime]:
+        """変更の検出に使用する`SNAPSHOT_COLUMNS`の順に並んだ値を取得します
+
+        Args:
+            entity: 対象のドメインエンティティ
+
+        Returns:
+            tuple[str, str, datetime]: 列の値
+        """
+        return (entity.name.value, entity.email.value, entity.updated_at)
+
     async def to_model(self, entity: User) -> UserModel:
         """ドメインエンティティからデータベースモデルへの変換
 
@@ -1,11 +1,44 @@
-tortoise_config = {
-    "connections": {
-        "default": "sqlite://data/db.sqlite3",
-    },
-    "apps": {
-        "models": {
-            "models": ["app.infrastructure.database.model", "aerich.models"],
-            "default_connection": "default",
+from typing import Any
+
+from .config import Config
+from .config import get as get_config
+from .postgres import postgres_connection
+from .router import READ_CONNECTION, WRITE_CONNECTION
+from .sqlite import sqlite_connection
+
+
+def build_tortoise_config(config: Config) -> dict[str, Any]:
+    """データベースの設定からTortoiseの設定を作成します
+
+    Args:
+        config: データベースの設定
+
+    Returns:
+        dict[str, Any]: Tortoiseの設定
+    """
+    if config.engine == "postgres":
+        connections = {
+            WRITE_CONNECTION: postgres_connection(config),
+            READ_CONNECTION: postgres_connection(config, read_only=True),
+        }
+    else:
+        connections = {
+            WRITE_CONNECTION: sqlite_connection(config.sqlite_file),
+            # WALモードのため、書き込みトランザクション中もコミット済みのデータを読み取れる
+            READ_CONNECTION: sqlite_connection(config.sqlite_file, read_only=True),
+        }
+
+    return {
+        "connections": connections,
+        "apps": {
+            "models": {
+                "models": ["app.infrastructure.database.model", "aerich.models"],
+                "default_connection": WRITE_CONNECTION,
+            },
         },
-    },
-}
+        "routers": ["app.infrastructure.database.router.ReadWriteRouter"],
+    }
+
+
+# 環境変数から作成した設定 aerichからも参照する
+tortoise_config = build_tortoise_config(get_config())
@@ -0,0 +1,39 @@
+from functools import lru_cache
+from typing import Literal
+
+from pydantic import SecretStr
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Config(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="database_")
+
+    # sqlite: ローカルのファイル / postgres: asyncpgによるPostgreSQL
+    engine: Literal["sqlite", "postgres"] = "sqlite"
+    sqlite_file: str = "data/db.sqlite3"
+
+    host: str = "localhost"
+    port: int = 5432
+    user: str = "postgres"
+    password: SecretStr = SecretStr("")
+    name: str = "app"
+    # 参照系の問い合わせに使用するレプリカ 未設定の場合は主接続と同じサーバーに読み取り専用で接続する
+    read_host: str | None = None
+    read_port: int | None = None
+
+    # コネクションプールの接続数 読み取り用と書き込み用のプール毎に適用する
+    pool_min_size: int = 1
+    pool_max_size: int = 10
+    # 接続毎にキャッシュするプリペアドステートメント数 pgbouncerのtransactionモードを経由する場合は0にする
+    statement_cache_size: int = 100
+    # 使われていない接続を閉じるまでの時間 単位は秒
+    max_inactive_connection_lifetime: float = 300.0
+    # 接続毎に設定するパラメーター
+    application_name: str = "py-clean-architecture-with-ddd"
+    statement_timeout_ms: int = 30_000
+    # その他の接続毎に設定するパラメーター JSONで指定する 例: {"work_mem": "16MB"}
+    server_settings: dict[str, str] = {}
+
+@lru_cache
+def get() -> Config:
+    return Config()
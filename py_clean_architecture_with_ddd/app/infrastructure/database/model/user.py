@@ -11,6 +11,8 @@ class UserModel(Model):
 
     class Meta:
         table = "users"
+        # ListUsersのキーセットページング用
+        indexes = (("created_at", "id"),)
 
     def __str__(self) -> str:
         return f"{self.name} <{self.email}>"
@@ -0,0 +1,41 @@
+from typing import Any
+
+from .config import Config
+
+
+def postgres_connection(config: Config, *, read_only: bool = False) -> dict[str, Any]:
+    """設定からasyncpgを使用するTortoiseの接続設定を作成します
+
+    Args:
+        config: データベースの設定
+        read_only: 読み取り専用の接続とする場合はTrue レプリカが設定されていればレプリカに接続します
+
+    Returns:
+        dict[str, Any]: Tortoiseの接続設定
+    """
+    server_settings = {
+        "statement_timeout": str(config.statement_timeout_ms),
+        **config.server_settings,
+    }
+    host, port = config.host, config.port
+    if read_only:
+        host = config.read_host or host
+        port = config.read_port or port
+        server_settings["default_transaction_read_only"] = "on"
+
+    return {
+        "engine": "tortoise.backends.asyncpg",
+        "credentials": {
+            "host": host,
+            "port": port,
+            "user": config.user,
+            "password": config.password.get_secret_value(),
+            "database": config.name,
+            "minsize": config.pool_min_size,
+            "maxsize": config.pool_max_size,
+            "statement_cache_size": config.statement_cache_size,
+            "max_inactive_connection_lifetime": config.max_inactive_connection_lifetime,
+            "application_name": config.application_name,
+            "server_settings": server_settings,
+        },
+    }
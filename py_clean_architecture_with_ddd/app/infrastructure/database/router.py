@@ -0,0 +1,23 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tortoise.models import Model
+
+# UnitOfWorkのトランザクションと更新系の問い合わせに使用する主接続
+WRITE_CONNECTION = "default"
+# 参照系の問い合わせに使用する読み取り専用の接続
+READ_CONNECTION = "read"
+
+
+class ReadWriteRouter:
+    """参照系の問い合わせを読み取り専用の接続へ、更新系の問い合わせを主接続へ振り分けるルーター
+
+    長い読み取りが書き込みトランザクションの終了を待たないよう、接続を分離します。
+    トランザクション内の更新系の問い合わせは、主接続のトランザクションで実行されます。
+    """
+
+    def db_for_read(self, _model: type["Model"]) -> str:
+        return READ_CONNECTION
+
+    def db_for_write(self, _model: type["Model"]) -> str:
+        return WRITE_CONNECTION
@@ -0,0 +1,74 @@
+import asyncio
+import logging
+from typing import Any
+
+from tortoise import connections
+
+logger = logging.getLogger(__name__)
+
+# 接続を開く度に適用するPRAGMA
+SQLITE_PRAGMAS: dict[str, Any] = {
+    # 読み取りと書き込みが互いを待たないようにする
+    "journal_mode": "WAL",
+    # WALモードではNORMALでも破損しない 電源断時に直近のコミットが失われる可能性のみ許容する
+    "synchronous": "NORMAL",
+    # 256MiBまでメモリマップドI/Oで読み取り、read()のシステムコールとコピーを省く
+    "mmap_size": 256 * 1024 * 1024,
+    # ページキャッシュ 負の値はKiB単位で64MiB
+    "cache_size": -64 * 1024,
+    # 他の接続がロックを保持している場合に即座にエラーとせず待機する 単位はミリ秒
+    "busy_timeout": 5000,
+    "temp_store": "MEMORY",
+    "foreign_keys": "ON",
+    # チェックポイント後のWALファイルを切り詰めるサイズ
+    "journal_size_limit": 64 * 1024 * 1024,
+}
+
+# 定期メンテナンスの間隔 単位は秒
+DEFAULT_MAINTENANCE_INTERVAL = 300.0
+
+
+def sqlite_connection(file_path: str, *, read_only: bool = False) -> dict[str, Any]:
+    """SQLiteのプロファイルを適用したTortoiseの接続設定を作成します
+
+    Args:
+        file_path: データベースファイルのパス
+        read_only: 読み取り専用の接続とする場合はTrue
+
+    Returns:
+        dict[str, Any]: Tortoiseの接続設定
+    """
+    credentials: dict[str, Any] = {"file_path": file_path, **SQLITE_PRAGMAS}
+    if read_only:
+        credentials["query_only"] = "ON"
+    return {"engine": "tortoise.backends.sqlite", "credentials": credentials}
+
+
+async def run_maintenance(connection_name: str) -> None:
+    """WALのチェックポイントと統計情報の更新を行います
+
+    チェックポイントは待機しないPASSIVEで行い、長い読み取りにより自動チェックポイントが
+    進まなかった分のWALをデータベースファイルへ反映します。
+
+    Args:
+        connection_name: 書き込み可能な接続名
+    """
+    connection = connections.get(connection_name)
+    await connection.execute_script("PRAGMA wal_checkpoint(PASSIVE); PRAGMA optimize;")
+
+
+async def maintain_periodically(connection_name: str, interval: float = DEFAULT_MAINTENANCE_INTERVAL) -> None:
+    """一定間隔で`run_maintenance`を実行し続けます
+
+    キャンセルされるまで終了しません。失敗した場合もログを出力して継続します。
+
+    Args:
+        connection_name: 書き込み可能な接続名
+        interval: 実行間隔 単位は秒
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_maintenance(connection_name)
+        except Exception:
+            logger.exception("SQLite maintenance failed")
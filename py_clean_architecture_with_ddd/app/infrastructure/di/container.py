@@ -6,29 +6,39 @@ from app.application.identity_map.user import UserIdentityMap
 from app.application.interactor.user.command import UserCommandInteractor
 from app.application.interactor.user.query import Repositories, UserQueryInteractor
 from app.application.presenter.user import UserPresenterInterface
-from app.application.unit_of_work.user import UserUnitOfWork
+from app.application.unit_of_work.user import UserUnitOfWorkFactory
 from app.application.usecase.user import (
     UserCommandOutputPort,
     UserQueryOutputPort,
 )
 from app.domain.repository.user import ReadUserRepository, WriteUserRepository
 from app.iadapter.presenter.user import UserPresenter
-from app.infrastructure.repository.user import ReadUserRepositoryImpl, WriteUserRepositoryImpl
-from app.infrastructure.unit_of_work.user import UserUnitOfWorkImpl
+from app.infrastructure.repository.user import PendingChanges, ReadUserRepositoryImpl, WriteUserRepositoryImpl
+from app.infrastructure.server import config as server_config
+from app.infrastructure.unit_of_work.group_commit import GroupCommitWriter
+from app.infrastructure.unit_of_work.user import UserUnitOfWorkFactoryImpl
 
 
 class DIContainer(Module):
     def configure(self, binder: Binder) -> None:
         # Repositories
-        binder.bind(ReadUserRepositoryImpl, to=ReadUserRepositoryImpl, scope=singleton)
-        binder.bind(WriteUserRepositoryImpl, to=WriteUserRepositoryImpl, scope=singleton)
-        binder.bind(WriteUserRepository, to=WriteUserRepositoryImpl, scope=singleton)
-        binder.bind(ReadUserRepository, to=ReadUserRepositoryImpl, scope=singleton)
+        # 読み取り・書き込みのリポジトリとインタラクターで同一のIdentityMapを共有する
+        binder.bind(ReadUserRepositoryImpl, to=self.configure_read_user_repository_impl, scope=singleton)
+        # 実装はキャッシュとリスナーを共有する元のリポジトリとし、保留中の変更は持たせない
+        binder.bind(WriteUserRepositoryImpl, to=self.configure_write_user_repository_impl, scope=singleton)
+        # インターフェースからは取得の度に保留中の変更を個別に持つリポジトリを作成し、リクエスト間で共有しない
+        binder.bind(WriteUserRepository, to=self.configure_write_user_repository)
+        binder.bind(ReadUserRepository, to=self.configure_read_user_repository, scope=singleton)
 
-        # UnitOfWork
+        # UnitOfWork ユースケースの実行毎にファクトリーから作成する
         binder.bind(
-            UserUnitOfWork,
-            to=self.configure_unit_of_work,
+            UserUnitOfWorkFactoryImpl,
+            to=self.configure_unit_of_work_factory_impl,
+            scope=singleton,
+        )
+        binder.bind(
+            UserUnitOfWorkFactory,
+            to=self.configure_unit_of_work_factory,
             scope=singleton,
         )
 
@@ -66,11 +76,60 @@ class DIContainer(Module):
         )
 
     @inject
-    def configure_unit_of_work(
+    def configure_read_user_repository_impl(
+        self,
+        identity_map: UserIdentityMap,
+    ) -> ReadUserRepositoryImpl:
+        return ReadUserRepositoryImpl(identity_map=identity_map)
+
+    @inject
+    def configure_write_user_repository_impl(
+        self,
+        read_repository: ReadUserRepositoryImpl,
+    ) -> WriteUserRepositoryImpl:
+        return WriteUserRepositoryImpl(read_repository=read_repository)
+
+    @inject
+    def configure_read_user_repository(
+        self,
+        repository: ReadUserRepositoryImpl,
+    ) -> ReadUserRepository:
+        return repository
+
+    @inject
+    def configure_write_user_repository(
+        self,
+        repository: WriteUserRepositoryImpl,
+    ) -> WriteUserRepository:
+        return repository.for_unit_of_work()
+
+    @inject
+    def configure_unit_of_work_factory_impl(
         self,
         users: WriteUserRepositoryImpl,
-    ) -> UserUnitOfWork:
-        return UserUnitOfWorkImpl(users=users)
+    ) -> UserUnitOfWorkFactoryImpl:
+        return UserUnitOfWorkFactoryImpl(users=users, group_commit=self.create_group_commit_writer(users))
+
+    @inject
+    def configure_unit_of_work_factory(
+        self,
+        factory: UserUnitOfWorkFactoryImpl,
+    ) -> UserUnitOfWorkFactory:
+        return factory
+
+    def create_group_commit_writer(
+        self,
+        users: WriteUserRepositoryImpl,
+    ) -> GroupCommitWriter[PendingChanges] | None:
+        config = server_config.get()
+        if config.group_commit_max_delay <= 0:
+            return None
+        return GroupCommitWriter(
+            write=users.write,
+            committed=users.publish_written,
+            max_delay=config.group_commit_max_delay,
+            max_batch_size=config.group_commit_max_batch_size,
+        )
 
     @inject
     def configure_repositories(
@@ -82,14 +141,12 @@ class DIContainer(Module):
     @inject
     def configure_user_command_interactor(
         self,
-        presenter: UserCommandOutputPort,
-        uow: UserUnitOfWork,
+        uow_factory: UserUnitOfWorkFactory,
         identity_map: UserIdentityMap,
         read_user_repository: ReadUserRepository,
     ) -> UserCommandInteractor:
         return UserCommandInteractor(
-            presenter=presenter,
-            uow=uow,
+            uow_factory=uow_factory,
             identity_map=identity_map,
             read_user_repository=read_user_repository,
         )
@@ -98,11 +155,9 @@ class DIContainer(Module):
     def configure_user_query_interactor(
         self,
         repositories: Repositories,
-        presenter: UserQueryOutputPort,
         identity_map: UserIdentityMap,
     ) -> UserQueryInteractor:
         return UserQueryInteractor(
             repositories=repositories,
-            presenter=presenter,
             identity_map=identity_map,
         )
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: app/infrastructure/proto/v1/user/batch_get.proto
+# Protobuf Python Version: 6.30.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    30,
+    2,
+    '',
+    'app/infrastructure/proto/v1/user/batch_get.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from app.infrastructure.proto.v1.user import model_pb2 as app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_model__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n0app/infrastructure/proto/v1/user/batch_get.proto\x12\x1cinfrastructure.proto.user.v1\x1a,app/infrastructure/proto/v1/user/model.proto\"(\n\x14\x42\x61tchGetUsersRequest\x12\x10\n\x03ids\x18\x01 \x03(\tR\x03ids\"u\n\x15\x42\x61tchGetUsersResponse\x12\x38\n\x05users\x18\x01 \x03(\x0b\x32\".infrastructure.proto.user.v1.UserR\x05users\x12\"\n\rnot_found_ids\x18\x02 \x03(\tR\x0bnotFoundIdsB\xc4\x01\n com.infrastructure.proto.user.v1B\rBatchGetProtoP\x01\xa2\x02\x03IPU\xaa\x02\x1cInfrastructure.Proto.User.V1\xca\x02\x1cInfrastructure\\Proto\\User\\V1\xe2\x02(Infrastructure\\Proto\\User\\V1\\GPBMetadata\xea\x02\x1fInfrastructure::Proto::User::V1b\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'app.infrastructure.proto.v1.user.batch_get_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n com.infrastructure.proto.user.v1B\rBatchGetProtoP\001\242\002\003IPU\252\002\034Infrastructure.Proto.User.V1\312\002\034Infrastructure\\Proto\\User\\V1\342\002(Infrastructure\\Proto\\User\\V1\\GPBMetadata\352\002\037Infrastructure::Proto::User::V1'
+  _globals['_BATCHGETUSERSREQUEST']._serialized_start=128
+  _globals['_BATCHGETUSERSREQUEST']._serialized_end=168
+  _globals['_BATCHGETUSERSRESPONSE']._serialized_start=170
+  _globals['_BATCHGETUSERSRESPONSE']._serialized_end=287
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,24 @@
+from app.infrastructure.proto.v1.user import model_pb2 as _model_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class BulkCreateUserResult(_message.Message):
+    __slots__ = ("index", "user", "error")
+    INDEX_FIELD_NUMBER: _ClassVar[int]
+    USER_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    index: int
+    user: _model_pb2.User
+    error: str
+    def __init__(self, index: _Optional[int] = ..., user: _Optional[_Union[_model_pb2.User, _Mapping]] = ..., error: _Optional[str] = ...) -> None: ...
+
+class BulkCreateUsersResponse(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[BulkCreateUserResult]
+    def __init__(self, results: _Optional[_Iterable[_Union[BulkCreateUserResult, _Mapping]]] = ...) -> None: ...
@@ -22,11 +22,15 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from app.infrastructure.proto.v1.user import batch_get_pb2 as app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_batch__get__pb2
+from app.infrastructure.proto.v1.user import bulk_create_pb2 as app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_bulk__create__pb2
 from app.infrastructure.proto.v1.user import create_pb2 as app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_create__pb2
 from app.infrastructure.proto.v1.user import get_pb2 as app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_get__pb2
+from app.infrastructure.proto.v1.user import list_pb2 as app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_list__pb2
+from app.infrastructure.proto.v1.user import update_pb2 as app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_update__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n.app/infrastructure/proto/v1/user/service.proto\x12\x1cinfrastructure.proto.user.v1\x1a-app/infrastructure/proto/v1/user/create.proto\x1a*app/infrastructure/proto/v1/user/get.proto2\xea\x01\n\x0bUserService\x12q\n\nCreateUser\x12/.infrastructure.proto.user.v1.CreateUserRequest\x1a\x30.infrastructure.proto.user.v1.CreateUserResponse\"\x00\x12h\n\x07GetUser\x12,.infrastructure.proto.user.v1.GetUserRequest\x1a-.infrastructure.proto.user.v1.GetUserResponse\"\x00\x42\xc3\x01\n com.infrastructure.proto.user.v1B\x0cServiceProtoP\x01\xa2\x02\x03IPU\xaa\x02\x1cInfrastructure.Proto.User.V1\xca\x02\x1cInfrastructure\\Proto\\User\\V1\xe2\x02(Infrastructure\\Proto\\User\\V1\\GPBMetadata\xea\x02\x1fInfrastructure::Proto::User::V1b\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n.app/infrastructure/proto/v1/user/service.proto\x12\x1cinfrastructure.proto.user.v1\x1a\x30\x61pp/infrastructure/proto/v1/user/batch_get.proto\x1a\x32\x61pp/infrastructure/proto/v1/user/bulk_create.proto\x1a-app/infrastructure/proto/v1/user/create.proto\x1a*app/infrastructure/proto/v1/user/get.proto\x1a+app/infrastructure/proto/v1/user/list.proto\x1a-app/infrastructure/proto/v1/user/update.proto2\xca\x05\n\x0bUserService\x12q\n\nCreateUser\x12/.infrastructure.proto.user.v1.CreateUserRequest\x1a\x30.infrastructure.proto.user.v1.CreateUserResponse\"\x00\x12h\n\x07GetUser\x12,.infrastructure.proto.user.v1.GetUserRequest\x1a-.infrastructure.proto.user.v1.GetUserResponse\"\x00\x12z\n\rBatchGetUsers\x12\x32.infrastructure.proto.user.v1.BatchGetUsersRequest\x1a\x33.infrastructure.proto.user.v1.BatchGetUsersResponse\"\x00\x12p\n\tListUsers\x12..infrastructure.proto.user.v1.ListUsersRequest\x1a/.infrastructure.proto.user.v1.ListUsersResponse\"\x00\x30\x01\x12}\n\x0f\x42ulkCreateUsers\x12/.infrastructure.proto.user.v1.CreateUserRequest\x1a\x35.infrastructure.proto.user.v1.BulkCreateUsersResponse\"\x00(\x01\x12q\n\nUpdateUser\x12/.infrastructure.proto.user.v1.UpdateUserRequest\x1a\x30.infrastructure.proto.user.v1.UpdateUserResponse\"\x00\x42\xc3\x01\n com.infrastructure.proto.user.v1B\x0cServiceProtoP\x01\xa2\x02\x03IPU\xaa\x02\x1cInfrastructure.Proto.User.V1\xca\x02\x1cInfrastructure\\Proto\\User\\V1\xe2\x02(Infrastructure\\Proto\\User\\V1\\GPBMetadata\xea\x02\x1fInfrastructure::Proto::User::V1b\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -34,6 +38,6 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'app.infrastructure.proto.v1
 if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._loaded_options = None
   _globals['DESCRIPTOR']._serialized_options = b'\n com.infrastructure.proto.user.v1B\014ServiceProtoP\001\242\002\003IPU\252\002\034Infrastructure.Proto.User.V1\312\002\034Infrastructure\\Proto\\User\\V1\342\002(Infrastructure\\Proto\\User\\V1\\GPBMetadata\352\002\037Infrastructure::Proto::User::V1'
-  _globals['_USERSERVICE']._serialized_start=172
-  _globals['_USERSERVICE']._serialized_end=406
+  _globals['_USERSERVICE']._serialized_start=366
+  _globals['_USERSERVICE']._serialized_end=1080
 # @@protoc_insertion_point(module_scope)
@@ -1,5 +1,9 @@
+from app.infrastructure.proto.v1.user import batch_get_pb2 as _batch_get_pb2
+from app.infrastructure.proto.v1.user import bulk_create_pb2 as _bulk_create_pb2
 from app.infrastructure.proto.v1.user import create_pb2 as _create_pb2
 from app.infrastructure.proto.v1.user import get_pb2 as _get_pb2
+from app.infrastructure.proto.v1.user import list_pb2 as _list_pb2
+from app.infrastructure.proto.v1.user import update_pb2 as _update_pb2
 from google.protobuf import descriptor as _descriptor
 from typing import ClassVar as _ClassVar
 
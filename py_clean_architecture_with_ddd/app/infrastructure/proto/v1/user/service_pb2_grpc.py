@@ -2,8 +2,12 @@
 """Client and server classes corresponding to protobuf-defined services."""
 import grpc
 
+from app.infrastructure.proto.v1.user import batch_get_pb2 as app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_batch__get__pb2
+from app.infrastructure.proto.v1.user import bulk_create_pb2 as app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_bulk__create__pb2
 from app.infrastructure.proto.v1.user import create_pb2 as app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_create__pb2
 from app.infrastructure.proto.v1.user import get_pb2 as app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_get__pb2
+from app.infrastructure.proto.v1.user import list_pb2 as app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_list__pb2
+from app.infrastructure.proto.v1.user import update_pb2 as app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_update__pb2
 
 
 class UserServiceStub(object):
@@ -25,6 +29,26 @@ class UserServiceStub(object):
                 request_serializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_get__pb2.GetUserRequest.SerializeToString,
                 response_deserializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_get__pb2.GetUserResponse.FromString,
                 _registered_method=True)
+        self.BatchGetUsers = channel.unary_unary(
+                '/infrastructure.proto.user.v1.UserService/BatchGetUsers',
+                request_serializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_batch__get__pb2.BatchGetUsersRequest.SerializeToString,
+                response_deserializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_batch__get__pb2.BatchGetUsersResponse.FromString,
+                _registered_method=True)
+        self.ListUsers = channel.unary_stream(
+                '/infrastructure.proto.user.v1.UserService/ListUsers',
+                request_serializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_list__pb2.ListUsersRequest.SerializeToString,
+                response_deserializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_list__pb2.ListUsersResponse.FromString,
+                _registered_method=True)
+        self.BulkCreateUsers = channel.stream_unary(
+                '/infrastructure.proto.user.v1.UserService/BulkCreateUsers',
+                request_serializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_create__pb2.CreateUserRequest.SerializeToString,
+                response_deserializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_bulk__create__pb2.BulkCreateUsersResponse.FromString,
+                _registered_method=True)
+        self.UpdateUser = channel.unary_unary(
+                '/infrastructure.proto.user.v1.UserService/UpdateUser',
+                request_serializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_update__pb2.UpdateUserRequest.SerializeToString,
+                response_deserializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_update__pb2.UpdateUserResponse.FromString,
+                _registered_method=True)
 
 
 class UserServiceServicer(object):
@@ -42,6 +66,30 @@ class UserServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchGetUsers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListUsers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BulkCreateUsers(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateUser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_UserServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -55,6 +103,26 @@ def add_UserServiceServicer_to_server(servicer, server):
                     request_deserializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_get__pb2.GetUserRequest.FromString,
                     response_serializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_get__pb2.GetUserResponse.SerializeToString,
             ),
+            'BatchGetUsers': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchGetUsers,
+                    request_deserializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_batch__get__pb2.BatchGetUsersRequest.FromString,
+                    response_serializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_batch__get__pb2.BatchGetUsersResponse.SerializeToString,
+            ),
+            'ListUsers': grpc.unary_stream_rpc_method_handler(
+                    servicer.ListUsers,
+                    request_deserializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_list__pb2.ListUsersRequest.FromString,
+                    response_serializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_list__pb2.ListUsersResponse.SerializeToString,
+            ),
+            'BulkCreateUsers': grpc.stream_unary_rpc_method_handler(
+                    servicer.BulkCreateUsers,
+                    request_deserializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_create__pb2.CreateUserRequest.FromString,
+                    response_serializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_bulk__create__pb2.BulkCreateUsersResponse.SerializeToString,
+            ),
+            'UpdateUser': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateUser,
+                    request_deserializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_update__pb2.UpdateUserRequest.FromString,
+                    response_serializer=app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_update__pb2.UpdateUserResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'infrastructure.proto.user.v1.UserService', rpc_method_handlers)
@@ -119,3 +187,111 @@ class UserService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def BatchGetUsers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/infrastructure.proto.user.v1.UserService/BatchGetUsers',
+            app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_batch__get__pb2.BatchGetUsersRequest.SerializeToString,
+            app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_batch__get__pb2.BatchGetUsersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListUsers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/infrastructure.proto.user.v1.UserService/ListUsers',
+            app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_list__pb2.ListUsersRequest.SerializeToString,
+            app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_list__pb2.ListUsersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BulkCreateUsers(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/infrastructure.proto.user.v1.UserService/BulkCreateUsers',
+            app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_create__pb2.CreateUserRequest.SerializeToString,
+            app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_bulk__create__pb2.BulkCreateUsersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdateUser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/infrastructure.proto.user.v1.UserService/UpdateUser',
+            app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_update__pb2.UpdateUserRequest.SerializeToString,
+            app_dot_infrastructure_dot_proto_dot_v1_dot_user_dot_update__pb2.UpdateUserResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
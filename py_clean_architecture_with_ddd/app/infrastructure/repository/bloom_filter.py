@@ -0,0 +1,83 @@
+import hashlib
+import math
+import threading
+
+# 偽陽性率の既定値
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+
+
+class BloomFilter:
+    """文字列の集合を少ないメモリで表現する確率的データ構造
+
+    `might_contain`がFalseを返した値は集合に含まれないことが確定します。
+    Trueを返した値は、想定件数以内であれば指定した偽陽性率の範囲で集合に含まれない可能性があります。
+    要素の削除はできないため、削除が必要な場合は作り直します。
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE) -> None:
+        """コンストラクタ
+
+        Args:
+            capacity: 想定する要素数 超えると偽陽性率が上がります
+            false_positive_rate: 想定する要素数を登録した時点での偽陽性率 0より大きく1未満
+
+        Raises:
+            ValueError: 引数が範囲外の場合
+        """
+        if capacity <= 0:
+            msg = f"capacity must be positive: {capacity}"
+            raise ValueError(msg)
+        if not 0 < false_positive_rate < 1:
+            msg = f"false_positive_rate must be between 0 and 1: {false_positive_rate}"
+            raise ValueError(msg)
+
+        self._capacity = capacity
+        # 要素数と偽陽性率から最適なビット数とハッシュ関数の数を求める
+        self._size = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self._hash_count = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self._count = 0
+        # スレッドプール型サーバーでは複数スレッドから登録されるため保護する
+        # バイト単位の読み込みと書き戻しが重なると、同じバイトの他方のビットが失われ偽陰性になる
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        """想定する要素数"""
+        return self._capacity
+
+    @property
+    def count(self) -> int:
+        """登録した要素数 同じ値を複数回登録した場合も数えます"""
+        return self._count
+
+    def _positions(self, value: str) -> list[int]:
+        # 128ビットのハッシュを2つに分け、ダブルハッシュ法でk個の位置を求める
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._size for i in range(self._hash_count)]
+
+    def add(self, value: str) -> None:
+        """値を登録する
+
+        Args:
+            value: 登録する値
+        """
+        positions = self._positions(value)
+        with self._lock:
+            for position in positions:
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self._count += 1
+
+    def might_contain(self, value: str) -> bool:
+        """値が登録されている可能性があるかどうか
+
+        Args:
+            value: 確認する値
+
+        Returns:
+            bool: 登録されている可能性がある場合はTrue 確実に登録されていない場合はFalse
+        """
+        # ビットは立てるのみで戻さないため、登録中の値以外は排他せずに判定できる
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
@@ -0,0 +1,108 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+
+# 保持する最大キー数の既定値
+DEFAULT_MAX_ENTRIES = 10_000
+# 存在しないことを記録しておく秒数の既定値
+DEFAULT_TTL = 5.0
+
+
+class NegativeCache:
+    """存在しなかったキーを短時間記録し、同じキーに対するDB問い合わせを省略する
+
+    存在しないIDを繰り返し問い合わせるリクエストがDBまで届かないようにします。
+    キーが作成された場合は`discard`で直ちに削除します。
+    削除の度に世代を進めてキー毎に記録し、問い合わせ中に作成されたキーを記録し直すことを防ぎます。
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL) -> None:
+        """コンストラクタ
+
+        Args:
+            max_entries: 保持する最大キー数 超えた場合は最も古いものから削除します
+            ttl: 存在しないことを記録しておく秒数
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._expires: OrderedDict[Hashable, float] = OrderedDict()
+        self._generation = 0
+        # キー毎の最後に削除した世代 古い記録から最大キー数まで保持する
+        self._discarded_at: OrderedDict[Hashable, int] = OrderedDict()
+        # 記録から削除したキーが削除された可能性のある最新の世代
+        self._forgotten_generation = 0
+        self._hits = 0
+        # スレッドプール型サーバーでは複数スレッドから呼ばれるため保護する
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """削除が行われる度に進む世代
+
+        問い合わせ開始時の世代を`add`に渡すことで、問い合わせ中に作成されたキーを記録し直すことを防ぎます。
+        削除はキー毎に記録するため、無関係なキーの削除では記録を取りやめません。
+        """
+        return self._generation
+
+    @property
+    def hits(self) -> int:
+        """記録により問い合わせを省略した回数の累計"""
+        return self._hits
+
+    def contains(self, key: Hashable) -> bool:
+        """キーが存在しないと記録されているかどうか
+
+        Args:
+            key: 確認するキー
+
+        Returns:
+            bool: 有効期間内の記録がある場合はTrue
+        """
+        with self._lock:
+            expires_at = self._expires.get(key)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._expires[key]
+                return False
+            self._hits += 1
+            return True
+
+    def add(self, key: Hashable, generation: int) -> None:
+        """キーが存在しないことを記録する
+
+        Args:
+            key: 存在しなかったキー
+            generation: 問い合わせ開始時の世代 問い合わせ中に同じキーが削除されていれば記録しません
+        """
+        with self._lock:
+            if not self._is_fresh(key, generation):
+                return
+            self._expires[key] = time.monotonic() + self._ttl
+            self._expires.move_to_end(key)
+            while len(self._expires) > self._max_entries:
+                self._expires.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """キーが作成されたため記録を削除する
+
+        Args:
+            key: 作成されたキー
+        """
+        with self._lock:
+            self._generation += 1
+            self._discarded_at[key] = self._generation
+            self._discarded_at.move_to_end(key)
+            while len(self._discarded_at) > self._max_entries:
+                _, self._forgotten_generation = self._discarded_at.popitem(last=False)
+            self._expires.pop(key, None)
+
+    def _is_fresh(self, key: Hashable, generation: int) -> bool:
+        """問い合わせ開始後にキーが削除されていないかどうか
+
+        記録から削除したキーは判定できないため、削除以前に開始した問い合わせは削除されたものとして扱います。
+        """
+        if generation < self._forgotten_generation:
+            return False
+        return self._discarded_at.get(key, 0) <= generation
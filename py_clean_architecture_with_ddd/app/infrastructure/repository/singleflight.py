@@ -0,0 +1,79 @@
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class SingleFlight:
+    """同一キーに対する並行した問い合わせを1回の実行にまとめる
+
+    実行中の問い合わせと同じキーで呼び出された場合は新たに実行せず、
+    実行中の問い合わせの結果(例外を含む)を共有します。
+    問い合わせは呼び出し元から切り離したタスクで実行するため、呼び出し元の一部が
+    キャンセルされても、残りの呼び出し元は結果を受け取れます。
+    タスクはイベントループを跨いで待機できないため、実行中の問い合わせはイベントループ毎に管理します。
+    """
+
+    def __init__(self) -> None:
+        """コンストラクタ"""
+        self._in_flight: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task[Any]] = {}
+        self._calls = 0
+        self._coalesced = 0
+        # スレッドプール型サーバーでは複数スレッドから呼ばれるため保護する
+        self._lock = threading.Lock()
+
+    @property
+    def calls(self) -> int:
+        """呼び出し回数の累計"""
+        return self._calls
+
+    @property
+    def coalesced(self) -> int:
+        """実行中の問い合わせにまとめられ、実行を省略した呼び出し回数の累計"""
+        return self._coalesced
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:  # noqa: ANN401
+        """キー毎に1回だけ問い合わせを実行し、その結果を返す
+
+        Args:
+            key: 問い合わせを識別するキー
+            fn: 問い合わせを実行する関数
+
+        Returns:
+            Any: 問い合わせの結果
+
+        Raises:
+            Exception: 問い合わせで発生した例外
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        with self._lock:
+            self._calls += 1
+            task = self._in_flight.get(flight_key)
+            if task is not None:
+                self._coalesced += 1
+            else:
+                # 問い合わせは呼び出し元から切り離したタスクで実行し、最初の呼び出し元が
+                # キャンセルされても待機中の呼び出し元には結果を返す
+                task = loop.create_task(self._run(flight_key, fn))
+                task.add_done_callback(_retrieve_exception)
+                self._in_flight[flight_key] = task
+        # 呼び出し元がキャンセルされても実行中の問い合わせには影響させない
+        return await asyncio.shield(task)
+
+    async def _run(
+        self,
+        flight_key: tuple[asyncio.AbstractEventLoop, Hashable],
+        fn: Callable[[], Awaitable[Any]],
+    ) -> Any:  # noqa: ANN401
+        try:
+            return await fn()
+        finally:
+            with self._lock:
+                self._in_flight.pop(flight_key, None)
+
+
+def _retrieve_exception(task: asyncio.Task[Any]) -> None:
+    """待機する呼び出し元がいない場合に、未取得の例外として警告されないようにする"""
+    if not task.cancelled():
+        task.exception()
@@ -1,19 +1,129 @@
+import logging
+from collections.abc import Callable, Iterable, Sequence
+from datetime import datetime
+from typing import Any, NamedTuple
 from uuid import UUID
 
+from tortoise.expressions import Q
+
 from app.application.identity_map.user import UserIdentityMap
 from app.domain.entity.user import User
+from app.domain.read_model.user import UserBatch
 from app.domain.repository.user import ReadUserRepository, WriteUserRepository
-from app.infrastructure.data_mapper.user import UserDataMapper
+from app.infrastructure.data_mapper.identity import ChangeTracker
+from app.infrastructure.data_mapper.user import ROW_COLUMNS, SNAPSHOT_COLUMNS, UserDataMapper
 from app.infrastructure.database.model.user import UserModel
 from app.infrastructure.exceptions import EntityNotFoundError
 
+from .bloom_filter import DEFAULT_FALSE_POSITIVE_RATE, BloomFilter
+from .negative_cache import NegativeCache
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# 1文のINSERTにまとめる最大行数 SQLiteのバインド変数の上限を超えないようにする
+COMMIT_BATCH_SIZE = 500
+# `id IN (...)`の1文で問い合わせる最大ID数 SQLiteのバインド変数の上限を超えないようにする
+FIND_BY_IDS_CHUNK_SIZE = 500
+
+# メールアドレスのBloomフィルターを構築する際に1回で読み込む行数
+EMAIL_FILTER_SCAN_BATCH_SIZE = 10_000
+# 構築後の登録を見込み、構築時の件数に対してこの倍率の要素数を想定する
+EMAIL_FILTER_GROWTH_FACTOR = 2
+EMAIL_FILTER_MIN_CAPACITY = 10_000
+
+# 主キーやメールアドレスによる参照で使用するSELECT文 問い合わせ毎にクエリビルダーを経由しない
+_SELECT_USERS = f"SELECT {', '.join(ROW_COLUMNS)} FROM {UserModel.Meta.table}"  # noqa: S608
+
+# コミット済みのエンティティを受け取るリスナー
+CommitListener = Callable[[Sequence[User]], None]
+
+
+def id_key(id: UUID) -> tuple[str, UUID]:
+    """IDによる検索を識別するキー"""
+    return ("id", id)
+
+
+def email_key(email: str) -> tuple[str, str]:
+    """メールアドレスによる検索を識別するキー"""
+    return ("email", email)
+
+
+async def _select_rows(column: str, values: Sequence[str], *, for_write: bool = False) -> list[Any]:
+    """列の値が一致するユーザーの行を、モデルを経由せずに取得します
+
+    Args:
+        column: 検索する列 呼び出し元で固定した列名のみを渡す
+        values: 検索する値
+        for_write: 参照系の接続ではなく書き込み用の接続から取得する場合はTrue
+
+    Returns:
+        list[Any]: `ROW_COLUMNS`の順に並んだ行
+    """
+    db = UserModel._choose_db(for_write=for_write)  # noqa: SLF001
+    if db.capabilities.dialect == "postgres":
+        placeholders = ", ".join(f"${i}" for i in range(1, len(values) + 1))
+    else:
+        placeholders = ", ".join("?" * len(values))
+    _, rows = await db.execute_query(f"{_SELECT_USERS} WHERE {column} IN ({placeholders})", list(values))
+    return list(rows)
+
+
+async def _select_page(limit: int, after: tuple[datetime, UUID] | None) -> list[Any]:
+    """(created_at, id)の順にユーザーの行を、モデルを経由せずにキーセットページングにより取得します
+
+    Args:
+        limit: 取得する最大件数
+        after: このキー(created_at, id)より後の行を取得する Noneの場合は先頭から
+
+    Returns:
+        list[Any]: `ROW_COLUMNS`の順に並んだ行
+    """
+    query = UserModel.all()
+    if after is not None:
+        created_at, id = after
+        query = UserModel.filter(
+            Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=str(id)),
+        )
+    return await query.order_by("created_at", "id").limit(limit).values_list(*ROW_COLUMNS)
+
+
+class PendingChanges(NamedTuple):
+    """UnitOfWorkのコミットで書き込む変更"""
+
+    # 新規作成するエンティティ
+    creates: list[User]
+    # 既存レコードの有無を問わず、作成または全ての列を更新するエンティティ
+    upserts: list[User]
+    # 読み込んだ時点から値が変わった列のみを更新するエンティティと、その列名
+    updates: list[tuple[User, tuple[str, ...]]]
+
+    @property
+    def entities(self) -> list[User]:
+        """書き込むエンティティ"""
+        return [*self.creates, *self.upserts, *(user for user, _ in self.updates)]
+
 
 class ReadUserRepositoryImpl(ReadUserRepository):
     """Tortoise-ORMを使用した読み取り専用UserRepositoryの実装"""
 
-    def __init__(self) -> None:
-        self._identity_map = UserIdentityMap()
+    def __init__(self, identity_map: UserIdentityMap | None = None) -> None:
+        """コンストラクタ
+
+        Args:
+            identity_map: リクエストを跨いで共有するIdentityMap 省略した場合は専用のものを作成します
+        """
+        self._identity_map = identity_map if identity_map is not None else UserIdentityMap()
         self._data_mapper = UserDataMapper()
+        # 同一キーに対する並行したDB問い合わせをまとめる
+        self._singleflight = SingleFlight()
+        # 見つからなかったIDとメールアドレスを短時間記録する
+        self._negative_cache = NegativeCache()
+        # 登録済みのメールアドレスのBloomフィルター 構築されるまではDBに問い合わせる
+        self._email_filter: BloomFilter | None = None
+        # 再構築中のフィルター 構築中に登録されたメールアドレスも反映する
+        self._building_email_filter: BloomFilter | None = None
+        self._email_filter_negatives = 0
 
     @property
     def identity_map(self) -> UserIdentityMap:
@@ -33,6 +143,92 @@ class ReadUserRepositoryImpl(ReadUserRepository):
         """
         return self._data_mapper
 
+    @property
+    def singleflight(self) -> SingleFlight:
+        """SingleFlightへのアクセサ
+
+        Returns:
+            SingleFlight: まとめられた問い合わせの件数を保持するSingleFlight
+        """
+        return self._singleflight
+
+    @property
+    def negative_cache(self) -> NegativeCache:
+        """見つからなかったキーのキャッシュへのアクセサ
+
+        Returns:
+            NegativeCache: 見つからなかったIDとメールアドレスのキャッシュ
+        """
+        return self._negative_cache
+
+    @property
+    def email_filter_negatives(self) -> int:
+        """Bloomフィルターにより未登録と判定し、DBへの問い合わせを省略した回数の累計"""
+        return self._email_filter_negatives
+
+    async def rebuild_email_filter(
+        self,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+    ) -> None:
+        """登録済みの全メールアドレスからBloomフィルターを構築し直します
+
+        メールアドレスの順にキーセットで分割して読み込むため、全件をメモリに展開しません。
+        構築中も既存のフィルターを使用し、構築が完了した時点で差し替えます。
+
+        Args:
+            false_positive_rate: 構築時の件数に対する想定要素数での偽陽性率
+        """
+        count = await UserModel.all().count()
+        email_filter = BloomFilter(
+            capacity=max(EMAIL_FILTER_MIN_CAPACITY, count * EMAIL_FILTER_GROWTH_FACTOR),
+            false_positive_rate=false_positive_rate,
+        )
+        # 構築中に保存されたメールアドレスは読み込み済みの範囲にあっても反映する
+        self._building_email_filter = email_filter
+        try:
+            last_email: str | None = None
+            while True:
+                query = UserModel.all() if last_email is None else UserModel.filter(email__gt=last_email)
+                rows = await query.order_by("email").limit(EMAIL_FILTER_SCAN_BATCH_SIZE).values_list("email")
+                for (email,) in rows:
+                    email_filter.add(email)
+                    last_email = email
+                if len(rows) < EMAIL_FILTER_SCAN_BATCH_SIZE:
+                    break
+        finally:
+            self._building_email_filter = None
+
+        self._email_filter = email_filter
+        logger.info(
+            "Email bloom filter rebuilt: %d emails, capacity %d",
+            email_filter.count, email_filter.capacity,
+        )
+
+    def add_emails_to_filter(self, emails: Iterable[str]) -> None:
+        """保存するメールアドレスをBloomフィルターに登録します
+
+        ロールバックされた場合も登録されたままになりますが、偽陽性としてDBで確認されるため問題ありません。
+
+        Args:
+            emails: 保存するメールアドレス
+        """
+        filters = [f for f in (self._email_filter, self._building_email_filter) if f is not None]
+        if not filters:
+            return
+        for email in emails:
+            for email_filter in filters:
+                email_filter.add(email)
+
+    def _might_exist_email(self, email: str) -> bool:
+        """メールアドレスが登録されている可能性があるかどうか
+
+        フィルターが構築されていない場合は常にTrueを返します。
+        """
+        if self._email_filter is None or self._email_filter.might_contain(email):
+            return True
+        self._email_filter_negatives += 1
+        return False
+
     async def find_by_id(self, id: UUID) -> User:
         """IDによるユーザーの取得
 
@@ -50,17 +246,74 @@ class ReadUserRepositoryImpl(ReadUserRepository):
         if entity:
             return entity
 
-        # DBから検索
-        model = await UserModel.get_or_none(id=id)
-        if model is None:
+        # 直前に見つからなかったIDはDBに問い合わせない
+        key = id_key(id)
+        if self._negative_cache.contains(key):
             msg = f"User with id {id} not found"
             raise EntityNotFoundError(msg)
 
-        # エンティティに変換してIdentityMapに登録
-        entity = await self._data_mapper.to_entity(model)
-        self._identity_map.add(entity)
+        # DBから検索 同じIDの並行した検索は1回の問い合わせにまとめる
+        return await self._singleflight.do(key, lambda: self._load_by_id(id))
+
+    async def _load_by_id(self, id: UUID) -> User:
+        generation = self._identity_map.generation
+        negative_generation = self._negative_cache.generation
+        rows = await _select_rows("id", [str(id)])
+        if not rows:
+            self._negative_cache.add(id_key(id), negative_generation)
+            msg = f"User with id {id} not found"
+            raise EntityNotFoundError(msg)
+
+        # エンティティに変換してIdentityMapに登録 取得中に変更が確定していた場合は登録しない
+        entity = self._data_mapper.from_row(rows[0])
+        self._identity_map.add(entity, generation)
         return entity
 
+    async def find_by_ids(self, ids: Sequence[UUID]) -> dict[UUID, User]:
+        """複数のIDによるユーザーの一括取得
+
+        IdentityMapに存在しないユーザーのみを`id IN (...)`のクエリでまとめて取得します。
+
+        Args:
+            ids: ユーザーIDのリスト
+
+        Returns:
+            dict[UUID, User]: 見つかったユーザーのIDとエンティティの対応
+        """
+        # IdentityMapから検索
+        entities: dict[UUID, User] = {}
+        missing_ids: list[UUID] = []
+        for id in ids:
+            entity = self._identity_map.get(id)
+            if entity:
+                entities[id] = entity
+            elif not self._negative_cache.contains(id_key(id)):
+                missing_ids.append(id)
+
+        if not missing_ids:
+            return entities
+
+        # DBから一括検索
+        generation = self._identity_map.generation
+        negative_generation = self._negative_cache.generation
+        rows: list[Any] = []
+        for start in range(0, len(missing_ids), FIND_BY_IDS_CHUNK_SIZE):
+            chunk = missing_ids[start:start + FIND_BY_IDS_CHUNK_SIZE]
+            rows.extend(await _select_rows("id", [str(id) for id in chunk]))
+
+        # エンティティに変換してIdentityMapに登録 取得中に変更が確定していた場合は登録しない
+        # まとめて取得した値は重複が少ないため、値オブジェクトは共有しない
+        for entity in self._data_mapper.from_rows(rows, intern=False):
+            self._identity_map.add(entity, generation)
+            entities[entity.id] = entity
+
+        # 見つからなかったIDを記録
+        for id in missing_ids:
+            if id not in entities:
+                self._negative_cache.add(id_key(id), negative_generation)
+
+        return entities
+
     async def find_by_email(self, email: str) -> User:
         """メールアドレスによるユーザーの取得
 
@@ -78,18 +331,61 @@ class ReadUserRepositoryImpl(ReadUserRepository):
         if entity:
             return entity
 
-        # DBから検索
-        model = await UserModel.get_or_none(email=email)
-        if model is None:
+        # 直前に見つからなかったメールアドレスはDBに問い合わせない
+        key = email_key(email)
+        if self._negative_cache.contains(key):
             msg = f"User with email {email} not found"
             raise EntityNotFoundError(msg)
 
-        # エンティティに変換してIdentityMapに登録
-        entity = await self._data_mapper.to_entity(model)
-        self._identity_map.add(entity)
+        # DBから検索 同じメールアドレスの並行した検索は1回の問い合わせにまとめる
+        return await self._singleflight.do(key, lambda: self._load_by_email(email))
+
+    async def _load_by_email(self, email: str) -> User:
+        generation = self._identity_map.generation
+        negative_generation = self._negative_cache.generation
+        rows = await _select_rows("email", [email])
+        if not rows:
+            self._negative_cache.add(email_key(email), negative_generation)
+            msg = f"User with email {email} not found"
+            raise EntityNotFoundError(msg)
+
+        # エンティティに変換してIdentityMapに登録 取得中に変更が確定していた場合は登録しない
+        entity = self._data_mapper.from_row(rows[0])
+        self._identity_map.add(entity, generation)
 
         return entity
 
+    async def find_page(self, limit: int, after: tuple[datetime, UUID] | None = None) -> list[User]:
+        """(created_at, id)の順でユーザーをキーセットページングにより取得
+
+        OFFSETを使わないため、テーブルの件数に関わらず1ページの取得コストは一定です。
+        一覧取得は件数が多くなるため、取得したエンティティはIdentityMapに登録せず、値オブジェクトも共有しません。
+
+        Args:
+            limit: 取得する最大件数
+            after: このキー(created_at, id)より後のユーザーを取得する Noneの場合は先頭から
+
+        Returns:
+            list[User]: (created_at, id)の昇順に並んだユーザーエンティティ
+        """
+        rows = await _select_page(limit, after)
+        return self._data_mapper.from_rows(rows, intern=False)
+
+    async def find_page_batch(self, limit: int, after: tuple[datetime, UUID] | None = None) -> UserBatch:
+        """(created_at, id)の順でユーザーをキーセットページングにより参照用の形式で取得
+
+        `find_page`と同じ問い合わせで取得し、エンティティを作成せずに列毎の配列に格納します。
+
+        Args:
+            limit: 取得する最大件数
+            after: このキー(created_at, id)より後のユーザーを取得する Noneの場合は先頭から
+
+        Returns:
+            UserBatch: (created_at, id)の昇順に並んだユーザー
+        """
+        rows = await _select_page(limit, after)
+        return self._data_mapper.to_batch(rows)
+
     async def exists_by_email(self, email: str) -> bool:
         """メールアドレスによるユーザーの存在確認
 
@@ -101,23 +397,109 @@ class ReadUserRepositoryImpl(ReadUserRepository):
         if entity:
             return True
 
+        # Bloomフィルターで未登録と確定した場合はDBに問い合わせない
+        # 最終的な重複はDBの一意制約で防ぐ
+        if not self._might_exist_email(email):
+            return False
+
         return await UserModel.exists(email=email)
 
+    async def find_existing_emails(self, emails: Sequence[str]) -> set[str]:
+        """複数のメールアドレスのうち、既に登録されているものを取得
+
+        Bloomフィルターで登録されている可能性があるもののみを`email IN (...)`の一度のクエリで確認します。
+
+        Args:
+            emails: メールアドレスのリスト
+
+        Returns:
+            set[str]: 既に登録されているメールアドレス
+        """
+        # Bloomフィルターで未登録と確定したメールアドレスは問い合わせから除く
+        candidates = [email for email in emails if self._might_exist_email(email)]
+        if not candidates:
+            return set()
+        rows = await UserModel.filter(email__in=candidates).values_list("email")
+        return {email for (email,) in rows}
+
 
 class WriteUserRepositoryImpl(WriteUserRepository):
     """Tortoise-ORMを使用した書き込み可能UserRepositoryの実装
 
     DataMapperパターンを活用し、トランザクション外で変更を蓄積し、
     UnitOfWorkによるトランザクション内で一括更新します。
-    CQRSパターンに従い、読み取り操作は提供せず、書き込み操作のみを実装します。
+    CQRSパターンに従い、変更対象の取得を除いて読み取り操作は提供せず、書き込み操作のみを実装します。
     """
 
-    def __init__(self, read_repository: ReadUserRepositoryImpl | None = None) -> None:
+    def __init__(
+        self,
+        read_repository: ReadUserRepositoryImpl | None = None,
+        commit_listeners: list[CommitListener] | None = None,
+    ) -> None:
+        """コンストラクタ
+
+        Args:
+            read_repository: キャッシュを共有する読み取り用のリポジトリ 省略した場合は専用のものを作成します
+            commit_listeners: 共有するリスナーのリスト 省略した場合は専用のものを作成します
+        """
         self._read_repository = read_repository or ReadUserRepositoryImpl()
         self._identity_map = self._read_repository.identity_map
         self._data_mapper = self._read_repository.data_mapper
+        self._negative_cache = self._read_repository.negative_cache
         # 変更対象のエンティティを追跡するコレクション
         self._pending_entities: dict[UUID, User] = {}
+        # 新規作成が確定しているエンティティ コミット時にbulk_createで一括INSERTする
+        self._pending_creates: dict[UUID, User] = {}
+        # 変更するために読み込んだエンティティの、読み込んだ時点の値
+        self._change_tracker: ChangeTracker[User] = ChangeTracker(SNAPSHOT_COLUMNS, self._data_mapper.to_snapshot)
+        # コミットしたがトランザクションの確定を通知していないエンティティ
+        self._committed: list[User] = []
+        self._commit_listeners = commit_listeners if commit_listeners is not None else []
+
+    def for_unit_of_work(self) -> "WriteUserRepositoryImpl":
+        """キャッシュとリスナーを共有し、保留中の変更を個別に保持するリポジトリを作成します
+
+        UnitOfWork毎に作成し、並行するリクエストの変更が混ざらないようにします。
+
+        Returns:
+            WriteUserRepositoryImpl: 保留中の変更を持たないリポジトリ
+        """
+        return WriteUserRepositoryImpl(read_repository=self._read_repository, commit_listeners=self._commit_listeners)
+
+    def add_commit_listener(self, listener: CommitListener) -> None:
+        """トランザクション確定後に変更されたエンティティを受け取るリスナーを登録します
+
+        キャッシュの無効化など、永続化された変更に追従する処理に使用します。
+
+        Args:
+            listener: コミット済みのエンティティを受け取る関数
+        """
+        self._commit_listeners.append(listener)
+
+    async def find_for_update(self, id: UUID) -> User:
+        """変更するためにIDによりユーザーを取得
+
+        キャッシュを経由せずに書き込み用の接続から取得し、読み込んだ時点の値を記録します。
+        コミット時には記録した値と比較し、変更された列のみを更新します。
+
+        Args:
+            id: ユーザーID
+
+        Returns:
+            User: 取得したユーザーエンティティ
+
+        Raises:
+            EntityNotFoundError: ユーザーが見つからない場合
+        """
+        rows = await _select_rows("id", [str(id)], for_write=True)
+        if not rows:
+            msg = f"User with id {id} not found"
+            raise EntityNotFoundError(msg)
+
+        # 変更されてコミット後に破棄されるため、値オブジェクトは共有しない
+        entity = self._data_mapper.from_row(rows[0], intern=False)
+        self._change_tracker.track(entity)
+        return entity
 
     async def save(self, user: User) -> User:
         """ユーザーの保存
@@ -131,54 +513,152 @@ class WriteUserRepositoryImpl(WriteUserRepository):
         Returns:
             User: 保存対象のユーザーエンティティ
         """
-        # 変更を追跡
+        # 変更を追跡 IdentityMapへの反映はトランザクションの確定後に行う
         self._pending_entities[user.id] = user
-        # IdentityMapにも追加/更新
-        self._identity_map.add(user)
+        self._discard_negative(user)
+        # 重複確認でコミット前の他のリクエストを見逃さないよう、保存対象とした時点で登録する
+        self._read_repository.add_emails_to_filter((user.email.value,))
         return user
 
+    async def save_all(self, users: Sequence[User]) -> list[User]:
+        """新規ユーザーの一括保存
+
+        呼び出し元で新規であることを確認済みのエンティティを登録し、
+        コミット時に`bulk_create`で一度にINSERTします。
+
+        Args:
+            users: 保存する新規ユーザーエンティティのリスト
+
+        Returns:
+            list[User]: 保存対象のユーザーエンティティ
+        """
+        for user in users:
+            self._pending_creates[user.id] = user
+            self._discard_negative(user)
+        self._read_repository.add_emails_to_filter(user.email.value for user in users)
+        return list(users)
+
+    def take_pending(self) -> PendingChanges:
+        """保留中の変更を取り出します
+
+        取り出した変更はリポジトリから削除されるため、他のリクエストの変更と
+        まとめて書き込む場合に使用します。
+        `find_for_update`で読み込んだエンティティは変更された列のみを更新の対象とし、
+        変更がなければ書き込みません。
+
+        Returns:
+            PendingChanges: 書き込む変更
+        """
+        changes = PendingChanges(creates=list(self._pending_creates.values()), upserts=[], updates=[])
+        for user in self._pending_entities.values():
+            columns = self._change_tracker.changed_columns(user)
+            if columns is None:
+                changes.upserts.append(user)
+            elif columns:
+                changes.updates.append((user, columns))
+        self._pending_creates.clear()
+        self._pending_entities.clear()
+        self._change_tracker.clear()
+        return changes
+
+    async def write(self, changes: Sequence[PendingChanges]) -> None:
+        """変更をデータベースに書き込みます
+
+        保留中の変更やIdentityMapには触れないため、複数のリクエストの変更をまとめて書き込めます。
+        トランザクション内で呼び出されることを想定しています。
+
+        Args:
+            changes: 書き込む変更
+        """
+        # 新規作成が確定しているエンティティは一括INSERT
+        # メールアドレスの重複などは制約違反としてそのままエラーにする
+        creates = [user for change in changes for user in change.creates]
+        if creates:
+            await UserModel.bulk_create(self._data_mapper.to_models(creates), batch_size=COMMIT_BATCH_SIZE)
+
+        # 既存レコードの有無を確認せず、INSERT ... ON CONFLICT(id) DO UPDATEで一括反映
+        # created_atは新規作成時の値を保持するため更新対象に含めない
+        upserts = [user for change in changes for user in change.upserts]
+        if upserts:
+            await UserModel.bulk_create(
+                self._data_mapper.to_models(upserts),
+                batch_size=COMMIT_BATCH_SIZE,
+                on_conflict=["id"],
+                update_fields=["name", "email", "updated_at"],
+            )
+
+        # 変更された列の組み合わせ毎に、その列のみをUPDATE
+        updates: dict[tuple[str, ...], list[User]] = {}
+        for change in changes:
+            for user, columns in change.updates:
+                updates.setdefault(columns, []).append(user)
+        for columns, users in updates.items():
+            await UserModel.bulk_update(
+                self._data_mapper.to_models(users),
+                fields=list(columns),
+                batch_size=COMMIT_BATCH_SIZE,
+            )
+
     async def commit(self) -> None:
         """保留中の変更をすべてデータベースに反映します。
 
         UnitOfWorkによるトランザクション内で呼び出されることを想定しています。
         """
-        # 保留中のエンティティがなければ何もしない
-        if not self._pending_entities:
+        changes = self.take_pending()
+        await self.write([changes])
+        self._committed.extend(changes.entities)
+
+    def publish_committed(self) -> None:
+        """コミットしたエンティティをリスナーに通知します
+
+        トランザクションの確定後にUnitOfWorkから呼び出されます。
+        """
+        committed, self._committed = self._committed, []
+        self.publish(committed)
+
+    def publish_written(self, changes: Sequence[PendingChanges]) -> None:
+        """`write`で書き込んだ変更の確定後に、変更したエンティティをリスナーに通知します
+
+        Args:
+            changes: トランザクションが確定した変更
+        """
+        self.publish([user for change in changes for user in change.entities])
+
+    def publish(self, users: Sequence[User]) -> None:
+        """確定した変更をキャッシュに反映し、リスナーに通知します
+
+        リスナーの失敗は既に確定した変更に影響させないため、ログ出力のみ行います。
+
+        Args:
+            users: トランザクションが確定したエンティティ
+        """
+        if not users:
             return
 
-        # 各エンティティを処理し、低レベルSQLを使用してDBに反映
-        # これによりsaveメソッドの内部コミットを回避
-        for entity in self._pending_entities.values():
-            # エンティティをDBモデルに変換
-            model = await self._data_mapper.to_model(entity)
-
-            # 既存レコードか新規レコードかを確認
-            exists = await UserModel.exists(id=model.id)
-
-            if exists:
-                # 既存レコードの場合はUPDATE文を使用
-                # Tortoise-ORMのbulk_updateを使用して明示的な更新
-                await UserModel.filter(id=model.id).update(
-                    name=model.name,
-                    email=model.email,
-                    updated_at=model.updated_at,
-                )
-            else:
-                # 新規レコードの場合はINSERT文を使用
-                # Tortoise-ORMのcreateを使用して明示的な作成
-                await UserModel.create(
-                    id=model.id,
-                    name=model.name,
-                    email=model.email,
-                    created_at=model.created_at,
-                    updated_at=model.updated_at,
-                )
-
-        # 後処理
-        self._pending_entities.clear()
+        # 変更したエンティティのみをIdentityMapから削除し、次回の取得でDBから読み直す
+        # 確定前に見つからなかったと記録されたキーも改めて削除する
+        for entity in users:
+            self._identity_map.remove(entity.id)
+            self._discard_negative(entity)
+
+        for listener in self._commit_listeners:
+            try:
+                listener(users)
+            except Exception:
+                logger.exception("Commit listener failed")
+
+    def _discard_negative(self, user: User) -> None:
+        """作成・変更されるユーザーのIDとメールアドレスを見つからなかったキーの記録から削除します"""
+        self._negative_cache.discard(id_key(user.id))
+        self._negative_cache.discard(email_key(user.email.value))
 
     def clear(self) -> None:
-        """保留中の変更とIdentityMapをクリアします"""
+        """保留中の変更をクリアします
+
+        IdentityMapはリクエストを跨いで共有するため、ここではクリアしません。
+        """
         self._pending_entities.clear()
-        self._identity_map.clear()
+        self._pending_creates.clear()
+        self._change_tracker.clear()
+        self._committed.clear()
 
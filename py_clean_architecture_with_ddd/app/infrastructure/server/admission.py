@@ -0,0 +1,120 @@
+import threading
+
+
+class AimdLimiter:
+    """AIMD(加算増加・乗算減少)により同時実行数の上限を調整するリミッター
+
+    処理時間が閾値以内で上限付近まで使われている間は上限を少しずつ増やし、
+    閾値を超えた場合や期限切れが発生した場合は上限を一定の比率で減らします。
+    ストリーミングなど処理時間がクライアントの送受信に依存する場合は、期限切れのみで判定します。
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        latency_threshold: float = 2.0,
+        backoff_ratio: float = 0.9,
+    ) -> None:
+        """コンストラクタ
+
+        Args:
+            initial_limit: 同時実行数の初期上限
+            min_limit: 同時実行数の下限
+            max_limit: 同時実行数の上限の最大値
+            latency_threshold: 過負荷とみなす処理時間 単位は秒
+            backoff_ratio: 過負荷時に上限へ掛ける比率
+        """
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._latency_threshold = latency_threshold
+        self._backoff_ratio = backoff_ratio
+        self._in_flight = 0
+        # スレッドプール型サーバーでは複数スレッドから呼ばれるため保護する
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """現在の同時実行数の上限"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """実行中のリクエスト数"""
+        return self._in_flight
+
+    def try_acquire(self) -> bool:
+        """実行枠を確保する
+
+        Returns:
+            bool: 確保できた場合はTrue 上限に達している場合はFalse
+        """
+        with self._lock:
+            if self._in_flight >= int(self._limit):
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self, latency: float | None, *, overloaded: bool = False) -> None:
+        """実行枠を解放し、結果に応じて上限を調整する
+
+        Args:
+            latency: リクエストの処理時間 単位は秒 Noneの場合は処理時間で判定しない
+            overloaded: 期限切れなど、処理時間以外で過負荷と判定された場合はTrue
+        """
+        with self._lock:
+            # 解放前の実行数で、上限付近まで使われていたかを判定する
+            in_flight = self._in_flight
+            self._in_flight -= 1
+            if overloaded or (latency is not None and latency > self._latency_threshold):
+                self._limit = max(self._min_limit, self._limit * self._backoff_ratio)
+            elif in_flight * 2 >= self._limit:
+                # 上限分のリクエストが完了する毎におよそ1ずつ増やす
+                self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+
+
+class AdmissionController:
+    """gRPCメソッド毎のAIMDリミッターを管理する"""
+
+    def __init__(
+        self,
+        initial_limit: int,
+        max_limit: int,
+        latency_threshold: float,
+    ) -> None:
+        """コンストラクタ
+
+        Args:
+            initial_limit: メソッド毎の同時実行数の初期上限
+            max_limit: メソッド毎の同時実行数の上限の最大値
+            latency_threshold: 過負荷とみなす処理時間 単位は秒
+        """
+        self._initial_limit = initial_limit
+        self._max_limit = max_limit
+        self._latency_threshold = latency_threshold
+        self._limiters: dict[str, AimdLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, method: str) -> AimdLimiter:
+        """メソッドのリミッターを取得する 初回は作成する
+
+        Args:
+            method: gRPCメソッドのフルネーム
+
+        Returns:
+            AimdLimiter: メソッドのリミッター
+        """
+        limiter = self._limiters.get(method)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.setdefault(
+                    method,
+                    AimdLimiter(
+                        initial_limit=self._initial_limit,
+                        max_limit=self._max_limit,
+                        latency_threshold=self._latency_threshold,
+                    ),
+                )
+        return limiter
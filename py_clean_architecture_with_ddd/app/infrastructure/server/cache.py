@@ -0,0 +1,130 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import NamedTuple
+
+# キャッシュのキー gRPCメソッドのフルネームとシリアライズ済みのリクエストの組
+CacheKey = tuple[str, bytes]
+
+
+class _Entry(NamedTuple):
+    body: bytes
+    expires_at: float
+    tags: tuple[str, ...]
+
+
+class ResponseCache:
+    """シリアライズ済みのgRPCレスポンスを保持するLRU/TTLキャッシュ
+
+    各エントリーにはレスポンスが依存するエンティティのID(タグ)を付与し、
+    タグ単位で無効化できます。
+    無効化と並行して実行されたリクエストの結果で古い値を書き戻さないよう、
+    無効化の度に世代を進めてタグ毎に無効化した世代を記録し、
+    取得開始後にいずれかのタグが無効化されていた場合は保存しません。
+    無関係なタグの無効化では保存を取りやめません。
+
+    キャッシュはプロセス毎に保持するため、他のプロセスでの変更では無効化されません。
+    """
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        """コンストラクタ
+
+        Args:
+            max_entries: 保持する最大エントリー数
+            ttl: エントリーの有効期間(秒)
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._keys_by_tag: dict[str, set[CacheKey]] = {}
+        self._generation = 0
+        # タグ毎の最後に無効化した世代 古い記録から最大エントリー数まで保持する
+        self._invalidated_at: OrderedDict[str, int] = OrderedDict()
+        # 記録から削除したタグが無効化された可能性のある最新の世代
+        self._forgotten_generation = 0
+        # スレッドプール型サーバーでは複数スレッドから呼ばれるため保護する
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """現在の世代 `put`に渡すために取得開始時に参照する"""
+        return self._generation
+
+    def get(self, key: CacheKey) -> bytes | None:
+        """有効なエントリーを取得する
+
+        Args:
+            key: キャッシュのキー
+
+        Returns:
+            bytes | None: シリアライズ済みのレスポンス 存在しないか期限切れの場合はNone
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry.body
+
+    def put(self, key: CacheKey, body: bytes, tags: Iterable[str], generation: int) -> None:
+        """エントリーを保存する
+
+        Args:
+            key: キャッシュのキー
+            body: シリアライズ済みのレスポンス
+            tags: レスポンスが依存するエンティティのID
+            generation: 取得開始時の世代
+        """
+        entry_tags = tuple(tags)
+        with self._lock:
+            if not self._is_fresh(entry_tags, generation):
+                return
+            if key in self._entries:
+                self._remove(key)
+            entry = _Entry(body=body, expires_at=time.monotonic() + self._ttl, tags=entry_tags)
+            self._entries[key] = entry
+            for tag in entry.tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """タグが付与されたエントリーを削除する
+
+        Args:
+            tags: 変更されたエンティティのID
+        """
+        with self._lock:
+            self._generation += 1
+            for tag in tags:
+                self._invalidated_at[tag] = self._generation
+                self._invalidated_at.move_to_end(tag)
+                for key in self._keys_by_tag.pop(tag, ()):
+                    self._remove(key)
+            while len(self._invalidated_at) > self._max_entries:
+                _, self._forgotten_generation = self._invalidated_at.popitem(last=False)
+
+    def _is_fresh(self, tags: tuple[str, ...], generation: int) -> bool:
+        """取得開始後にタグが無効化されていないかどうか
+
+        記録から削除したタグは判定できないため、削除以前に開始した取得は無効化されたものとして扱います。
+        """
+        if generation < self._forgotten_generation:
+            return False
+        return all(self._invalidated_at.get(tag, 0) <= generation for tag in tags)
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_tag[tag]
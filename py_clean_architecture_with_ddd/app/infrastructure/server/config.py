@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import StrictStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -8,6 +9,36 @@ class Config(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="server_")
 
     version: StrictStr = "v0.0.1"
+    port: int = 50051
+    # aio: grpc.aioによる単一イベントループ / thread: スレッドプール + 全リクエストで共有する専用スレッドのループ
+    mode: Literal["aio", "thread"] = "aio"
+    max_workers: int = 10
+    # 1より大きい場合はSO_REUSEPORTで同一ポートを共有するワーカープロセスを起動する
+    workers: int = 1
+    # Prometheus形式のメトリクスを返すHTTPポート ワーカー毎に番号分ずらす 0の場合は無効
+    metrics_port: int = 9100
+    # メトリクスのHTTPサーバーが待ち受けるアドレス 外部から取得する場合は0.0.0.0などを指定する
+    metrics_host: str = "127.0.0.1"
+    # 冪等なRPCのレスポンスキャッシュの最大エントリー数 0の場合は無効
+    response_cache_size: int = 10000
+    # レスポンスキャッシュの有効期間 単位は秒
+    response_cache_ttl: float = 30.0
+    # サーバー全体で受け付ける同時RPC数の上限 超えた場合はRESOURCE_EXHAUSTEDで拒否する 0の場合は無制限
+    max_concurrent_rpcs: int = 1000
+    # メソッド毎の同時実行数の初期上限 AIMDで調整する 0の場合はアドミッション制御を無効化
+    admission_initial_limit: int = 20
+    admission_max_limit: int = 500
+    # この処理時間を超えたリクエストがあると同時実行数の上限を下げる 単位は秒
+    admission_latency_threshold: float = 2.0
+    # exists_by_emailの前段に置くメールアドレスのBloomフィルターの偽陽性率 0の場合は無効
+    email_filter_false_positive_rate: float = 0.01
+    # SQLiteのWALチェックポイントと統計情報の更新を行う間隔 単位は秒 0の場合は無効
+    sqlite_maintenance_interval: float = 300.0
+    # 並行したCreateUserなどのコミットを1つのトランザクションにまとめるために待機する最大時間 単位は秒
+    # 0の場合は無効
+    group_commit_max_delay: float = 0.005
+    # 1つのトランザクションにまとめる最大エンティティ数 達した場合は待機せずに書き込む
+    group_commit_max_batch_size: int = 500
 
 @lru_cache
 def get() -> Config:
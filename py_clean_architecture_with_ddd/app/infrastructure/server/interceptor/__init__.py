@@ -1,5 +1,15 @@
-from .version import VersionInterceptor
+from .admission import AdmissionInterceptor, AioAdmissionInterceptor
+from .cache import AioCacheInterceptor, CacheInterceptor
+from .metrics import AioMetricsInterceptor, MetricsInterceptor
+from .version import AioVersionInterceptor, VersionInterceptor
 
 __all__ = [
+    "AdmissionInterceptor",
+    "AioAdmissionInterceptor",
+    "AioCacheInterceptor",
+    "AioMetricsInterceptor",
+    "AioVersionInterceptor",
+    "CacheInterceptor",
+    "MetricsInterceptor",
     "VersionInterceptor",
 ]
@@ -0,0 +1,251 @@
+import inspect
+import time
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from typing import Any
+
+import grpc
+
+from app.infrastructure.server.admission import AdmissionController, AimdLimiter
+
+
+def _deadline_exceeded(context: grpc.ServicerContext | grpc.aio.ServicerContext) -> bool:
+    """クライアントの期限が既に過ぎているかどうか
+
+    Args:
+        context: gRPCコンテキスト
+
+    Returns:
+        bool: 期限が設定されており、残り時間がない場合はTrue
+    """
+    remaining = context.time_remaining()
+    return remaining is not None and remaining <= 0
+
+
+def _stream_latency(start: float, first_response_latency: float | None) -> float:
+    """サーバーストリーミングの処理時間を取得する
+
+    2件目以降の送信はクライアントの受信速度に依存するため、最初のレスポンスまでの時間とします。
+    レスポンスを返さずに終了した場合は終了までの時間とします。
+
+    Args:
+        start: 処理の開始時刻
+        first_response_latency: 最初のレスポンスまでの時間 まだ返していない場合はNone
+
+    Returns:
+        float: 処理時間 単位は秒
+    """
+    if first_response_latency is not None:
+        return first_response_latency
+    return time.perf_counter() - start
+
+
+class _Permit:
+    """スレッドプールに投入する前に確保した実行枠
+
+    ハンドラーが実行されずに破棄された場合も解放できるよう、解放は1度だけ行います。
+    """
+
+    def __init__(self, limiter: AimdLimiter) -> None:
+        """コンストラクタ
+
+        Args:
+            limiter: 実行枠を確保したリミッター
+        """
+        self._limiter = limiter
+        self._released = False
+
+    def release(self, latency: float | None, *, overloaded: bool = False) -> None:
+        """実行枠を解放する 2回目以降の呼び出しは無視する
+
+        Args:
+            latency: リクエストの処理時間 単位は秒 Noneの場合は処理時間で判定しない
+            overloaded: 期限切れなど、処理時間以外で過負荷と判定された場合はTrue
+        """
+        if self._released:
+            return
+        self._released = True
+        self._limiter.release(latency, overloaded=overloaded)
+
+
+class AdmissionInterceptor(grpc.ServerInterceptor):
+    """メソッド毎に同時実行数を制限し、過負荷時は早期に拒否するインターセプター
+
+    実行枠はスレッドプールに投入する前のサーバースレッドで確保するため、プールの待ち行列に
+    積まれたリクエストも同時実行数に含まれます。上限に達している場合はRESOURCE_EXHAUSTEDで拒否し、
+    待ち行列の間に期限切れになったリクエストは処理せずに破棄して上限を下げます。
+    """
+
+    def __init__(self, controller: AdmissionController) -> None:
+        """コンストラクタ
+
+        Args:
+            controller: メソッド毎のリミッターを管理するコントローラー
+        """
+        self._controller = controller
+
+    def intercept_service(
+        self,
+        continuation: Callable,
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler | None:
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+        if not (handler.unary_unary or handler.stream_unary or handler.unary_stream):
+            return handler
+
+        limiter = self._controller.limiter(handler_call_details.method)
+        if not limiter.try_acquire():
+            return self._rejected(handler)
+        permit = _Permit(limiter)
+
+        if handler.unary_unary:
+            behavior = self._wrap_unary(permit, handler.unary_unary)
+            factory = grpc.unary_unary_rpc_method_handler
+        elif handler.stream_unary:
+            # 処理時間がクライアントの送信速度に依存するため、期限切れのみで判定する
+            behavior = self._wrap_unary(permit, handler.stream_unary, measure_latency=False)
+            factory = grpc.stream_unary_rpc_method_handler
+        else:
+            behavior = self._wrap_stream(permit, handler.unary_stream)
+            factory = grpc.unary_stream_rpc_method_handler
+        # 待ち行列の間にクライアントがキャンセルした場合はハンドラーが呼ばれないため、破棄された時点で解放する
+        weakref.finalize(behavior, permit.release, None, overloaded=True)
+        return factory(behavior, handler.request_deserializer, handler.response_serializer)
+
+    @staticmethod
+    def _rejected(handler: grpc.RpcMethodHandler) -> grpc.RpcMethodHandler:
+        """実行枠を確保できなかったリクエストを拒否するハンドラーを作成する"""
+        def reject(_request: Any, servicer_context: grpc.ServicerContext) -> None:  # noqa: ANN401
+            servicer_context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "Too many concurrent requests")
+
+        if handler.unary_unary:
+            factory = grpc.unary_unary_rpc_method_handler
+        elif handler.stream_unary:
+            factory = grpc.stream_unary_rpc_method_handler
+        else:
+            factory = grpc.unary_stream_rpc_method_handler
+        return factory(reject, handler.request_deserializer, handler.response_serializer)
+
+    @staticmethod
+    def _drop_expired(permit: _Permit, servicer_context: grpc.ServicerContext) -> None:
+        if _deadline_exceeded(servicer_context):
+            permit.release(None, overloaded=True)
+            servicer_context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, "Deadline exceeded before processing")
+
+    def _wrap_unary(self, permit: _Permit, handler_fn: Callable, *, measure_latency: bool = True) -> Callable:
+        def new_handler(request: Any, servicer_context: grpc.ServicerContext) -> Any:  # noqa: ANN401
+            self._drop_expired(permit, servicer_context)
+            start = time.perf_counter()
+            try:
+                return handler_fn(request, servicer_context)
+            finally:
+                permit.release(
+                    time.perf_counter() - start if measure_latency else None,
+                    overloaded=_deadline_exceeded(servicer_context),
+                )
+        return new_handler
+
+    def _wrap_stream(self, permit: _Permit, handler_fn: Callable) -> Callable:
+        def new_handler(request: Any, servicer_context: grpc.ServicerContext) -> Iterator[Any]:  # noqa: ANN401
+            self._drop_expired(permit, servicer_context)
+            start = time.perf_counter()
+            latency: float | None = None
+            try:
+                for response in handler_fn(request, servicer_context):
+                    if latency is None:
+                        latency = time.perf_counter() - start
+                    yield response
+            finally:
+                permit.release(
+                    _stream_latency(start, latency),
+                    overloaded=_deadline_exceeded(servicer_context),
+                )
+        return new_handler
+
+
+class AioAdmissionInterceptor(grpc.aio.ServerInterceptor):
+    """grpc.aioサーバー向けのAdmissionInterceptor"""
+
+    def __init__(self, controller: AdmissionController) -> None:
+        """コンストラクタ
+
+        Args:
+            controller: メソッド毎のリミッターを管理するコントローラー
+        """
+        self._controller = controller
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[grpc.HandlerCallDetails], Awaitable[grpc.RpcMethodHandler]],
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler:
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return handler
+
+        limiter = self._controller.limiter(handler_call_details.method)
+        if handler.unary_unary:
+            return grpc.unary_unary_rpc_method_handler(
+                self._wrap_unary(limiter, handler.unary_unary),
+                handler.request_deserializer,
+                handler.response_serializer,
+            )
+        if handler.stream_unary:
+            return grpc.stream_unary_rpc_method_handler(
+                # 処理時間がクライアントの送信速度に依存するため、期限切れのみで判定する
+                self._wrap_unary(limiter, handler.stream_unary, measure_latency=False),
+                handler.request_deserializer,
+                handler.response_serializer,
+            )
+        if handler.unary_stream:
+            return grpc.unary_stream_rpc_method_handler(
+                self._wrap_stream(limiter, handler.unary_stream),
+                handler.request_deserializer,
+                handler.response_serializer,
+            )
+        return handler
+
+    @staticmethod
+    async def _admit(limiter: AimdLimiter, servicer_context: grpc.aio.ServicerContext) -> None:
+        if _deadline_exceeded(servicer_context):
+            await servicer_context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, "Deadline exceeded before processing")
+        if not limiter.try_acquire():
+            await servicer_context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "Too many concurrent requests")
+
+    def _wrap_unary(self, limiter: AimdLimiter, handler_fn: Callable, *, measure_latency: bool = True) -> Callable:
+        async def new_handler(request: Any, servicer_context: grpc.aio.ServicerContext) -> Any:  # noqa: ANN401
+            await self._admit(limiter, servicer_context)
+            start = time.perf_counter()
+            try:
+                response = handler_fn(request, servicer_context)
+                if inspect.isawaitable(response):
+                    response = await response
+                return response
+            finally:
+                limiter.release(
+                    time.perf_counter() - start if measure_latency else None,
+                    overloaded=_deadline_exceeded(servicer_context),
+                )
+        return new_handler
+
+    def _wrap_stream(self, limiter: AimdLimiter, handler_fn: Callable) -> Callable:
+        async def new_handler(
+            request: Any,  # noqa: ANN401
+            servicer_context: grpc.aio.ServicerContext,
+        ) -> AsyncIterator[Any]:
+            await self._admit(limiter, servicer_context)
+            start = time.perf_counter()
+            latency: float | None = None
+            try:
+                async for response in handler_fn(request, servicer_context):
+                    if latency is None:
+                        latency = time.perf_counter() - start
+                    yield response
+            finally:
+                limiter.release(
+                    _stream_latency(start, latency),
+                    overloaded=_deadline_exceeded(servicer_context),
+                )
+        return new_handler
@@ -0,0 +1,136 @@
+import inspect
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from typing import Any
+
+import grpc
+
+from app.infrastructure.server.cache import ResponseCache
+from app.infrastructure.server.interceptor.status import status_code
+
+# リクエストからレスポンスが依存するエンティティのIDを取り出す関数
+TagExtractor = Callable[[Any], Iterable[str]]
+
+
+def _is_ok(context: grpc.ServicerContext | grpc.aio.ServicerContext) -> bool:
+    """ハンドラーが正常終了のステータスを設定したかどうか
+
+    Args:
+        context: gRPCコンテキスト
+
+    Returns:
+        bool: ステータスが未設定またはOKの場合はTrue
+    """
+    return status_code(context) in (None, grpc.StatusCode.OK)
+
+
+class CacheInterceptor(grpc.ServerInterceptor):
+    """冪等なRPCのシリアライズ済みレスポンスをキャッシュするインターセプター
+
+    メソッド名とシリアライズ済みのリクエストをキーとし、ヒットした場合は
+    サービサーを実行せずにシリアライズ済みのレスポンスをそのまま返します。
+    正常終了したレスポンスのみを保存します。
+    """
+
+    def __init__(self, cache: ResponseCache, methods: Mapping[str, TagExtractor]) -> None:
+        """コンストラクタ
+
+        Args:
+            cache: レスポンスキャッシュ
+            methods: キャッシュ対象のメソッドのフルネームと、無効化用のタグを取り出す関数
+        """
+        self._cache = cache
+        self._methods = methods
+
+    def intercept_service(
+        self,
+        continuation: Callable,
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler:
+        handler = continuation(handler_call_details)
+        method = handler_call_details.method
+        if handler is None or not handler.unary_unary or method not in self._methods:
+            return handler
+
+        # リクエストとレスポンスをバイト列のまま受け渡す
+        return grpc.unary_unary_rpc_method_handler(
+            self._wrap(method, handler.unary_unary, handler.request_deserializer, handler.response_serializer),
+        )
+
+    def _wrap(
+        self,
+        method: str,
+        handler_fn: Callable,
+        deserialize: Callable[[bytes], Any] | None,
+        serialize: Callable[[Any], bytes] | None,
+    ) -> Callable:
+        extract_tags = self._methods[method]
+
+        def new_handler(request_bytes: bytes, servicer_context: grpc.ServicerContext) -> bytes:
+            key = (method, request_bytes)
+            body = self._cache.get(key)
+            if body is not None:
+                return body
+
+            generation = self._cache.generation
+            request = deserialize(request_bytes) if deserialize else request_bytes
+            response = handler_fn(request, servicer_context)
+            body = serialize(response) if serialize else response
+            if _is_ok(servicer_context):
+                self._cache.put(key, body, extract_tags(request), generation)
+            return body
+        return new_handler
+
+
+class AioCacheInterceptor(grpc.aio.ServerInterceptor):
+    """grpc.aioサーバー向けのCacheInterceptor"""
+
+    def __init__(self, cache: ResponseCache, methods: Mapping[str, TagExtractor]) -> None:
+        """コンストラクタ
+
+        Args:
+            cache: レスポンスキャッシュ
+            methods: キャッシュ対象のメソッドのフルネームと、無効化用のタグを取り出す関数
+        """
+        self._cache = cache
+        self._methods = methods
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[grpc.HandlerCallDetails], Awaitable[grpc.RpcMethodHandler]],
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler:
+        handler = await continuation(handler_call_details)
+        method = handler_call_details.method
+        if handler is None or not handler.unary_unary or method not in self._methods:
+            return handler
+
+        # リクエストとレスポンスをバイト列のまま受け渡す
+        return grpc.unary_unary_rpc_method_handler(
+            self._wrap(method, handler.unary_unary, handler.request_deserializer, handler.response_serializer),
+        )
+
+    def _wrap(
+        self,
+        method: str,
+        handler_fn: Callable,
+        deserialize: Callable[[bytes], Any] | None,
+        serialize: Callable[[Any], bytes] | None,
+    ) -> Callable:
+        extract_tags = self._methods[method]
+
+        async def new_handler(request_bytes: bytes, servicer_context: grpc.aio.ServicerContext) -> bytes:
+            key = (method, request_bytes)
+            body = self._cache.get(key)
+            if body is not None:
+                return body
+
+            generation = self._cache.generation
+            request = deserialize(request_bytes) if deserialize else request_bytes
+            response = handler_fn(request, servicer_context)
+            if inspect.isawaitable(response):
+                response = await response
+            body = serialize(response) if serialize else response
+            if _is_ok(servicer_context):
+                self._cache.put(key, body, extract_tags(request), generation)
+            return body
+        return new_handler
@@ -0,0 +1,179 @@
+import inspect
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from typing import Any
+
+import grpc
+
+from app.infrastructure.server.interceptor.status import status_code
+from app.infrastructure.server.metrics import MetricsRegistry
+
+
+def _status_name(context: grpc.ServicerContext | grpc.aio.ServicerContext, *, failed: bool) -> str:
+    """RPC終了時のステータスコード名を取得する
+
+    Args:
+        context: gRPCコンテキスト
+        failed: ハンドラーが例外を送出した場合はTrue
+
+    Returns:
+        str: ステータスコード名
+    """
+    code = status_code(context)
+    if code is not None:
+        return code.name
+    return "UNKNOWN" if failed else "OK"
+
+
+class MetricsInterceptor(grpc.ServerInterceptor):
+    """メソッド毎のリクエスト数、ステータスコード、レイテンシを記録するインターセプター"""
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        """コンストラクタ
+
+        Args:
+            registry: 記録先のメトリクスレジストリ
+        """
+        self._registry = registry
+
+    def intercept_service(
+        self,
+        continuation: Callable,
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler | None:
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+
+        method = handler_call_details.method
+        if handler.unary_unary:
+            return grpc.unary_unary_rpc_method_handler(
+                self._wrap_unary(method, handler.unary_unary),
+                handler.request_deserializer,
+                handler.response_serializer,
+            )
+        if handler.stream_unary:
+            return grpc.stream_unary_rpc_method_handler(
+                self._wrap_unary(method, handler.stream_unary),
+                handler.request_deserializer,
+                handler.response_serializer,
+            )
+        if handler.unary_stream:
+            return grpc.unary_stream_rpc_method_handler(
+                self._wrap_stream(method, handler.unary_stream),
+                handler.request_deserializer,
+                handler.response_serializer,
+            )
+        return handler
+
+    def _wrap_unary(self, method: str, handler_fn: Callable) -> Callable:
+        def new_handler(request: Any, servicer_context: grpc.ServicerContext) -> Any:  # noqa: ANN401
+            start = time.perf_counter()
+            failed = True
+            try:
+                response = handler_fn(request, servicer_context)
+                failed = False
+                return response
+            finally:
+                self._registry.observe(
+                    method,
+                    _status_name(servicer_context, failed=failed),
+                    time.perf_counter() - start,
+                )
+        return new_handler
+
+    def _wrap_stream(self, method: str, handler_fn: Callable) -> Callable:
+        def new_handler(request: Any, servicer_context: grpc.ServicerContext) -> Iterator[Any]:  # noqa: ANN401
+            start = time.perf_counter()
+            failed = True
+            try:
+                yield from handler_fn(request, servicer_context)
+                failed = False
+            finally:
+                # ストリームを最後まで送信し終えるまでの時間を記録する
+                self._registry.observe(
+                    method,
+                    _status_name(servicer_context, failed=failed),
+                    time.perf_counter() - start,
+                )
+        return new_handler
+
+
+class AioMetricsInterceptor(grpc.aio.ServerInterceptor):
+    """grpc.aioサーバー向けのMetricsInterceptor"""
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        """コンストラクタ
+
+        Args:
+            registry: 記録先のメトリクスレジストリ
+        """
+        self._registry = registry
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[grpc.HandlerCallDetails], Awaitable[grpc.RpcMethodHandler]],
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler:
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return handler
+
+        method = handler_call_details.method
+        if handler.unary_unary:
+            return grpc.unary_unary_rpc_method_handler(
+                self._wrap_unary(method, handler.unary_unary),
+                handler.request_deserializer,
+                handler.response_serializer,
+            )
+        if handler.stream_unary:
+            return grpc.stream_unary_rpc_method_handler(
+                self._wrap_unary(method, handler.stream_unary),
+                handler.request_deserializer,
+                handler.response_serializer,
+            )
+        if handler.unary_stream:
+            return grpc.unary_stream_rpc_method_handler(
+                self._wrap_stream(method, handler.unary_stream),
+                handler.request_deserializer,
+                handler.response_serializer,
+            )
+        return handler
+
+    def _wrap_unary(self, method: str, handler_fn: Callable) -> Callable:
+        async def new_handler(request: Any, servicer_context: grpc.aio.ServicerContext) -> Any:  # noqa: ANN401
+            start = time.perf_counter()
+            failed = True
+            try:
+                response = handler_fn(request, servicer_context)
+                if inspect.isawaitable(response):
+                    response = await response
+                failed = False
+                return response
+            finally:
+                self._registry.observe(
+                    method,
+                    _status_name(servicer_context, failed=failed),
+                    time.perf_counter() - start,
+                )
+        return new_handler
+
+    def _wrap_stream(self, method: str, handler_fn: Callable) -> Callable:
+        async def new_handler(
+            request: Any,  # noqa: ANN401
+            servicer_context: grpc.aio.ServicerContext,
+        ) -> AsyncIterator[Any]:
+            start = time.perf_counter()
+            failed = True
+            try:
+                async for response in handler_fn(request, servicer_context):
+                    yield response
+                failed = False
+            finally:
+                # ストリームを最後まで送信し終えるまでの時間を記録する
+                self._registry.observe(
+                    method,
+                    _status_name(servicer_context, failed=failed),
+                    time.perf_counter() - start,
+                )
+        return new_handler
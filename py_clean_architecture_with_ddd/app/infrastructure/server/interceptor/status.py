@@ -0,0 +1,22 @@
+import grpc
+
+# grpc.aioのcode()が返す整数値からステータスコードへの対応
+_STATUS_CODES = {code.value[0]: code for code in grpc.StatusCode}
+
+
+def status_code(context: grpc.ServicerContext | grpc.aio.ServicerContext) -> grpc.StatusCode | None:
+    """ハンドラーが設定したステータスコードを取得する
+
+    grpc.aioのコンテキストは整数値を返す場合があるため、`grpc.StatusCode`に揃えます。
+
+    Args:
+        context: gRPCコンテキスト
+
+    Returns:
+        grpc.StatusCode | None: ステータスコード 未設定の場合はNone
+    """
+    # grpcioは同期サーバーのコンテキストにもcode()を実装しているが、型スタブには定義がない
+    code = context.code()  # type: ignore[union-attr]
+    if code is None or isinstance(code, grpc.StatusCode):
+        return code
+    return _STATUS_CODES.get(code, grpc.StatusCode.UNKNOWN)
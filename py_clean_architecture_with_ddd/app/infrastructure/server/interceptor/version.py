@@ -1,4 +1,5 @@
-from collections.abc import Callable
+import inspect
+from collections.abc import Awaitable, Callable
 
 import grpc
 
@@ -33,3 +34,37 @@ class VersionInterceptor(grpc.ServerInterceptor):
             ))
             return response
         return new_handler
+
+
+class AioVersionInterceptor(grpc.aio.ServerInterceptor):
+    """grpc.aioサーバー向けのVersionInterceptor"""
+
+    def __init__(self) -> None:
+        self.config = server_config.get()
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[grpc.HandlerCallDetails], Awaitable[grpc.RpcMethodHandler]],
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler:
+        handler = await continuation(handler_call_details)
+
+        if handler and handler.unary_unary:
+            return grpc.unary_unary_rpc_method_handler(
+                self._wrap_unary_response_with_version(handler.unary_unary),
+                handler.request_deserializer,
+                handler.response_serializer,
+            )
+        return handler
+
+    def _wrap_unary_response_with_version(self, handler_fn: Callable) -> Callable:
+        async def new_handler(request: object, servicer_context: grpc.aio.ServicerContext) -> object:
+            response = handler_fn(request, servicer_context)
+            if inspect.isawaitable(response):
+                response = await response
+            # メタデータにバージョン情報を追加
+            servicer_context.set_trailing_metadata((
+                ("version", self.config.version),
+            ))
+            return response
+        return new_handler
@@ -0,0 +1,184 @@
+import logging
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# レイテンシヒストグラムのバケット境界 単位は秒
+DEFAULT_LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class LatencyHistogram:
+    """1メソッド分のレイテンシヒストグラム
+
+    観測時はバケットの加算のみを行い、ロックの保持時間を最小限に抑えます。
+    grpc.aioサーバーでは単一スレッドから呼ばれるため、ロックの競合は発生しません。
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """コンストラクタ
+
+        Args:
+            buckets: 昇順に並んだバケット境界(秒)
+        """
+        self._buckets = buckets
+        # 最後の要素は+Infバケット
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """レイテンシを記録する
+
+        Args:
+            seconds: 処理時間(秒)
+        """
+        index = bisect_left(self._buckets, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += seconds
+
+    def snapshot(self) -> tuple[list[int], float]:
+        """現在のバケット毎の件数と合計を取得する
+
+        Returns:
+            tuple[list[int], float]: バケット毎の件数(累積ではない)と処理時間の合計
+        """
+        with self._lock:
+            return list(self._counts), self._sum
+
+    @property
+    def buckets(self) -> tuple[float, ...]:
+        """バケット境界(秒)"""
+        return self._buckets
+
+
+class MetricsRegistry:
+    """gRPCメソッド毎のリクエスト数、ステータスコード、レイテンシを保持するレジストリ"""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """コンストラクタ
+
+        Args:
+            buckets: レイテンシヒストグラムのバケット境界(秒)
+        """
+        self._buckets = buckets
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._handled: defaultdict[tuple[str, str], int] = defaultdict(int)
+        # 他のコンポーネントが保持するカウンター 出力時に値を読み出す
+        self._counters: list[tuple[str, str, Callable[[], int]]] = []
+        # メソッドの追加とカウンターの加算のみを保護する
+        self._lock = threading.Lock()
+
+    def register_counter(self, name: str, help_text: str, read: Callable[[], int]) -> None:
+        """出力時に値を読み出すカウンターを登録する
+
+        Args:
+            name: メトリクス名
+            help_text: メトリクスの説明
+            read: 現在の累計値を返す関数
+        """
+        self._counters.append((name, help_text, read))
+
+    def observe(self, method: str, code: str, seconds: float) -> None:
+        """1リクエスト分の結果を記録する
+
+        Args:
+            method: gRPCメソッドのフルネーム
+            code: ステータスコード名(例: OK, INTERNAL)
+            seconds: 処理時間(秒)
+        """
+        histogram = self._histograms.get(method)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(method, LatencyHistogram(self._buckets))
+        histogram.observe(seconds)
+        with self._lock:
+            self._handled[method, code] += 1
+
+    def render(self) -> str:
+        """Prometheusのテキスト形式で出力する
+
+        Returns:
+            str: Prometheusのテキスト形式のメトリクス
+        """
+        with self._lock:
+            handled = sorted(self._handled.items())
+            histograms = sorted(self._histograms.items())
+
+        lines = [
+            "# HELP grpc_server_handled_total Total number of RPCs completed on the server.",
+            "# TYPE grpc_server_handled_total counter",
+        ]
+        lines.extend(
+            f'grpc_server_handled_total{{grpc_method="{method}",grpc_code="{code}"}} {count}'
+            for (method, code), count in handled
+        )
+
+        lines.extend([
+            "# HELP grpc_server_handling_seconds Histogram of response latency of RPCs handled by the server.",
+            "# TYPE grpc_server_handling_seconds histogram",
+        ])
+        for method, histogram in histograms:
+            counts, total = histogram.snapshot()
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, counts, strict=False):
+                cumulative += count
+                lines.append(
+                    f'grpc_server_handling_seconds_bucket{{grpc_method="{method}",le="{bound}"}} {cumulative}',
+                )
+            cumulative += counts[-1]
+            lines.extend([
+                f'grpc_server_handling_seconds_bucket{{grpc_method="{method}",le="+Inf"}} {cumulative}',
+                f'grpc_server_handling_seconds_sum{{grpc_method="{method}"}} {total}',
+                f'grpc_server_handling_seconds_count{{grpc_method="{method}"}} {cumulative}',
+            ])
+
+        for name, help_text, read in self._counters:
+            lines.extend([
+                f"# HELP {name} {help_text}",
+                f"# TYPE {name} counter",
+                f"{name} {read()}",
+            ])
+        return "\n".join(lines) + "\n"
+
+
+def start_metrics_http_server(registry: MetricsRegistry, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """メトリクスをPrometheus形式で返すHTTPサーバーをデーモンスレッドで起動する
+
+    gRPCサーバーのイベントループやスレッドプールとは独立して動作します。
+
+    Args:
+        registry: 出力するメトリクスのレジストリ
+        port: 待ち受けるポート番号
+        host: 待ち受けるアドレス デフォルトはローカルホストのみ
+
+    Returns:
+        ThreadingHTTPServer: 起動したHTTPサーバー 停止時は`shutdown()`を呼び出す
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            # スクレイプ毎のアクセスログは出力しない
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    logger.info("Metrics endpoint started. Listening on %s:%d", host, port)
+    return server
@@ -1,7 +1,10 @@
+from .extend import AioServicer, set_handler_loop
 from .health import HealthServicer
 from .user import UserServicer
 
 __all__ = [
+    "AioServicer",
     "HealthServicer",
     "UserServicer",
+    "set_handler_loop",
 ]
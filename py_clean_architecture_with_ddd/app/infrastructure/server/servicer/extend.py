@@ -1,25 +1,100 @@
 import asyncio
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+)
 from functools import wraps
+from types import MethodType
 from typing import Any, TypeVar
 
 import grpc
 
-from app.iadapter.presenter.user import UserPresenter
-
 logger = logging.getLogger(__name__)
 
 Request = TypeVar("Request")  # リクエスト型
 Response = TypeVar("Response")  # レスポンス型
+# デコレートしたメソッドが受け取るコンテキスト スレッドプール型とgrpc.aioのどちらのサーバーからも呼ばれる
+type ServicerContext = grpc.ServicerContext | grpc.aio.ServicerContext[Any, Any]
+
+T = TypeVar("T")
+
+# スレッドプール型サーバーのハンドラーを実行するイベントループ
+# Tortoiseの接続やロックは作成したイベントループでしか使用できないため、全てのリクエストを同じループで実行する
+_handler_loop: asyncio.AbstractEventLoop | None = None
+
+
+def set_handler_loop(loop: asyncio.AbstractEventLoop | None) -> None:
+    """スレッドプール型サーバーのハンドラーを実行するイベントループを設定する
+
+    Tortoiseを初期化したイベントループを、別スレッドで実行し続けた状態で渡します。
+
+    Args:
+        loop: ハンドラーを実行するイベントループ Noneの場合は設定を解除します
+    """
+    global _handler_loop  # noqa: PLW0603
+    _handler_loop = loop
+
+
+def _run_in_handler_loop(coroutine: Coroutine[Any, Any, T]) -> T:
+    """コルーチンをハンドラー用のイベントループで実行し、完了するまで待機する
+
+    Args:
+        coroutine: 実行するコルーチン
+
+    Returns:
+        T: コルーチンの戻り値
+
+    Raises:
+        RuntimeError: イベントループが設定されていない場合
+    """
+    loop = _handler_loop
+    if loop is None:
+        coroutine.close()
+        msg = "set_handler_loop() must be called before serving with a thread pool server"
+        raise RuntimeError(msg)
+    return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+
+async def _anext(responses: AsyncGenerator[Any]) -> Any:  # noqa: ANN401
+    return await anext(responses)
+
+
+async def _aclose(responses: AsyncGenerator[Any]) -> None:
+    await responses.aclose()
+
+
+def _empty_response(func: Callable[..., Any]) -> Any:  # noqa: ANN401
+    """エラー時に返却する空のレスポンスを生成する
+
+    Args:
+        func: 戻り値の型注釈を持つgRPCメソッド
+
+    Returns:
+        適切な型の空のレスポンス
+    """
+    return_type = func.__annotations__.get("return")
+    if return_type:
+        return return_type()
+    return None
 
 
 def async_grpc_method(error_message: str) -> Callable[
-    [Callable[[Any, Any, grpc.ServicerContext], Awaitable[Any]]],
+    [Callable[[Any, Any, ServicerContext], Coroutine[Any, Any, Any]]],
     Callable[[Any, Any, grpc.ServicerContext], Any],
 ]:
     """gRPCメソッドを非同期実行するデコレータ
 
+    スレッドプール型サーバー向けの同期ラッパーを返します。同期ラッパーは`set_handler_loop`で設定した
+    イベントループでメソッドを実行し、完了するまでプールのスレッドで待機します。
+    grpc.aioサーバー向けのネイティブなコルーチンは`aio`属性として公開し、
+    `AioServicer`経由で登録されます。
+
     Args:
         error_message: エラー時のログメッセージ
 
@@ -27,7 +102,7 @@ def async_grpc_method(error_message: str) -> Callable[
         デコレータ関数
     """
     def decorator(
-        func: Callable[[Any, Any, grpc.ServicerContext], Awaitable[Any]],
+        func: Callable[[Any, Any, ServicerContext], Coroutine[Any, Any, Any]],
     ) -> Callable[[Any, Any, grpc.ServicerContext], Any]:
         """非同期gRPCメソッドをラップするデコレータ
 
@@ -49,26 +124,163 @@ def async_grpc_method(error_message: str) -> Callable[
             Returns:
                 gRPCレスポンス
             """
-            # 新しいイベントループを作成して使用
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
             try:
-                if hasattr(self, "injector") and self.injector:
-                    presenter = self.injector.get(UserPresenter)
-                    self.controller.set_presenter(presenter)
-
-                # 非同期関数を実行
-                return loop.run_until_complete(func(self, request, context))
+                # Tortoiseの接続を作成したイベントループで非同期関数を実行
+                return _run_in_handler_loop(func(self, request, context))
             except Exception as e:
                 logger.exception(error_message)
                 context.set_code(grpc.StatusCode.INTERNAL)
                 context.set_details(str(e))
                 # エラー時に適切な型の空のレスポンスを返す
-                return_type = func.__annotations__.get("return")
-                if return_type:
-                    return return_type()
-                return None
+                return _empty_response(func)
+
+        @wraps(func)
+        async def aio_wrapper(self: Any, request: Any, context: grpc.aio.ServicerContext) -> Any:  # noqa: ANN401
+            """grpc.aioサーバーのイベントループ上でそのまま実行するラッパー
+
+            Args:
+                self: サービサーインスタンス
+                request: gRPCリクエスト
+                context: gRPCコンテキスト
+
+            Returns:
+                gRPCレスポンス
+            """
+            try:
+                return await func(self, request, context)
+            except Exception as e:
+                logger.exception(error_message)
+                context.set_code(grpc.StatusCode.INTERNAL)
+                context.set_details(str(e))
+                return _empty_response(func)
+
+        wrapper.aio = aio_wrapper  # type: ignore[attr-defined]
+        return wrapper
+    return decorator
+
+
+def async_grpc_stream_method(error_message: str) -> Callable[
+    [Callable[[Any, Any, ServicerContext], AsyncGenerator[Any]]],
+    Callable[[Any, Any, grpc.ServicerContext], Iterator[Any]],
+]:
+    """サーバーストリーミングのgRPCメソッドを非同期ジェネレーターで実装するためのデコレータ
+
+    `async_grpc_method`と同様に、スレッドプール型サーバー向けの同期ジェネレーターを返し、
+    grpc.aioサーバー向けの非同期ジェネレーターを`aio`属性として公開します。
+
+    Args:
+        error_message: エラー時のログメッセージ
+
+    Returns:
+        デコレータ関数
+    """
+    def decorator(
+        func: Callable[[Any, Any, ServicerContext], AsyncGenerator[Any]],
+    ) -> Callable[[Any, Any, grpc.ServicerContext], Iterator[Any]]:
+        """非同期ジェネレーターのgRPCメソッドをラップするデコレータ
+
+        Args:
+            func: 非同期ジェネレーターのgRPCメソッド
+
+        Returns:
+            同期的なgRPCハンドラー
+        """
+        @wraps(func)
+        def wrapper(self: Any, request: Any, context: grpc.ServicerContext) -> Iterator[Any]:  # noqa: ANN401
+            """非同期ジェネレーターを同期的に反復するラッパー
+
+            Args:
+                self: サービサーインスタンス
+                request: gRPCリクエスト
+                context: gRPCコンテキスト
+
+            Yields:
+                gRPCレスポンス
+            """
+            # Tortoiseの接続を作成したイベントループで1件ずつ取り出す
+            responses = func(self, request, context)
+            try:
+                while True:
+                    try:
+                        response = _run_in_handler_loop(_anext(responses))
+                    except StopAsyncIteration:
+                        return
+                    yield response
+            except Exception as e:
+                logger.exception(error_message)
+                context.set_code(grpc.StatusCode.INTERNAL)
+                context.set_details(str(e))
             finally:
-                loop.close()
+                # クライアントの切断などで途中終了した場合もジェネレーターを確実に閉じる
+                _run_in_handler_loop(_aclose(responses))
+
+        @wraps(func)
+        async def aio_wrapper(
+            self: Any,  # noqa: ANN401
+            request: Any,  # noqa: ANN401
+            context: grpc.aio.ServicerContext,
+        ) -> AsyncIterator[Any]:
+            """grpc.aioサーバーのイベントループ上でそのまま反復するラッパー
+
+            Args:
+                self: サービサーインスタンス
+                request: gRPCリクエスト
+                context: gRPCコンテキスト
+
+            Yields:
+                gRPCレスポンス
+            """
+            try:
+                async for response in func(self, request, context):
+                    yield response
+            except Exception as e:
+                logger.exception(error_message)
+                context.set_code(grpc.StatusCode.INTERNAL)
+                context.set_details(str(e))
+
+        wrapper.aio = aio_wrapper  # type: ignore[attr-defined]
         return wrapper
     return decorator
+
+
+async def aiter_requests(request_iterator: Iterable[Any] | AsyncIterable[Any]) -> AsyncIterator[Any]:
+    """クライアントストリーミングのリクエストを非同期イテレーターとして扱う
+
+    grpc.aioサーバーでは非同期イテレーター、スレッドプール型サーバーでは
+    同期イテレーターが渡されるため、どちらも`async for`で反復できるようにします。
+
+    Args:
+        request_iterator: リクエストのイテレーター
+
+    Yields:
+        gRPCリクエスト
+    """
+    if isinstance(request_iterator, AsyncIterable):
+        async for request in request_iterator:
+            yield request
+    else:
+        for request in request_iterator:
+            yield request
+
+
+class AioServicer:
+    """grpc.aioサーバーに登録するためのサービサーアダプター
+
+    `async_grpc_method`で定義されたメソッドをネイティブなコルーチンとして公開し、
+    それ以外の属性は元のサービサーへ委譲します。
+    """
+
+    def __init__(self, servicer: object) -> None:
+        """コンストラクタ
+
+        Args:
+            servicer: 元のサービサー
+        """
+        self._servicer = servicer
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        attr = getattr(self._servicer, name)
+        aio = getattr(attr, "aio", None)
+        if aio is None:
+            return attr
+        return MethodType(aio, self._servicer)
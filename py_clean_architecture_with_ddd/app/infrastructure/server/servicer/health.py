@@ -1,13 +1,14 @@
-import grpc
-
 from app.infrastructure.proto.v1.health import service_pb2, service_pb2_grpc
 
+from .extend import ServicerContext, async_grpc_method
+
 
 class HealthServicer(service_pb2_grpc.HealthServiceServicer):
-    def health_check(
+    @async_grpc_method("Error processing HealthCheck request")
+    async def HealthCheck(
         self,
         _request: service_pb2.HealthCheckRequest,
-        _context: grpc.ServicerContext,
+        _context: ServicerContext,
     ) -> service_pb2.HealthCheckResponse:
         """ヘルスチェックエンドポイントの実装"""
         return service_pb2.HealthCheckResponse(
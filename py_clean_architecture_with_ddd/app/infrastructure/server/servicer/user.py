@@ -1,14 +1,16 @@
 import logging
-
-import grpc
-from injector import Injector
+from collections.abc import AsyncGenerator, AsyncIterable, Iterable
 
 from app.iadapter.controller.user import UserController
+from app.infrastructure.proto.v1.user.batch_get_pb2 import BatchGetUsersRequest, BatchGetUsersResponse
+from app.infrastructure.proto.v1.user.bulk_create_pb2 import BulkCreateUsersResponse
 from app.infrastructure.proto.v1.user.create_pb2 import CreateUserRequest, CreateUserResponse
 from app.infrastructure.proto.v1.user.get_pb2 import GetUserRequest, GetUserResponse
+from app.infrastructure.proto.v1.user.list_pb2 import ListUsersRequest, ListUsersResponse
 from app.infrastructure.proto.v1.user.service_pb2_grpc import UserServiceServicer
+from app.infrastructure.proto.v1.user.update_pb2 import UpdateUserRequest, UpdateUserResponse
 
-from .extend import async_grpc_method
+from .extend import ServicerContext, aiter_requests, async_grpc_method, async_grpc_stream_method
 
 logger = logging.getLogger(__name__)
 
@@ -17,31 +19,65 @@ logger = logging.getLogger(__name__)
 class UserServicer(UserServiceServicer):
     """ユーザー関連のgRPCサービサー実装"""
 
-    def __init__(self, controller: UserController, injector: Injector | None = None) -> None:
+    def __init__(self, controller: UserController) -> None:
         """コンストラクタ
 
         Args:
             controller: ユーザーコントローラー
-            injector: DIコンテナ
         """
         self.controller = controller
-        self.injector = injector
 
     @async_grpc_method("Error processing CreateUser request")
     async def CreateUser(
         self,
         request: CreateUserRequest,
-        _context: grpc.ServicerContext,
+        _context: ServicerContext,
     ) -> CreateUserResponse:
         """ユーザー作成エンドポイント(非同期)"""
         return await self.controller.create_user(request)
 
+    @async_grpc_method("Error processing UpdateUser request")
+    async def UpdateUser(
+        self,
+        request: UpdateUserRequest,
+        _context: ServicerContext,
+    ) -> UpdateUserResponse:
+        """ユーザー更新エンドポイント(非同期)"""
+        return await self.controller.update_user(request)
+
+    @async_grpc_method("Error processing BulkCreateUsers request")
+    async def BulkCreateUsers(
+        self,
+        request_iterator: Iterable[CreateUserRequest] | AsyncIterable[CreateUserRequest],
+        _context: ServicerContext,
+    ) -> BulkCreateUsersResponse:
+        """ユーザー一括作成のクライアントストリーミングエンドポイント(非同期)"""
+        return await self.controller.bulk_create_users(aiter_requests(request_iterator))
+
     @async_grpc_method("Error processing GetUser request")
     async def GetUser(
         self,
         request: GetUserRequest,
-        _context: grpc.ServicerContext,
+        _context: ServicerContext,
     ) -> GetUserResponse:
         """ユーザー取得エンドポイント(非同期)"""
         return await self.controller.get_user_by_id(request)
 
+    @async_grpc_method("Error processing BatchGetUsers request")
+    async def BatchGetUsers(
+        self,
+        request: BatchGetUsersRequest,
+        _context: ServicerContext,
+    ) -> BatchGetUsersResponse:
+        """ユーザー一括取得エンドポイント(非同期)"""
+        return await self.controller.batch_get_users(request)
+
+    @async_grpc_stream_method("Error processing ListUsers request")
+    async def ListUsers(
+        self,
+        request: ListUsersRequest,
+        _context: ServicerContext,
+    ) -> AsyncGenerator[ListUsersResponse]:
+        """ユーザー一覧のサーバーストリーミングエンドポイント(非同期)"""
+        async for response in self.controller.list_users(request):
+            yield response
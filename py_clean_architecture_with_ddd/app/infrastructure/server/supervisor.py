@@ -0,0 +1,121 @@
+import logging
+import multiprocessing
+import signal
+import threading
+import time
+from collections.abc import Callable
+from multiprocessing.connection import wait
+from types import FrameType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+logger = logging.getLogger(__name__)
+
+# この秒数未満で終了したワーカーは起動直後のクラッシュとみなす
+CRASH_LOOP_THRESHOLD = 5.0
+# 再起動までの待機秒数の上限
+MAX_RESTART_BACKOFF = 30.0
+
+
+class WorkerSupervisor:
+    """gRPCサーバーのワーカープロセスを管理するスーパーバイザー
+
+    N個のワーカープロセスを起動し、SO_REUSEPORTで同一ポートを共有させます。
+    クラッシュしたワーカーは再起動し、SIGINT/SIGTERMを受けると全ワーカーを停止します。
+    gRPCはfork後の利用に制約があるため、ワーカーはspawnで起動し、
+    親プロセスではgRPCやTortoiseのオブジェクトを一切作成しません。
+    """
+
+    def __init__(
+        self,
+        target: Callable[[int], None],
+        workers: int,
+        shutdown_timeout: float = 10.0,
+    ) -> None:
+        """コンストラクタ
+
+        Args:
+            target: ワーカー番号を受け取りサーバーを起動するトップレベル関数
+            workers: ワーカープロセス数
+            shutdown_timeout: 停止時にワーカーの終了を待つ時間(秒)
+        """
+        self._target = target
+        self._workers = workers
+        self._shutdown_timeout = shutdown_timeout
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: dict[int, BaseProcess] = {}
+        self._started_at: dict[int, float] = {}
+        self._backoff: dict[int, float] = {}
+        # 再起動の待機中も停止要求で即座に起きられるようにイベントとする
+        self._stop = threading.Event()
+
+    def run(self) -> None:
+        """ワーカーを起動し、停止要求があるまで監視します。"""
+        signal.signal(signal.SIGINT, self._request_stop)
+        signal.signal(signal.SIGTERM, self._request_stop)
+
+        for index in range(self._workers):
+            self._start(index)
+        logger.info("Supervisor started %d workers", self._workers)
+
+        try:
+            while not self._stop.is_set():
+                sentinels = [process.sentinel for process in self._processes.values()]
+                wait(sentinels, timeout=1.0)
+                if self._stop.is_set():
+                    break
+                self._restart_exited()
+        finally:
+            self._shutdown()
+
+    def _start(self, index: int) -> None:
+        process = self._context.Process(
+            target=self._target,
+            args=(index,),
+            name=f"grpc-worker-{index}",
+            daemon=False,
+        )
+        process.start()
+        self._processes[index] = process
+        self._started_at[index] = time.monotonic()
+        logger.info("Worker %d started (pid=%s)", index, process.pid)
+
+    def _restart_exited(self) -> None:
+        for index, process in list(self._processes.items()):
+            if process.is_alive():
+                continue
+            process.join()
+            uptime = time.monotonic() - self._started_at[index]
+            logger.error(
+                "Worker %d (pid=%s) exited with code %s after %.1fs",
+                index, process.pid, process.exitcode, uptime,
+            )
+            # 起動直後のクラッシュを繰り返す場合は指数的に待機時間を伸ばす
+            if uptime < CRASH_LOOP_THRESHOLD:
+                self._backoff[index] = min(self._backoff.get(index, 0.5) * 2, MAX_RESTART_BACKOFF)
+            else:
+                self._backoff[index] = 0.0
+            # 待機中に停止要求を受けた場合は再起動せずに戻る
+            if self._stop.wait(self._backoff[index]):
+                return
+            self._start(index)
+
+    def _request_stop(self, signum: int, _frame: FrameType | None) -> None:
+        logger.warning("Supervisor received signal %d, stopping workers", signum)
+        self._stop.set()
+
+    def _shutdown(self) -> None:
+        for process in self._processes.values():
+            if process.is_alive():
+                process.terminate()
+
+        deadline = time.monotonic() + self._shutdown_timeout
+        for index, process in self._processes.items():
+            process.join(max(deadline - time.monotonic(), 0))
+            if process.is_alive():
+                logger.error("Worker %d (pid=%s) did not stop in time, killing", index, process.pid)
+                process.kill()
+                process.join()
+        logger.warning("All workers have been terminated.")
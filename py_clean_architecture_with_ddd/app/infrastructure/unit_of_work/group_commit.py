@@ -0,0 +1,158 @@
+import asyncio
+import contextlib
+import logging
+import threading
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Generic, NamedTuple, TypeVar
+
+from tortoise.transactions import in_transaction
+
+from app.infrastructure.database import WRITE_CONNECTION
+
+logger = logging.getLogger(__name__)
+
+# 要求毎の変更
+C = TypeVar("C")
+
+
+class _Request(NamedTuple):
+    changes: Any
+    size: int
+    future: asyncio.Future[None]
+
+
+class _Group:
+    """同じトランザクションでコミットする要求の集まり"""
+
+    def __init__(self) -> None:
+        self.requests: list[_Request] = []
+        self.size = 0
+        # 最大件数に達した場合に待機を打ち切る
+        self.full = asyncio.Event()
+
+
+class GroupCommitWriter(Generic[C]):
+    """並行したUnitOfWorkのコミットを1つのトランザクションにまとめる
+
+    最初の要求から`max_delay`秒が経過するか、エンティティ数が`max_batch_size`に達するまでに
+    届いた要求を1つのトランザクションで書き込み、コミット(fsync)の回数を減らします。
+    まとめたトランザクションが失敗した場合は要求毎のトランザクションで書き込み直すため、
+    メールアドレスの一意制約違反などの失敗は、原因となった要求のみに返されます。
+    確定した変更の通知も書き込みと同じタスクで行うため、要求元がキャンセルされても通知は失われません。
+    Futureはイベントループを跨いで待機できないため、要求はイベントループ毎にまとめます。
+    """
+
+    def __init__(
+        self,
+        write: Callable[[Sequence[C]], Awaitable[None]],
+        committed: Callable[[Sequence[C]], None],
+        max_delay: float,
+        max_batch_size: int,
+    ) -> None:
+        """コンストラクタ
+
+        Args:
+            write: トランザクション内で複数の要求の変更をまとめて書き込む関数
+            committed: トランザクションの確定後に、確定した変更を受け取る関数
+            max_delay: まとめるために待機する最大時間 単位は秒
+            max_batch_size: 1つのトランザクションにまとめる最大エンティティ数
+        """
+        self._write = write
+        self._committed = committed
+        self._max_delay = max_delay
+        self._max_batch_size = max_batch_size
+        self._groups: dict[asyncio.AbstractEventLoop, _Group] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._transactions = 0
+        self._requests = 0
+        # スレッドプール型サーバーでは複数スレッドから呼ばれるため保護する
+        self._lock = threading.Lock()
+
+    @property
+    def transactions(self) -> int:
+        """確定したトランザクションの累計"""
+        return self._transactions
+
+    @property
+    def requests(self) -> int:
+        """コミットの要求の累計"""
+        return self._requests
+
+    async def submit(self, changes: C, size: int) -> None:
+        """変更の書き込みを要求し、トランザクションが確定するまで待機する
+
+        Args:
+            changes: 書き込む変更
+            size: 変更するエンティティ数
+
+        Raises:
+            Exception: この要求の書き込みに失敗した場合
+        """
+        loop = asyncio.get_running_loop()
+        request = _Request(changes, size, loop.create_future())
+        with self._lock:
+            self._requests += 1
+            group = self._groups.get(loop)
+            is_first = group is None
+            if group is None:
+                group = self._groups[loop] = _Group()
+            group.requests.append(request)
+            group.size += size
+            if group.size >= self._max_batch_size:
+                # 以降の要求は新しいグループにまとめる
+                del self._groups[loop]
+                group.full.set()
+
+        if is_first:
+            # 要求元がキャンセルされても他の要求の書き込みを継続できるよう、別のタスクで実行する
+            task = loop.create_task(self._run(loop, group))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        await request.future
+
+    async def _run(self, loop: asyncio.AbstractEventLoop, group: _Group) -> None:
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(group.full.wait(), self._max_delay)
+        with self._lock:
+            if self._groups.get(loop) is group:
+                del self._groups[loop]
+        await self._flush(group.requests)
+
+    async def _flush(self, requests: list[_Request]) -> None:
+        """要求をまとめて書き込み、失敗した場合は要求毎に書き込み直す"""
+        if len(requests) > 1:
+            try:
+                await self._write_in_transaction([request.changes for request in requests])
+            # 失敗の原因となった要求を特定するため、種類を問わず要求毎に書き込み直す
+            except Exception:  # noqa: BLE001
+                logger.debug("Group commit of %d requests failed, retrying one by one", len(requests))
+            else:
+                for request in requests:
+                    _set_result(request.future)
+                return
+
+        for request in requests:
+            try:
+                await self._write_in_transaction([request.changes])
+            # 失敗はこの要求の要求元にのみ返す
+            except Exception as e:  # noqa: BLE001
+                _set_result(request.future, e)
+            else:
+                _set_result(request.future)
+
+    async def _write_in_transaction(self, changes: list[Any]) -> None:
+        async with in_transaction(WRITE_CONNECTION):
+            await self._write(changes)
+        self._transactions += 1
+        self._committed(changes)
+
+
+def _set_result(future: asyncio.Future[None], exception: BaseException | None = None) -> None:
+    """要求元に結果を返す 要求元がキャンセル済みの場合は何もしない"""
+    if future.done():
+        return
+    if exception is None:
+        future.set_result(None)
+    else:
+        future.set_exception(exception)
@@ -4,8 +4,10 @@ from typing import TYPE_CHECKING, Any, Self
 
 from tortoise.transactions import in_transaction
 
-from app.application.unit_of_work.user import UserUnitOfWork
-from app.infrastructure.repository.user import WriteUserRepositoryImpl
+from app.application.unit_of_work.user import UserUnitOfWork, UserUnitOfWorkFactory
+from app.infrastructure.database import WRITE_CONNECTION
+from app.infrastructure.repository.user import PendingChanges, WriteUserRepositoryImpl
+from app.infrastructure.unit_of_work.group_commit import GroupCommitWriter
 
 if TYPE_CHECKING:
     from contextlib import AbstractAsyncContextManager
@@ -18,15 +20,22 @@ class UserUnitOfWorkImpl(UserUnitOfWork):
     DataMapperパターンと連携し、リポジトリで蓄積された変更を
     トランザクション内で一括コミットします。
     IdentityMapパターンと連携してエンティティの一意性を保証します。
+    グループコミットを有効にした場合は、並行したUnitOfWorkの変更を1つのトランザクションで書き込みます。
     """
 
-    def __init__(self, users: WriteUserRepositoryImpl) -> None:
+    def __init__(
+        self,
+        users: WriteUserRepositoryImpl,
+        group_commit: GroupCommitWriter[PendingChanges] | None = None,
+    ) -> None:
         """コンストラクタ
 
         Args:
             users: ユーザーリポジトリの実装
+            group_commit: 変更をまとめて書き込むライター Noneの場合はUnitOfWork毎にトランザクションを開始する
         """
         self._users = users
+        self._group_commit = group_commit
         self._transaction_ctx: AbstractAsyncContextManager[Any] | None = None
 
     @property
@@ -38,17 +47,27 @@ class UserUnitOfWorkImpl(UserUnitOfWork):
         """
         return self._users
 
+    @property
+    def group_commit(self) -> GroupCommitWriter[PendingChanges] | None:
+        """変更をまとめて書き込むライター グループコミットが無効の場合はNone"""
+        return self._group_commit
+
     async def __aenter__(self) -> Self:
         """トランザクションを開始します
 
         UnitOfWorkパターンの重要な部分として、この時点でデータベーストランザクションを
         開始します。これにより、複数の操作をアトミックに実行できます。
 
+        グループコミットを有効にした場合、トランザクションは変更の書き込み時に開始します。
+
         Returns:
             Self: このUnitOfWorkインスタンス
         """
-        # トランザクションコンテキストを作成して開始
-        self._transaction_ctx = in_transaction()
+        if self._group_commit is not None:
+            return self
+
+        # トランザクションコンテキストを作成して開始 書き込みは主接続で行う
+        self._transaction_ctx = in_transaction(WRITE_CONNECTION)
         await self._transaction_ctx.__aenter__()
         return self
 
@@ -62,13 +81,17 @@ class UserUnitOfWorkImpl(UserUnitOfWork):
 
         リポジトリで蓄積された変更をトランザクション内でコミットし、
         例外が発生した場合はロールバック、そうでなければコミットします。
-        トランザクション終了後、IdentityMapをクリアして次の操作の準備をします。
+        トランザクション確定後、変更したエンティティのみをIdentityMapから削除します。
 
         Args:
             exc_type: 例外の型
             exc_val: 例外のインスタンス
             exc_tb: トレースバック情報
         """
+        if self._group_commit is not None:
+            await self._exit_group_commit(self._group_commit, exc_type)
+            return
+
         try:
             # 例外が発生していない場合に限り、リポジトリの変更をコミット
             if exc_type is None:
@@ -86,9 +109,71 @@ class UserUnitOfWorkImpl(UserUnitOfWork):
             # トランザクションを終了
             if self._transaction_ctx:
                 await self._transaction_ctx.__aexit__(exc_type, exc_val, exc_tb)
+
+            # トランザクションの確定後に、変更したエンティティをリスナーへ通知
+            if exc_type is None:
+                self._users.publish_committed()
         finally:
-            # 常にリポジトリのクリアを呼び出し、IdentityMapもクリアする
+            # 常にリポジトリの保留中の変更をクリアする
             self._users.clear()
 
             # トランザクションコンテキストをクリア
             self._transaction_ctx = None
+
+    async def _exit_group_commit(
+        self,
+        group_commit: GroupCommitWriter[PendingChanges],
+        exc_type: type[BaseException] | None,
+    ) -> None:
+        """蓄積された変更を並行したUnitOfWorkの変更とまとめて書き込みます
+
+        Args:
+            group_commit: 変更をまとめて書き込むライター
+            exc_type: 例外の型 例外が発生した場合は書き込まずに破棄します
+        """
+        if exc_type is not None:
+            self._users.clear()
+            return
+
+        # 待機中に他のリクエストが保存したエンティティを含めたり破棄したりしないよう、待機前に取り出す
+        changes = self._users.take_pending()
+        entities = changes.entities
+        if not entities:
+            return
+        # 変更したエンティティの通知は、待機中にキャンセルされても行われるようライターが確定後に行う
+        await group_commit.submit(changes, len(entities))
+
+
+class UserUnitOfWorkFactoryImpl(UserUnitOfWorkFactory):
+    """ユースケースの実行毎にUserUnitOfWorkImplを作成するファクトリー
+
+    トランザクションと保留中の変更はUnitOfWork毎に持ち、
+    キャッシュ、コミット後のリスナー、グループコミットはリクエストを跨いで共有します。
+    """
+
+    def __init__(
+        self,
+        users: WriteUserRepositoryImpl,
+        group_commit: GroupCommitWriter[PendingChanges] | None = None,
+    ) -> None:
+        """コンストラクタ
+
+        Args:
+            users: キャッシュとリスナーを共有する元のユーザーリポジトリ
+            group_commit: 変更をまとめて書き込むライター Noneの場合はUnitOfWork毎にトランザクションを開始する
+        """
+        self._users = users
+        self._group_commit = group_commit
+
+    @property
+    def group_commit(self) -> GroupCommitWriter[PendingChanges] | None:
+        """変更をまとめて書き込むライター グループコミットが無効の場合はNone"""
+        return self._group_commit
+
+    def create(self) -> UserUnitOfWorkImpl:
+        """保留中の変更を持たないリポジトリを使用する、新しいUnitOfWorkを作成します
+
+        Returns:
+            UserUnitOfWorkImpl: 新しいUnitOfWork
+        """
+        return UserUnitOfWorkImpl(users=self._users.for_unit_of_work(), group_commit=self._group_commit)
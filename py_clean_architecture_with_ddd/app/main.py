@@ -1,5 +1,15 @@
+import argparse
+import asyncio
+import contextlib
 import logging
+import signal
+import threading
+from collections.abc import Coroutine, Iterable
 from concurrent import futures
+from functools import partial
+from types import FrameType
+from typing import Any, TypeVar
+from uuid import UUID
 
 import grpc
 from grpc_reflection.v1alpha import reflection
@@ -10,13 +20,56 @@ from app.application.interactor.user.command import UserCommandInteractor
 from app.application.interactor.user.query import UserQueryInteractor
 from app.iadapter.controller.user import UserController
 from app.iadapter.presenter.user import UserPresenter
-from app.infrastructure.database import tortoise_config
+from app.infrastructure.database import WRITE_CONNECTION, tortoise_config
+from app.infrastructure.database import config as database_config
+from app.infrastructure.database.sqlite import maintain_periodically
 from app.infrastructure.di.container import DIContainer
 from app.infrastructure.proto.v1.health import service_pb2 as health_service_pb2
 from app.infrastructure.proto.v1.health import service_pb2_grpc as health_service_pb2_grpc
 from app.infrastructure.proto.v1.user import service_pb2 as user_service_pb2
 from app.infrastructure.proto.v1.user import service_pb2_grpc as user_service_pb2_grpc
+from app.infrastructure.proto.v1.user.batch_get_pb2 import BatchGetUsersRequest
+from app.infrastructure.proto.v1.user.get_pb2 import GetUserRequest
+from app.infrastructure.repository.user import ReadUserRepositoryImpl, WriteUserRepositoryImpl
+from app.infrastructure.server import config as server_config
 from app.infrastructure.server import interceptor, servicer
+from app.infrastructure.server.admission import AdmissionController
+from app.infrastructure.server.cache import ResponseCache
+from app.infrastructure.server.interceptor.cache import TagExtractor
+from app.infrastructure.server.metrics import MetricsRegistry, start_metrics_http_server
+from app.infrastructure.server.supervisor import WorkerSupervisor
+from app.infrastructure.unit_of_work.user import UserUnitOfWorkFactoryImpl
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SERVICE_NAMES = (
+    health_service_pb2.DESCRIPTOR.services_by_name["HealthService"].full_name,
+    user_service_pb2.DESCRIPTOR.services_by_name["UserService"].full_name,
+    reflection.SERVICE_NAME,
+)
+
+
+def _user_id_tag(id: str) -> str:
+    """ユーザーIDをキャッシュの無効化に使うタグに正規化する"""
+    try:
+        return str(UUID(id))
+    except ValueError:
+        return id
+
+def _get_user_tags(request: GetUserRequest) -> Iterable[str]:
+    return (_user_id_tag(request.id),)
+
+def _batch_get_users_tags(request: BatchGetUsersRequest) -> Iterable[str]:
+    return [_user_id_tag(id) for id in request.ids]
+
+_USER_SERVICE = user_service_pb2.DESCRIPTOR.services_by_name["UserService"].full_name
+# レスポンスをキャッシュする冪等なRPCと、レスポンスが依存するユーザーIDを取り出す関数
+CACHEABLE_METHODS: dict[str, TagExtractor] = {
+    f"/{_USER_SERVICE}/GetUser": _get_user_tags,
+    f"/{_USER_SERVICE}/BatchGetUsers": _batch_get_users_tags,
+}
 
 
 async def init_db() -> None:
@@ -29,77 +82,345 @@ async def close_db() -> None:
     """データベース接続を閉じる関数"""
     await Tortoise.close_connections()
 
-def serve() -> None:
-    """gRPCサーバーを起動する関数"""
-    # データベースの初期化
-    import asyncio
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(init_db())
-
-    # DIコンテナの初期化
-    injector = Injector([DIContainer()])
-
+def create_user_servicer(injector: Injector) -> servicer.UserServicer:
+    """UserServicerを作成する関数"""
     # インタラクターを取得
     command_interactor = injector.get(UserCommandInteractor)
     query_interactor = injector.get(UserQueryInteractor)
 
-    # Injectが常に新しいプレゼンターを作成する
-    # 初期のコントローラー作成時は一時的にプレゼンターを作成
+    # Injectが常に新しいプレゼンターを作成するため、リクエスト毎にinjectorから取得する
     user_controller = UserController(
         command_interactor=command_interactor,
         query_interactor=query_interactor,
-        presenter=injector.get(UserPresenter),
+        presenter_factory=partial(injector.get, UserPresenter),
+    )
+
+    return servicer.UserServicer(controller=user_controller)
+
+def create_response_cache(injector: Injector, *, reuse_port: bool = False) -> ResponseCache | None:
+    """レスポンスキャッシュを作成し、ユーザーの変更時に無効化されるよう登録する関数
+
+    キャッシュはプロセス毎に保持し、無効化も同じプロセスでのコミットでしか行われません。
+    複数のワーカープロセスで同一ポートを共有する場合は、他のワーカーでの変更後も
+    有効期間まで古いレスポンスを返し続けるため作成しません。
+
+    Args:
+        injector: DIコンテナ
+        reuse_port: 複数プロセスで同一ポートを共有する場合はTrue
+
+    Returns:
+        ResponseCache | None: レスポンスキャッシュ 無効化されている場合はNone
+    """
+    config = server_config.get()
+    if config.response_cache_size <= 0:
+        return None
+    if reuse_port:
+        logger.warning("Response cache is disabled because it cannot be invalidated across worker processes")
+        return None
+
+    cache = ResponseCache(max_entries=config.response_cache_size, ttl=config.response_cache_ttl)
+    injector.get(WriteUserRepositoryImpl).add_commit_listener(
+        lambda users: cache.invalidate(str(user.id) for user in users),
     )
+    return cache
+
+def register_repository_metrics(injector: Injector, metrics: MetricsRegistry) -> None:
+    """リポジトリが保持するカウンターをメトリクスに登録する関数"""
+    singleflight = injector.get(ReadUserRepositoryImpl).singleflight
+    metrics.register_counter(
+        "user_repository_singleflight_calls_total",
+        "Total number of find_by_id/find_by_email lookups that reached the database path.",
+        lambda: singleflight.calls,
+    )
+    metrics.register_counter(
+        "user_repository_singleflight_coalesced_total",
+        "Total number of lookups that shared an in-flight query instead of querying the database.",
+        lambda: singleflight.coalesced,
+    )
+    negative_cache = injector.get(ReadUserRepositoryImpl).negative_cache
+    metrics.register_counter(
+        "user_repository_negative_cache_hits_total",
+        "Total number of lookups answered as not found without querying the database.",
+        lambda: negative_cache.hits,
+    )
+    read_repository = injector.get(ReadUserRepositoryImpl)
+    metrics.register_counter(
+        "user_repository_email_filter_negatives_total",
+        "Total number of email existence checks answered by the bloom filter without querying the database.",
+        lambda: read_repository.email_filter_negatives,
+    )
+    group_commit = injector.get(UserUnitOfWorkFactoryImpl).group_commit
+    if group_commit is not None:
+        metrics.register_counter(
+            "user_unit_of_work_group_commit_requests_total",
+            "Total number of unit of work commits submitted to the group commit writer.",
+            lambda: group_commit.requests,
+        )
+        metrics.register_counter(
+            "user_unit_of_work_group_commit_transactions_total",
+            "Total number of transactions executed by the group commit writer.",
+            lambda: group_commit.transactions,
+        )
+
+async def build_email_filter(injector: Injector) -> None:
+    """登録済みのメールアドレスのBloomフィルターを構築する関数
+
+    起動時と、SIGHUPを受け取った際に呼び出されます。
+    """
+    false_positive_rate = server_config.get().email_filter_false_positive_rate
+    if false_positive_rate <= 0:
+        return
+    try:
+        await injector.get(ReadUserRepositoryImpl).rebuild_email_filter(false_positive_rate=false_positive_rate)
+    except Exception:
+        # 構築に失敗してもフィルターを使わずにDBへ問い合わせるだけなので、起動は継続する
+        logger.exception("Failed to build the email bloom filter")
+
+def create_admission_controller() -> AdmissionController | None:
+    """メソッド毎の同時実行数を制御するコントローラーを作成する関数
+
+    Returns:
+        AdmissionController | None: アドミッション制御 無効化されている場合はNone
+    """
+    config = server_config.get()
+    if config.admission_initial_limit <= 0:
+        return None
+    return AdmissionController(
+        initial_limit=config.admission_initial_limit,
+        max_limit=config.admission_max_limit,
+        latency_threshold=config.admission_latency_threshold,
+    )
+
+def server_options(*, reuse_port: bool) -> list[tuple[str, int]]:
+    """gRPCサーバーのオプションを作成する関数
+
+    Args:
+        reuse_port: 複数プロセスで同一ポートを共有する場合はTrue
+    """
+    return [("grpc.so_reuseport", int(reuse_port))]
+
+def serve_thread(metrics: MetricsRegistry, *, reuse_port: bool = False) -> None:
+    """スレッドプール型のgRPCサーバーを起動する関数
+
+    Tortoiseの接続やロックは作成したイベントループでしか使用できないため、専用のスレッドで
+    イベントループを1つ実行し続け、全てのリクエストをプールのスレッドからそのループで実行します。
+    """
+    config = server_config.get()
+
+    # リクエストを実行するイベントループ
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="handler-loop", daemon=True).start()
+
+    def run(coroutine: Coroutine[Any, Any, T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    # データベースの初期化 リクエストと同じイベントループで接続を確立する
+    run(init_db())
+    servicer.set_handler_loop(loop)
+    # WALのチェックポイントなどの定期メンテナンス
+    maintenance = None
+    if database_config.get().engine == "sqlite" and config.sqlite_maintenance_interval > 0:
+        maintenance = asyncio.run_coroutine_threadsafe(
+            maintain_periodically(WRITE_CONNECTION, config.sqlite_maintenance_interval), loop,
+        )
+
+    # DIコンテナの初期化
+    injector = Injector([DIContainer()])
+    register_repository_metrics(injector, metrics)
+    run(build_email_filter(injector))
+    # SIGHUPでBloomフィルターを再構築する
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(
+            signal.SIGHUP,
+            lambda _signum, _frame: asyncio.run_coroutine_threadsafe(build_email_filter(injector), loop),
+        )
 
     # インターセプターを作成
-    interceptors = [
+    interceptors: list[grpc.ServerInterceptor] = [
+        interceptor.MetricsInterceptor(metrics),
         interceptor.VersionInterceptor(),
     ]
+    cache = create_response_cache(injector, reuse_port=reuse_port)
+    if cache is not None:
+        interceptors.append(interceptor.CacheInterceptor(cache, CACHEABLE_METHODS))
+    # キャッシュにヒットしたリクエストは制限の対象外とするため、キャッシュより内側に配置する
+    admission = create_admission_controller()
+    if admission is not None:
+        interceptors.append(interceptor.AdmissionInterceptor(admission))
 
     # インターセプターを含めたサーバーの作成
     server = grpc.server(
-        futures.ThreadPoolExecutor(max_workers=10),
+        futures.ThreadPoolExecutor(max_workers=config.max_workers),
         interceptors=interceptors,
+        options=server_options(reuse_port=reuse_port),
+        maximum_concurrent_rpcs=config.max_concurrent_rpcs or None,
     )
     health_service_pb2_grpc.add_HealthServiceServicer_to_server(
         servicer.HealthServicer(), server,
     )
-
-    # UserServicerにはinjectをラップするサービサーを使用
-    user_servicer = servicer.UserServicer(
-        controller=user_controller,
-        injector=injector,  # 各リクエスト処理ごとに新しいプレゼンターを取得するためinjectを渡す
-    )
     user_service_pb2_grpc.add_UserServiceServicer_to_server(
-        user_servicer, server,
+        create_user_servicer(injector), server,
     )
 
     # リフレクションサービスの追加
-    service_names = (
-        health_service_pb2.DESCRIPTOR.services_by_name["HealthService"].full_name,
-        user_service_pb2.DESCRIPTOR.services_by_name["UserService"].full_name,
-        reflection.SERVICE_NAME,
-    )
-    reflection.enable_server_reflection(service_names, server)
+    reflection.enable_server_reflection(SERVICE_NAMES, server)
 
-    server.add_insecure_port("[::]:50051")
+    server.add_insecure_port(f"[::]:{config.port}")
     server.start()
-    logger.info("Server started successfully. Listening on port: 50051")
+    logger.info("Server started successfully. Listening on port: %d", config.port)
     try:
         server.wait_for_termination()
     except KeyboardInterrupt:
         server.stop(0)
+        if maintenance is not None:
+            maintenance.cancel()
         # データベース接続を閉じる
-        loop.run_until_complete(close_db())
+        run(close_db())
+        servicer.set_handler_loop(None)
+        loop.call_soon_threadsafe(loop.stop)
         logger.warning("Server has been gracefully terminated.")
 
-if __name__ == "__main__":
+async def serve_aio(metrics: MetricsRegistry, *, reuse_port: bool = False) -> None:
+    """grpc.aioのgRPCサーバーを起動する関数
+
+    サービサー、インターセプター、Tortoiseの接続が全て同一のイベントループ上で動作します。
+    """
+    config = server_config.get()
+
+    # データベースの初期化 サーバーと同じイベントループで接続を確立する
+    await init_db()
+    # WALのチェックポイントなどの定期メンテナンス
+    maintenance = None
+    if database_config.get().engine == "sqlite" and config.sqlite_maintenance_interval > 0:
+        maintenance = asyncio.create_task(
+            maintain_periodically(WRITE_CONNECTION, config.sqlite_maintenance_interval),
+        )
+
+    # DIコンテナの初期化
+    injector = Injector([DIContainer()])
+    register_repository_metrics(injector, metrics)
+    await build_email_filter(injector)
+
+    interceptors: list[grpc.aio.ServerInterceptor] = [
+        interceptor.AioMetricsInterceptor(metrics),
+        interceptor.AioVersionInterceptor(),
+    ]
+    cache = create_response_cache(injector, reuse_port=reuse_port)
+    if cache is not None:
+        interceptors.append(interceptor.AioCacheInterceptor(cache, CACHEABLE_METHODS))
+    # キャッシュにヒットしたリクエストは制限の対象外とするため、キャッシュより内側に配置する
+    admission = create_admission_controller()
+    if admission is not None:
+        interceptors.append(interceptor.AioAdmissionInterceptor(admission))
+
+    server = grpc.aio.server(
+        interceptors=interceptors,
+        options=server_options(reuse_port=reuse_port),
+        maximum_concurrent_rpcs=config.max_concurrent_rpcs or None,
+    )
+    health_service_pb2_grpc.add_HealthServiceServicer_to_server(
+        servicer.AioServicer(servicer.HealthServicer()), server,
+    )
+    user_service_pb2_grpc.add_UserServiceServicer_to_server(
+        servicer.AioServicer(create_user_servicer(injector)), server,
+    )
+
+    # リフレクションサービスの追加
+    reflection.enable_server_reflection(SERVICE_NAMES, server)
+
+    server.add_insecure_port(f"[::]:{config.port}")
+    await server.start()
+    logger.info("Server (aio) started successfully. Listening on port: %d", config.port)
+
+    # SIGTERMで処理中のリクエストを待ってから停止する
+    with contextlib.suppress(NotImplementedError):
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGTERM, lambda: asyncio.ensure_future(server.stop(grace=5)),
+        )
+    # SIGHUPでBloomフィルターを再構築する
+    with contextlib.suppress(NotImplementedError, AttributeError):
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGHUP, lambda: asyncio.ensure_future(build_email_filter(injector)),
+        )
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(grace=5)
+        if maintenance is not None:
+            maintenance.cancel()
+        # データベース接続を閉じる
+        await close_db()
+        logger.warning("Server has been gracefully terminated.")
+
+def serve(*, reuse_port: bool = False, worker_index: int = 0) -> None:
+    """設定されたモードでgRPCサーバーを起動する関数
+
+    Args:
+        reuse_port: 複数プロセスで同一ポートを共有する場合はTrue
+        worker_index: ワーカー番号 メトリクスのポートをワーカー毎にずらすために使用する
+
+    """
+    config = server_config.get()
+
+    # メトリクスはワーカー毎に集計し、ワーカー毎のポートで公開する
+    metrics = MetricsRegistry()
+    metrics_server = None
+    if config.metrics_port:
+        metrics_server = start_metrics_http_server(
+            metrics, config.metrics_port + worker_index, host=config.metrics_host,
+        )
+
+    try:
+        if config.mode == "aio":
+            with contextlib.suppress(KeyboardInterrupt):
+                asyncio.run(serve_aio(metrics, reuse_port=reuse_port))
+            return
+        serve_thread(metrics, reuse_port=reuse_port)
+    finally:
+        if metrics_server is not None:
+            metrics_server.shutdown()
+
+def configure_logging() -> None:
+    """ログ出力を設定する関数"""
     logging.basicConfig(
         level=logging.DEBUG,
-        format="%(asctime)s.%(msecs)03d [%(levelname)s] %(message)s",
+        format="%(asctime)s.%(msecs)03d [%(levelname)s] %(process)d %(message)s",
         datefmt="%Y-%m-%dT%H:%M:%S",
     )
 
-    logger = logging.getLogger(__name__)
+def _raise_keyboard_interrupt(_signum: int, _frame: FrameType | None) -> None:
+    raise KeyboardInterrupt
+
+def run_worker(index: int) -> None:
+    """ワーカープロセスのエントリーポイント
+
+    ワーカー毎にDIコンテナ、Tortoiseの接続、キャッシュを個別に初期化します。
+
+    Args:
+        index: ワーカー番号
+    """
+    configure_logging()
+    # スーパーバイザーからのSIGTERMをKeyboardInterruptとして扱い、通常の停止処理を行う
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    logger.info("Worker %d starting", index)
+    serve(reuse_port=True, worker_index=index)
+
+def main() -> None:
+    """コマンドライン引数を解釈してサーバーを起動する関数"""
+    parser = argparse.ArgumentParser(description="gRPC server")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=server_config.get().workers,
+        help="SO_REUSEPORTで同一ポートを共有するワーカープロセス数",
+    )
+    args = parser.parse_args()
+
+    configure_logging()
+    if args.workers > 1:
+        WorkerSupervisor(target=run_worker, workers=args.workers).run()
+        return
     serve()
+
+if __name__ == "__main__":
+    main()
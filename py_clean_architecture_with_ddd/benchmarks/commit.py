@@ -0,0 +1,52 @@
+"""UnitOfWorkのコミットにかかる時間を件数毎に計測する
+
+    $ uv run python -m benchmarks.commit --sizes 1 100 10000
+"""
+import asyncio
+import logging
+from functools import partial
+
+from app.domain.entity.user import User
+from app.domain.value_object.user.name import UserName
+from app.infrastructure.repository.user import WriteUserRepositoryImpl
+from app.infrastructure.unit_of_work.user import UserUnitOfWorkFactoryImpl
+from benchmarks.support import database, measure, new_users, parser
+
+
+async def insert(factory: UserUnitOfWorkFactoryImpl, batches: list[list[User]], index: int) -> None:
+    async with factory.create() as uow:
+        await uow.users.save_all(batches[index])
+
+
+async def upsert(factory: UserUnitOfWorkFactoryImpl, batches: list[list[User]], index: int) -> None:
+    # 読み込まずに保存した既存のエンティティは INSERT ... ON CONFLICT で書き込む
+    renamed = [
+        user.model_copy(update={"name": UserName(value=f"renamed{position}")})
+        for position, user in enumerate(batches[index])
+    ]
+    async with factory.create() as uow:
+        for user in renamed:
+            await uow.users.save(user)
+
+
+async def main(sizes: list[int], repeat: int) -> None:
+    async with database() as config:
+        factory = UserUnitOfWorkFactoryImpl(users=WriteUserRepositoryImpl())
+        print(f"engine={config.engine} repeat={repeat}")
+        print(f"{'entities':>8} {'insert ms':>10} {'insert/s':>10} {'upsert ms':>10} {'upsert/s':>10}")
+        for size in sizes:
+            batches = [new_users(size, prefix=f"n{size}r{index}x") for index in range(repeat)]
+            inserted = await measure(repeat, partial(insert, factory, batches))
+            upserted = await measure(repeat, partial(upsert, factory, batches))
+            print(
+                f"{size:>8} {inserted * 1000:>10.1f} {size / inserted:>10.0f} "
+                f"{upserted * 1000:>10.1f} {size / upserted:>10.0f}",
+            )
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    argument_parser = parser("UnitOfWorkのコミット時間を計測する")
+    argument_parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10_000], help="1回にコミットする件数")
+    arguments = argument_parser.parse_args()
+    asyncio.run(main(arguments.sizes, arguments.repeat))
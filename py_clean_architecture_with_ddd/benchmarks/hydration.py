@@ -0,0 +1,59 @@
+"""DBから取得した行からユーザーエンティティを構築する時間を、値オブジェクトの共有の有無で比較する
+
+行は計測前に一度だけ取得し、エンティティへの変換のみを計測します。
+日時の列はSQLiteでは文字列、PostgreSQLではdatetimeとしてDBドライバーから返された値のまま変換します。
+
+    $ uv run python -m benchmarks.hydration --rows 100000
+"""
+import asyncio
+import logging
+import statistics
+import timeit
+from collections.abc import Sequence
+from functools import partial
+from typing import Any
+
+from app.domain.entity.user import User
+from app.infrastructure.data_mapper.user import ROW_COLUMNS, UserDataMapper
+from app.infrastructure.database.model.user import UserModel
+from app.infrastructure.repository.user import WriteUserRepositoryImpl
+from app.infrastructure.unit_of_work.user import UserUnitOfWorkFactoryImpl
+from benchmarks.support import database, new_users, parser
+
+data_mapper = UserDataMapper()
+
+
+def validated(rows: Sequence[Sequence[Any]]) -> list[User]:
+    return data_mapper.from_rows(rows, intern=False)
+
+
+def interned(rows: Sequence[Sequence[Any]]) -> list[User]:
+    return data_mapper.from_rows(rows)
+
+
+async def main(count: int, repeat: int) -> None:
+    async with database() as config:
+        factory = UserUnitOfWorkFactoryImpl(users=WriteUserRepositoryImpl())
+        async with factory.create() as uow:
+            await uow.users.save_all(new_users(count))
+        db = UserModel._choose_db()  # noqa: SLF001
+        _, result = await db.execute_query(f"SELECT {', '.join(ROW_COLUMNS)} FROM {UserModel.Meta.table}")  # noqa: S608
+        rows: list[Any] = list(result)
+
+    print(f"engine={config.engine} rows={len(rows)} repeat={repeat}")
+    print(f"{'hydration':>16} {'total ms':>10} {'us/user':>10} {'users/s':>10}")
+    for name, convert in (("validated", validated), ("validated+intern", interned)):
+        # 値オブジェクトの共有は前回の計測で登録されたインスタンスを再利用するため、初回も含めた中央値とする
+        seconds = statistics.median(timeit.repeat(partial(convert, rows), number=1, repeat=repeat))
+        print(
+            f"{name:>16} {seconds * 1000:>10.1f} {seconds / len(rows) * 1_000_000:>10.2f} "
+            f"{len(rows) / seconds:>10.0f}",
+        )
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    argument_parser = parser("行からユーザーエンティティを構築する時間を比較する")
+    argument_parser.add_argument("--rows", type=int, default=100_000, help="変換する件数")
+    arguments = argument_parser.parse_args()
+    asyncio.run(main(arguments.rows, arguments.repeat))
@@ -0,0 +1,73 @@
+"""ユーザーの参照を、モデルを経由しない行の取得とTortoiseモデルの取得で比較する
+
+主キーによる1件ずつの参照と、`id IN (...)`による一括参照のそれぞれについて、
+エンティティへの変換までの時間を計測します。
+
+    $ uv run python -m benchmarks.row_reads --rows 20000 --lookups 5000 --batch 500
+"""
+import asyncio
+import logging
+import random
+from functools import partial
+
+from app.infrastructure.data_mapper.user import UserDataMapper
+from app.infrastructure.database.model.user import UserModel
+from app.infrastructure.repository.user import WriteUserRepositoryImpl, _select_rows
+from app.infrastructure.unit_of_work.user import UserUnitOfWorkFactoryImpl
+from benchmarks.support import database, measure, new_users, parser
+
+data_mapper = UserDataMapper()
+
+
+async def model_lookups(ids: list[str], _index: int) -> None:
+    for id in ids:
+        model = await UserModel.get(id=id)
+        await data_mapper.to_entity(model)
+
+
+async def row_lookups(ids: list[str], _index: int) -> None:
+    for id in ids:
+        rows = await _select_rows("id", [id])
+        data_mapper.from_row(rows[0])
+
+
+async def model_batches(batches: list[list[str]], _index: int) -> None:
+    for batch in batches:
+        data_mapper.to_entities(await UserModel.filter(id__in=batch))
+
+
+async def row_batches(batches: list[list[str]], _index: int) -> None:
+    for batch in batches:
+        data_mapper.from_rows(await _select_rows("id", batch))
+
+
+async def main(rows: int, lookups: int, batch_size: int, repeat: int) -> None:
+    async with database() as config:
+        factory = UserUnitOfWorkFactoryImpl(users=WriteUserRepositoryImpl())
+        seed = new_users(rows)
+        async with factory.create() as uow:
+            await uow.users.save_all(seed)
+
+        ids = random.sample([str(user.id) for user in seed], k=min(lookups, rows))
+        batches = [ids[start:start + batch_size] for start in range(0, len(ids), batch_size)]
+        timings = {
+            "lookup model": await measure(repeat, partial(model_lookups, ids)),
+            "lookup row": await measure(repeat, partial(row_lookups, ids)),
+            f"batch{batch_size} model": await measure(repeat, partial(model_batches, batches)),
+            f"batch{batch_size} row": await measure(repeat, partial(row_batches, batches)),
+        }
+
+        print(f"engine={config.engine} rows={rows} lookups={len(ids)} repeat={repeat}")
+        print(f"{'read':>16} {'total ms':>10} {'us/user':>10}")
+        for name, seconds in timings.items():
+            print(f"{name:>16} {seconds * 1000:>10.1f} {seconds / len(ids) * 1_000_000:>10.1f}")
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    argument_parser = parser("行の取得とモデルの取得によるユーザーの参照時間を比較する")
+    argument_parser.add_argument("--rows", type=int, default=20_000, help="計測前に登録しておく件数")
+    argument_parser.add_argument("--lookups", type=int, default=5000, help="1回の計測で参照する件数")
+    argument_parser.add_argument("--batch", type=int, default=500, help="一括参照の1回あたりの件数")
+    arguments = argument_parser.parse_args()
+    asyncio.run(main(arguments.rows, arguments.lookups, arguments.batch, arguments.repeat))
@@ -0,0 +1,98 @@
+"""SQLITE_PRAGMASの適用前後で、1件ずつのコミットと主キーによる参照の性能を比較する
+
+適用前はTortoiseの既定値(WAL、journal_size_limit、foreign_keysのみ)で接続します。
+
+    $ uv run python -m benchmarks.sqlite_pragmas --rows 50000 --writes 1000
+"""
+import asyncio
+import logging
+import random
+import tempfile
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from app.domain.entity.user import User
+from app.infrastructure.database import build_tortoise_config
+from app.infrastructure.database.config import Config
+from app.infrastructure.database.model.user import UserModel
+from app.infrastructure.database.sqlite import SQLITE_PRAGMAS
+from app.infrastructure.repository.user import WriteUserRepositoryImpl
+from app.infrastructure.unit_of_work.user import UserUnitOfWorkFactoryImpl
+from benchmarks.support import database, measure, new_users, parser
+
+
+def without_pragmas(config: Config) -> dict[str, Any]:
+    """SQLITE_PRAGMASを取り除いたTortoiseの設定を作成する 読み取り専用の指定は残す"""
+    tortoise_config = build_tortoise_config(config)
+    for connection in tortoise_config["connections"].values():
+        connection["credentials"] = {
+            key: value for key, value in connection["credentials"].items() if key not in SQLITE_PRAGMAS
+        }
+    return tortoise_config
+
+
+async def write(factory: UserUnitOfWorkFactoryImpl, batches: list[list[User]], index: int) -> None:
+    for user in batches[index]:
+        async with factory.create() as uow:
+            await uow.users.save(user)
+
+
+async def read(ids: list[str], count: int, _index: int) -> None:
+    for id in random.choices(ids, k=count):
+        await UserModel.get(id=id)
+
+
+async def mixed(
+    factory: UserUnitOfWorkFactoryImpl, batches: list[list[User]], ids: list[str], reads: list[int], index: int,
+) -> None:
+    # 書き込みが終わるまで主キーによる参照を繰り返す
+    writer = asyncio.create_task(write(factory, batches, index))
+    count = 0
+    while not writer.done():
+        await UserModel.get(id=random.choice(ids))
+        count += 1
+    await writer
+    reads.append(count)
+
+
+async def run_profile(
+    name: str, build: Callable[[Config], dict[str, Any]], rows: int, writes: int, repeat: int,
+) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        config = Config(engine="sqlite", sqlite_file=str(Path(directory) / "db.sqlite3"))
+        async with database(config, build):
+            factory = UserUnitOfWorkFactoryImpl(users=WriteUserRepositoryImpl())
+            seed = new_users(rows, prefix="seed")
+            async with factory.create() as uow:
+                await uow.users.save_all(seed)
+            ids = [str(user.id) for user in seed]
+
+            alone = [new_users(writes, prefix=f"alone{index}x") for index in range(repeat)]
+            concurrent = [new_users(writes, prefix=f"mixed{index}x") for index in range(repeat)]
+            reads: list[int] = []
+            write_seconds = await measure(repeat, partial(write, factory, alone))
+            read_seconds = await measure(repeat, partial(read, ids, writes))
+            mixed_seconds = await measure(repeat, partial(mixed, factory, concurrent, ids, reads))
+            mixed_reads = sorted(reads)[len(reads) // 2]
+            print(
+                f"{name:>8} {writes / write_seconds:>10.0f} {writes / read_seconds:>10.0f} "
+                f"{writes / mixed_seconds:>12.0f} {mixed_reads / mixed_seconds:>11.0f}",
+            )
+
+
+async def main(rows: int, writes: int, repeat: int) -> None:
+    print(f"rows={rows} writes={writes} repeat={repeat}")
+    print(f"{'profile':>8} {'writes/s':>10} {'reads/s':>10} {'mixed w/s':>12} {'mixed r/s':>11}")
+    await run_profile("default", without_pragmas, rows, writes, repeat)
+    await run_profile("pragmas", build_tortoise_config, rows, writes, repeat)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    argument_parser = parser("SQLITE_PRAGMASの適用前後の性能を比較する")
+    argument_parser.add_argument("--rows", type=int, default=50_000, help="計測前に登録しておく件数")
+    argument_parser.add_argument("--writes", type=int, default=1000, help="1回の計測でコミットする件数と参照する件数")
+    arguments = argument_parser.parse_args()
+    asyncio.run(main(arguments.rows, arguments.writes, arguments.repeat))
@@ -0,0 +1,109 @@
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from tortoise import Tortoise, connections
+
+from app.domain.entity.user import User
+from app.domain.value_object.user.email import Email
+from app.domain.value_object.user.name import UserName
+from app.infrastructure.database import WRITE_CONNECTION, build_tortoise_config
+from app.infrastructure.database.config import Config
+
+
+def parser(description: str) -> argparse.ArgumentParser:
+    """ベンチマーク共通の引数を持つパーサーを作成する
+
+    Args:
+        description: ベンチマークの説明
+
+    Returns:
+        argparse.ArgumentParser: `--repeat`を持つパーサー
+    """
+    parser = argparse.ArgumentParser(
+        description=f"{description} DATABASE_ENGINE=postgresの場合はDATABASE_*のサーバーのpublicスキーマを作り直す",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="計測の繰り返し回数 中央値を表示する")
+    return parser
+
+
+@asynccontextmanager
+async def database(
+    config: Config | None = None,
+    build: Callable[[Config], dict[str, Any]] = build_tortoise_config,
+) -> AsyncIterator[Config]:
+    """空のスキーマを作成したデータベースに接続する
+
+    Args:
+        config: データベースの設定 省略した場合はDATABASE_ENGINE=postgresであれば環境変数の設定、
+            それ以外は一時ディレクトリのSQLiteを使用します
+        build: データベースの設定からTortoiseの設定を作成する関数
+
+    Yields:
+        Config: 接続したデータベースの設定
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        if config is None:
+            if os.environ.get("DATABASE_ENGINE") == "postgres":
+                config = Config()
+            else:
+                config = Config(engine="sqlite", sqlite_file=str(Path(directory) / "db.sqlite3"))
+        await Tortoise.init(config=build(config))
+        try:
+            if config.engine == "postgres":
+                await connections.get(WRITE_CONNECTION).execute_script(
+                    "DROP SCHEMA public CASCADE; CREATE SCHEMA public;",
+                )
+            await Tortoise.generate_schemas()
+            yield config
+        finally:
+            await Tortoise.close_connections()
+
+
+def new_users(count: int, prefix: str = "user") -> list[User]:
+    """作成日時が1マイクロ秒ずつ異なる保存前のユーザーを作成する
+
+    Args:
+        count: 作成する件数
+        prefix: メールアドレスを一意にするための接頭辞
+
+    Returns:
+        list[User]: ユーザー
+    """
+    now = datetime.now(UTC)
+    return [
+        User(
+            id=uuid4(),
+            name=UserName(value=f"name{index}"),
+            email=Email(value=f"{prefix}{index}@example.com"),
+            created_at=now + timedelta(microseconds=index),
+            updated_at=now + timedelta(microseconds=index),
+        )
+        for index in range(count)
+    ]
+
+
+async def measure(repeat: int, run: Callable[[int], Awaitable[None]]) -> float:
+    """非同期処理の実行時間の中央値を計測する
+
+    Args:
+        repeat: 繰り返し回数
+        run: 計測する処理 何回目の実行かを受け取る
+
+    Returns:
+        float: 実行時間の中央値 単位は秒
+    """
+    timings = []
+    for index in range(repeat):
+        start = time.perf_counter()
+        await run(index)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
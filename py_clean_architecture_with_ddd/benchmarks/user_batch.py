@@ -0,0 +1,133 @@
+"""ListUsersの一覧を、エンティティを経由する場合と`UserBatch`を経由する場合で比較する
+
+DBドライバーが返す形式の行をページ毎に生成し、ListUsersと同じようにページ毎に変換して
+gRPCレスポンスを構築します。行の生成は計測に含めません。
+保持するメモリは、`--memory-rows`件(既定は`--rows`と同じ件数)を一度に変換した結果が確保したサイズを
+tracemallocで計測します。
+名前とメールアドレスの文字列は行と共有するため含みません。
+
+    $ uv run python -m benchmarks.user_batch --rows 1000000
+"""
+import argparse
+import gc
+import logging
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+from app.application.usecase.user import GetUserOutputData
+from app.domain.entity.user import User
+from app.domain.read_model.user import UserBatch
+from app.iadapter.cursor import encode_user_cursor
+from app.iadapter.presenter.user import UserPresenter
+from app.infrastructure.data_mapper.user import UserDataMapper
+from app.infrastructure.proto.v1.user.list_pb2 import ListUsersResponse
+from app.infrastructure.proto.v1.user.model_pb2 import User as ProtoUser
+
+data_mapper = UserDataMapper()
+BASE = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def new_rows(start: int, count: int, *, as_datetime: bool) -> list[tuple[Any, ...]]:
+    """`ROW_COLUMNS`の順に並んだ行を作成する 日時はSQLiteと同じ文字列か、PostgreSQLと同じdatetimeとする"""
+    rows = []
+    for index in range(start, start + count):
+        created_at = BASE + timedelta(microseconds=index)
+        value = created_at if as_datetime else str(created_at)
+        rows.append((str(uuid4()), f"name{index}", f"user{index}@example.com", value, value))
+    return rows
+
+
+def present_entities(users: Sequence[User]) -> list[ListUsersResponse]:
+    """`UserBatch`を導入する前の、エンティティから出力データを経由してレスポンスを構築する処理"""
+    responses = []
+    for user in users:
+        output_data = GetUserOutputData.from_entity(user)
+        responses.append(
+            ListUsersResponse(
+                user=ProtoUser(id=str(output_data.id), name=output_data.name, email=output_data.email),
+                cursor=encode_user_cursor(output_data.created_at, output_data.id),
+            ),
+        )
+    return responses
+
+
+def present_batch(users: UserBatch) -> list[ListUsersResponse]:
+    presenter = UserPresenter()
+    presenter.present_users_listed(users)
+    return presenter.list_users_responses or []
+
+
+def hydrate_entities(rows: Sequence[Sequence[Any]]) -> list[User]:
+    return data_mapper.from_rows(rows, intern=False)
+
+
+PATHS: dict[str, tuple[Callable[[Sequence[Sequence[Any]]], Any], Callable[[Any], list[ListUsersResponse]]]] = {
+    "entities": (hydrate_entities, present_entities),
+    "batch": (data_mapper.to_batch, present_batch),
+}
+
+
+def run(path: str, total: int, page_size: int, *, as_datetime: bool) -> tuple[float, float]:
+    """1ページずつ変換とレスポンスの構築を行い、それぞれの累計時間を返す"""
+    hydrate, present = PATHS[path]
+    hydrate_seconds = present_seconds = 0.0
+    for start in range(0, total, page_size):
+        rows = new_rows(start, min(page_size, total - start), as_datetime=as_datetime)
+        started = time.perf_counter()
+        users = hydrate(rows)
+        hydrated = time.perf_counter()
+        present(users)
+        hydrate_seconds += hydrated - started
+        present_seconds += time.perf_counter() - hydrated
+    return hydrate_seconds, present_seconds
+
+
+def retained_bytes(path: str, count: int, *, as_datetime: bool) -> int:
+    """変換した結果が保持するメモリ"""
+    hydrate, _ = PATHS[path]
+    rows = new_rows(0, count, as_datetime=as_datetime)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        users = hydrate(rows)
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del users
+    return retained
+
+
+def main(total: int, page_size: int, memory_rows: int, *, as_datetime: bool) -> None:
+    print(f"rows={total} page_size={page_size} memory_rows={memory_rows} datetime={'object' if as_datetime else 'str'}")
+    print(f"{'path':>8} {'hydrate s':>10} {'present s':>10} {'us/row':>8} {'B/row':>7}")
+    for path in PATHS:
+        hydrate_seconds, present_seconds = run(path, total, page_size, as_datetime=as_datetime)
+        per_row = retained_bytes(path, memory_rows, as_datetime=as_datetime) / memory_rows
+        print(
+            f"{path:>8} {hydrate_seconds:>10.1f} {present_seconds:>10.1f} "
+            f"{(hydrate_seconds + present_seconds) / total * 1_000_000:>8.1f} {per_row:>7.0f}",
+        )
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    argument_parser = argparse.ArgumentParser(description="エンティティとUserBatchによるユーザー一覧の構築を比較する")
+    argument_parser.add_argument("--rows", type=int, default=1_000_000, help="変換する合計件数")
+    argument_parser.add_argument("--page-size", type=int, default=500, help="1回に変換する件数")
+    argument_parser.add_argument(
+        "--memory-rows", type=int, default=None, help="保持するメモリを計測する件数 省略時は--rowsと同じ件数",
+    )
+    argument_parser.add_argument(
+        "--as-datetime", action="store_true", help="日時をPostgreSQLのドライバーと同じdatetimeで渡す",
+    )
+    arguments = argument_parser.parse_args()
+    main(
+        arguments.rows,
+        arguments.page_size,
+        arguments.memory_rows or arguments.rows,
+        as_datetime=arguments.as_datetime,
+    )
@@ -0,0 +1,55 @@
+from app.application.identity_map.user import UserIdentityMap
+from tests.factory import new_user
+
+
+def test_add_is_kept_when_another_user_is_removed_during_the_fill() -> None:
+    identity_map = UserIdentityMap()
+    user = new_user()
+    generation = identity_map.generation
+
+    identity_map.remove(new_user().id)
+    identity_map.add(user, generation)
+
+    assert identity_map.get(user.id) is user
+    assert identity_map.get_by_email(user.email.value) is user
+
+
+def test_add_is_dropped_when_the_user_is_removed_during_the_fill() -> None:
+    identity_map = UserIdentityMap()
+    user = new_user()
+    generation = identity_map.generation
+
+    identity_map.remove(user.id)
+    identity_map.add(user, generation)
+
+    assert identity_map.get(user.id) is None
+    assert identity_map.get_by_email(user.email.value) is None
+    # 削除後に開始した取得は登録する
+    identity_map.add(user, identity_map.generation)
+    assert identity_map.get(user.id) is user
+
+
+def test_add_is_dropped_when_removal_records_were_forgotten() -> None:
+    identity_map = UserIdentityMap(max_entries=2)
+    user = new_user()
+    generation = identity_map.generation
+
+    identity_map.remove(user.id)
+    identity_map.remove(new_user().id)
+    identity_map.remove(new_user().id)
+    identity_map.add(user, generation)
+
+    assert identity_map.get(user.id) is None
+
+
+def test_add_is_dropped_when_the_map_is_cleared_during_the_fill() -> None:
+    identity_map = UserIdentityMap()
+    user = new_user()
+    generation = identity_map.generation
+
+    identity_map.clear()
+    identity_map.add(user, generation)
+
+    assert identity_map.get(user.id) is None
+    identity_map.add(user, identity_map.generation)
+    assert identity_map.get(user.id) is user
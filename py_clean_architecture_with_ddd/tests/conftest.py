@@ -0,0 +1,154 @@
+import asyncio
+import os
+from collections.abc import AsyncIterator, Iterator
+from concurrent import futures
+from pathlib import Path
+
+import grpc
+import pytest
+from injector import Injector
+from tortoise import Tortoise, connections
+
+from app.infrastructure.database import WRITE_CONNECTION, build_tortoise_config
+from app.infrastructure.database.config import Config as DatabaseConfig
+from app.infrastructure.di.container import DIContainer
+from app.infrastructure.proto.v1.user import service_pb2_grpc as user_service_pb2_grpc
+from app.infrastructure.server import config as server_config
+from app.infrastructure.server import interceptor, servicer
+from app.main import CACHEABLE_METHODS, create_response_cache, create_user_servicer
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--database",
+        choices=("sqlite", "postgres"),
+        default=os.environ.get("TEST_DATABASE_ENGINE", "sqlite"),
+        help=(
+            "テストに使用するデータベース postgresの場合はDATABASE_HOSTなどの環境変数で指定したサーバー、"
+            "未指定の場合はpgserverで起動した使い捨てのサーバーを使用する"
+        ),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _server_config() -> Iterator[None]:
+    """テスト毎に環境変数からサーバーの設定を読み直す
+
+    設定を変更するテストは`server_env`を上書きします。
+    """
+    server_config.get.cache_clear()
+    yield
+    server_config.get.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def postgres_config(tmp_path_factory: pytest.TempPathFactory) -> Iterator[DatabaseConfig]:
+    """テストに使用するPostgreSQLの設定
+
+    DATABASE_HOSTが設定されている場合はそのサーバーを使用し、テスト毎にpublicスキーマを作り直します。
+    """
+    if "DATABASE_HOST" in os.environ:
+        yield DatabaseConfig(engine="postgres")
+        return
+
+    pgserver = pytest.importorskip("pgserver", reason="DATABASE_HOSTかpgserverが必要です")
+    server = pgserver.get_server(tmp_path_factory.mktemp("pgdata"), cleanup_mode="delete")
+    info = server.get_postmaster_info()
+    try:
+        yield DatabaseConfig(engine="postgres", host=str(info.socket_dir), port=info.port, name="postgres")
+    finally:
+        server.cleanup()
+
+
+@pytest.fixture
+async def database(request: pytest.FixtureRequest, tmp_path: Path) -> AsyncIterator[DatabaseConfig]:
+    """空のスキーマを作成したデータベースに接続する"""
+    config: DatabaseConfig
+    if request.config.getoption("--database") == "postgres":
+        config = request.getfixturevalue("postgres_config")
+    else:
+        # 読み取り用と書き込み用の2つの接続で共有するため、インメモリではなくファイルとする
+        config = DatabaseConfig(engine="sqlite", sqlite_file=str(tmp_path / "db.sqlite3"))
+
+    await Tortoise.init(config=build_tortoise_config(config))
+    if config.engine == "postgres":
+        await connections.get(WRITE_CONNECTION).execute_script(
+            "DROP SCHEMA public CASCADE; CREATE SCHEMA public;",
+        )
+    await Tortoise.generate_schemas()
+    try:
+        yield config
+    finally:
+        await Tortoise.close_connections()
+
+
+@pytest.fixture
+def server_env() -> dict[str, str]:
+    """サーバーの設定を変更する環境変数 テストで同名の引数を`parametrize`して上書きする"""
+    return {}
+
+
+@pytest.fixture
+def injector(
+    database: DatabaseConfig,  # noqa: ARG001
+    server_env: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> Injector:
+    for key, value in server_env.items():
+        monkeypatch.setenv(key, value)
+    server_config.get.cache_clear()
+    return Injector([DIContainer()])
+
+
+@pytest.fixture
+async def user_stub(injector: Injector) -> AsyncIterator[user_service_pb2_grpc.UserServiceStub]:
+    """プロセス内で起動したgRPCサーバーに接続するUserServiceのスタブ
+
+    `SERVER_MODE=thread`の場合はスレッドプール型のサーバーを起動し、Tortoiseの接続を作成した
+    テストのイベントループでハンドラーを実行します。
+    """
+    if server_config.get().mode == "thread":
+        async for stub in _thread_user_stub(injector):
+            yield stub
+        return
+
+    interceptors: list[grpc.aio.ServerInterceptor] = []
+    cache = create_response_cache(injector)
+    if cache is not None:
+        interceptors.append(interceptor.AioCacheInterceptor(cache, CACHEABLE_METHODS))
+
+    server = grpc.aio.server(interceptors=interceptors)
+    user_service_pb2_grpc.add_UserServiceServicer_to_server(
+        servicer.AioServicer(create_user_servicer(injector)), server,
+    )
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    try:
+        async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+            yield user_service_pb2_grpc.UserServiceStub(channel)
+    finally:
+        await server.stop(None)
+
+
+async def _thread_user_stub(injector: Injector) -> AsyncIterator[user_service_pb2_grpc.UserServiceStub]:
+    interceptors: list[grpc.ServerInterceptor] = []
+    cache = create_response_cache(injector)
+    if cache is not None:
+        interceptors.append(interceptor.CacheInterceptor(cache, CACHEABLE_METHODS))
+
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=server_config.get().max_workers),
+        interceptors=interceptors,
+    )
+    user_service_pb2_grpc.add_UserServiceServicer_to_server(create_user_servicer(injector), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    servicer.set_handler_loop(asyncio.get_running_loop())
+    server.start()
+    try:
+        # テストのイベントループをハンドラーが使用するため、クライアントもgrpc.aioで待機する
+        async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+            yield user_service_pb2_grpc.UserServiceStub(channel)
+    finally:
+        # 停止を待つ間もハンドラーを実行できるよう、別スレッドで停止する
+        await asyncio.to_thread(server.stop(None).wait)
+        servicer.set_handler_loop(None)
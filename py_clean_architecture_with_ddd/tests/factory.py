@@ -0,0 +1,27 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from app.domain.entity.user import User
+from app.domain.value_object.user.email import Email
+from app.domain.value_object.user.name import UserName
+
+
+def new_user(name: str = "taro", email: str | None = None) -> User:
+    """テスト用のユーザーを作成する
+
+    Args:
+        name: ユーザー名
+        email: メールアドレス 省略した場合は一意なアドレスを生成します
+
+    Returns:
+        User: 保存されていないユーザー
+    """
+    id = uuid4()
+    now = datetime.now(UTC)
+    return User(
+        id=id,
+        name=UserName(value=name),
+        email=Email(value=email or f"{id.hex}@example.com"),
+        created_at=now,
+        updated_at=now,
+    )
@@ -0,0 +1,63 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from tortoise.timezone import localtime
+
+from app.domain.entity.user import User
+from app.domain.value_object.user.email import Email
+from app.domain.value_object.user.exceptions import InvalidEmailError
+from app.domain.value_object.user.name import UserName
+from app.infrastructure.data_mapper.user import UserDataMapper
+
+NOW = datetime(2026, 10, 18, 5, 46, 20, 123456, tzinfo=UTC)
+
+
+@pytest.mark.parametrize("created_at", [str(NOW), NOW], ids=["sqlite", "postgres"])
+@pytest.mark.parametrize("intern", [True, False], ids=["interned", "not_interned"])
+def test_user_from_row_is_equivalent_to_constructed_user(created_at: str | datetime, *, intern: bool) -> None:
+    id = uuid4()
+    row = (str(id), "taro", "taro@example.com", created_at, created_at)
+
+    hydrated = UserDataMapper().from_row(row, intern=intern)
+    expected = User(
+        id=id,
+        created_at=localtime(NOW),
+        updated_at=localtime(NOW),
+        name=UserName(value="taro"),
+        email=Email(value="taro@example.com"),
+    )
+
+    assert hydrated == expected
+    assert hydrated.name == expected.name
+    assert hydrated.email == expected.email
+    assert hydrated.model_dump() == expected.model_dump()
+    assert hydrated.model_dump_json() == expected.model_dump_json()
+    assert repr(hydrated) == repr(expected)
+    assert hydrated.model_fields_set == expected.model_fields_set
+    # 複製して更新しても元のエンティティは変わらない
+    renamed = hydrated.model_copy(update={"name": UserName(value="jiro")})
+    assert (renamed.name.value, hydrated.name.value) == ("jiro", "taro")
+
+
+@pytest.mark.parametrize("created_at", [str(NOW), NOW], ids=["sqlite", "postgres"])
+def test_batch_holds_the_same_values_as_entities(created_at: str | datetime) -> None:
+    rows = [(str(uuid4()), f"user{i}", f"user{i}@example.com", created_at, created_at) for i in range(3)]
+    data_mapper = UserDataMapper()
+
+    batch = data_mapper.to_batch(rows)
+    entities = data_mapper.from_rows(rows, intern=False)
+
+    assert len(batch) == len(entities)
+    for view, entity in zip(batch, entities, strict=True):
+        assert (view.id, view.name, view.email) == (entity.id, entity.name.value, entity.email.value)
+        assert view.created_at == entity.created_at
+        assert view.created_at.tzinfo == UTC
+    assert list(batch.iter_ids()) == [entity.id for entity in entities]
+
+
+def test_invalid_row_is_rejected() -> None:
+    row = (str(uuid4()), "taro", "not an email", str(NOW), str(NOW))
+
+    with pytest.raises(InvalidEmailError):
+        UserDataMapper().from_row(row, intern=False)
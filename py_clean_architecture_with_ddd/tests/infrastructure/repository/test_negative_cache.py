@@ -0,0 +1,37 @@
+from app.infrastructure.repository.negative_cache import NegativeCache
+
+
+def test_discarding_another_key_does_not_prevent_recording() -> None:
+    cache = NegativeCache()
+    generation = cache.generation
+
+    # 問い合わせ中に無関係なキーが作成された
+    cache.discard("other")
+    cache.add("missing", generation)
+
+    assert cache.contains("missing")
+
+
+def test_key_discarded_during_lookup_is_not_recorded() -> None:
+    cache = NegativeCache()
+    generation = cache.generation
+
+    cache.discard("created")
+    cache.add("created", generation)
+
+    assert not cache.contains("created")
+    # 削除後に開始した問い合わせは記録する
+    cache.add("created", cache.generation)
+    assert cache.contains("created")
+
+
+def test_lookup_older_than_forgotten_discards_is_not_recorded() -> None:
+    cache = NegativeCache(max_entries=1)
+    generation = cache.generation
+
+    cache.discard("created")
+    # 記録できる削除の数を超え、"created"の削除の記録は失われる
+    cache.discard("other")
+    cache.add("created", generation)
+
+    assert not cache.contains("created")
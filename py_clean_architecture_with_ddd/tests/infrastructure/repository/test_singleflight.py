@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.repository.singleflight import SingleFlight
+
+
+async def test_cancelling_the_first_caller_does_not_cancel_waiting_callers() -> None:
+    singleflight = SingleFlight()
+    started = asyncio.Event()
+    release = asyncio.Event()
+    executions = 0
+
+    async def query() -> str:
+        nonlocal executions
+        executions += 1
+        started.set()
+        await release.wait()
+        return "result"
+
+    leader = asyncio.create_task(singleflight.do("key", query))
+    await started.wait()
+    follower = asyncio.create_task(singleflight.do("key", query))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    release.set()
+
+    async with asyncio.timeout(1):
+        assert await follower == "result"
+    assert executions == 1
+    assert singleflight.coalesced == 1
+
+
+async def test_exception_is_shared_with_waiting_callers() -> None:
+    singleflight = SingleFlight()
+    release = asyncio.Event()
+
+    async def query() -> None:
+        await release.wait()
+        raise LookupError
+
+    callers = [asyncio.create_task(singleflight.do("key", query)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*callers, return_exceptions=True)
+    assert [type(result) for result in results] == [LookupError, LookupError]
+    assert singleflight.calls == 2
+    assert singleflight.coalesced == 1
@@ -0,0 +1,61 @@
+import pytest
+from tortoise.transactions import in_transaction
+
+from app.application.identity_map.user import UserIdentityMap
+from app.infrastructure.database import WRITE_CONNECTION
+from app.infrastructure.repository.user import ReadUserRepositoryImpl, WriteUserRepositoryImpl
+from tests.factory import new_user
+
+pytestmark = pytest.mark.usefixtures("database")
+
+
+async def test_committed_users_are_read_from_read_connection() -> None:
+    read_repository = ReadUserRepositoryImpl(identity_map=UserIdentityMap())
+    write_repository = WriteUserRepositoryImpl(read_repository=read_repository)
+    users = [new_user(name=f"user{i}") for i in range(3)]
+
+    await write_repository.save_all(users)
+    async with in_transaction(WRITE_CONNECTION):
+        await write_repository.commit()
+    write_repository.publish_committed()
+
+    found = await read_repository.find_by_ids([user.id for user in users])
+    assert {id: user.email_address for id, user in found.items()} == {user.id: user.email_address for user in users}
+    assert (await read_repository.find_by_email(users[0].email_address)).id == users[0].id
+    assert await read_repository.find_existing_emails([user.email_address for user in users]) == {
+        user.email_address for user in users
+    }
+
+
+async def test_find_page_batch_orders_by_created_at_and_id() -> None:
+    read_repository = ReadUserRepositoryImpl(identity_map=UserIdentityMap())
+    write_repository = WriteUserRepositoryImpl(read_repository=read_repository)
+    users = [new_user(name=f"user{i}") for i in range(5)]
+
+    await write_repository.save_all(users)
+    async with in_transaction(WRITE_CONNECTION):
+        await write_repository.commit()
+
+    first = await read_repository.find_page_batch(3)
+    last = first[-1]
+    second = await read_repository.find_page_batch(3, after=(last.created_at, last.id))
+
+    expected = sorted(users, key=lambda user: (user.created_at, user.id))
+    assert [*first.iter_ids(), *second.iter_ids()] == [user.id for user in expected]
+
+
+async def test_rebuild_email_filter_scans_every_page(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.infrastructure.repository.user.EMAIL_FILTER_SCAN_BATCH_SIZE", 2)
+    read_repository = ReadUserRepositoryImpl(identity_map=UserIdentityMap())
+    write_repository = WriteUserRepositoryImpl(read_repository=read_repository)
+    users = [new_user(name=f"user{i}") for i in range(5)]
+
+    await write_repository.save_all(users)
+    async with in_transaction(WRITE_CONNECTION):
+        await write_repository.commit()
+    await read_repository.rebuild_email_filter()
+
+    for user in users:
+        assert await read_repository.exists_by_email(user.email_address)
+    assert not await read_repository.exists_by_email("missing@example.com")
+    assert read_repository.email_filter_negatives == 1
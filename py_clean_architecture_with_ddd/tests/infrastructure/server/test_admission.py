@@ -0,0 +1,162 @@
+import asyncio
+import gc
+from collections.abc import AsyncIterator
+from typing import Any
+
+import grpc
+import pytest
+
+from app.infrastructure.server.admission import AdmissionController, AimdLimiter
+from app.infrastructure.server.interceptor import AdmissionInterceptor, AioAdmissionInterceptor
+
+LATENCY_THRESHOLD = 0.05
+
+
+class _Context:
+    """期限のないgrpc.aioのコンテキスト"""
+
+    def time_remaining(self) -> float | None:
+        return None
+
+    async def abort(self, code: grpc.StatusCode, details: str) -> None:
+        raise AssertionError(code, details)
+
+
+class _AbortError(Exception):
+    def __init__(self, code: grpc.StatusCode) -> None:
+        super().__init__(code)
+        self.code = code
+
+
+class _SyncContext:
+    """スレッドプール型サーバーのコンテキスト"""
+
+    def __init__(self, time_remaining: float | None = None) -> None:
+        self._time_remaining = time_remaining
+
+    def time_remaining(self) -> float | None:
+        return self._time_remaining
+
+    def abort(self, code: grpc.StatusCode, _details: str) -> None:
+        raise _AbortError(code)
+
+
+def _details() -> Any:  # noqa: ANN401
+    return type("Details", (), {"method": "/test/Method", "invocation_metadata": ()})()
+
+
+def _intercept_sync(controller: AdmissionController, handler: grpc.RpcMethodHandler) -> Any:  # noqa: ANN401
+    return AdmissionInterceptor(controller).intercept_service(lambda _details: handler, _details())
+
+
+async def _intercept(controller: AdmissionController, handler: grpc.RpcMethodHandler) -> Any:  # noqa: ANN401
+    """grpc.aioのハンドラーは非同期関数のため、同期関数として型付けされた`RpcMethodHandler`とはしない"""
+    async def continuation(_details: grpc.HandlerCallDetails) -> grpc.RpcMethodHandler:
+        return handler
+
+    return await AioAdmissionInterceptor(controller).intercept_service(continuation, _details())
+
+
+def test_release_without_latency_does_not_back_off() -> None:
+    limiter = AimdLimiter(initial_limit=10, latency_threshold=LATENCY_THRESHOLD)
+
+    assert limiter.try_acquire()
+    limiter.release(None)
+    assert limiter.limit == 10
+
+    assert limiter.try_acquire()
+    limiter.release(None, overloaded=True)
+    assert limiter.limit == 9
+
+
+async def test_slow_stream_consumer_does_not_back_off() -> None:
+    controller = AdmissionController(initial_limit=10, max_limit=100, latency_threshold=LATENCY_THRESHOLD)
+
+    async def list_items(_request: object, _context: object) -> AsyncIterator[int]:
+        for item in range(3):
+            yield item
+
+    handler = await _intercept(controller, grpc.unary_stream_rpc_method_handler(list_items))
+    received = []
+    async for item in handler.unary_stream(None, _Context()):
+        received.append(item)
+        # クライアントの受信が遅く、ストリーム全体では閾値を超える
+        await asyncio.sleep(LATENCY_THRESHOLD)
+
+    assert received == [0, 1, 2]
+    assert controller.limiter("/test/Method").limit == 10
+
+
+async def test_slow_first_stream_response_backs_off() -> None:
+    controller = AdmissionController(initial_limit=10, max_limit=100, latency_threshold=LATENCY_THRESHOLD)
+
+    async def list_items(_request: object, _context: object) -> AsyncIterator[int]:
+        await asyncio.sleep(LATENCY_THRESHOLD * 2)
+        yield 0
+
+    handler = await _intercept(controller, grpc.unary_stream_rpc_method_handler(list_items))
+    async for _ in handler.unary_stream(None, _Context()):
+        pass
+
+    assert controller.limiter("/test/Method").limit == 9
+
+
+async def test_slow_client_stream_does_not_back_off() -> None:
+    controller = AdmissionController(initial_limit=10, max_limit=100, latency_threshold=LATENCY_THRESHOLD)
+
+    async def bulk_create(requests: AsyncIterator[int], _context: object) -> int:
+        return sum([request async for request in requests])
+
+    async def slow_requests() -> AsyncIterator[int]:
+        for request in range(3):
+            await asyncio.sleep(LATENCY_THRESHOLD)
+            yield request
+
+    handler = await _intercept(controller, grpc.stream_unary_rpc_method_handler(bulk_create))
+
+    assert await handler.stream_unary(slow_requests(), _Context()) == 3
+    assert controller.limiter("/test/Method").limit == 10
+
+
+def test_queued_requests_count_towards_the_limit() -> None:
+    controller = AdmissionController(initial_limit=1, max_limit=100, latency_threshold=LATENCY_THRESHOLD)
+    handler = grpc.unary_unary_rpc_method_handler(lambda request, _context: request)
+
+    # 1件目はスレッドプールの待ち行列にあり、まだ実行されていない
+    queued = _intercept_sync(controller, handler)
+    rejected = _intercept_sync(controller, handler)
+
+    with pytest.raises(_AbortError) as aborted:
+        rejected.unary_unary("request", _SyncContext())
+    assert aborted.value.code == grpc.StatusCode.RESOURCE_EXHAUSTED
+    assert queued.unary_unary("request", _SyncContext()) == "request"
+    assert controller.limiter("/test/Method").in_flight == 0
+
+
+def test_request_expired_in_queue_is_dropped() -> None:
+    controller = AdmissionController(initial_limit=10, max_limit=100, latency_threshold=LATENCY_THRESHOLD)
+    handled = []
+    handler = _intercept_sync(
+        controller, grpc.unary_unary_rpc_method_handler(lambda request, _context: handled.append(request)),
+    )
+
+    with pytest.raises(_AbortError) as aborted:
+        handler.unary_unary("request", _SyncContext(time_remaining=0))
+
+    assert aborted.value.code == grpc.StatusCode.DEADLINE_EXCEEDED
+    assert handled == []
+    limiter = controller.limiter("/test/Method")
+    assert limiter.in_flight == 0
+    assert limiter.limit == 9
+
+
+def test_handler_dropped_without_running_releases_its_permit() -> None:
+    controller = AdmissionController(initial_limit=10, max_limit=100, latency_threshold=LATENCY_THRESHOLD)
+    handler = _intercept_sync(controller, grpc.unary_unary_rpc_method_handler(lambda request, _context: request))
+    assert controller.limiter("/test/Method").in_flight == 1
+
+    # 待ち行列の間にクライアントがキャンセルすると、ハンドラーは呼ばれずに破棄される
+    del handler
+    gc.collect()
+
+    assert controller.limiter("/test/Method").in_flight == 0
@@ -0,0 +1,48 @@
+from app.infrastructure.server.cache import ResponseCache
+
+
+def test_put_is_kept_when_unrelated_tags_are_invalidated() -> None:
+    cache = ResponseCache(max_entries=10, ttl=60)
+    generation = cache.generation
+
+    cache.invalidate(["other"])
+    cache.put(("GetUser", b"a"), b"body", ["a"], generation)
+
+    assert cache.get(("GetUser", b"a")) == b"body"
+
+
+def test_put_is_dropped_when_its_tag_is_invalidated_during_the_fill() -> None:
+    cache = ResponseCache(max_entries=10, ttl=60)
+    generation = cache.generation
+
+    cache.invalidate(["a"])
+    cache.put(("BatchGetUsers", b"ab"), b"stale", ["b", "a"], generation)
+
+    assert cache.get(("BatchGetUsers", b"ab")) is None
+    # 無効化後に開始した取得は保存する
+    cache.put(("BatchGetUsers", b"ab"), b"fresh", ["b", "a"], cache.generation)
+    assert cache.get(("BatchGetUsers", b"ab")) == b"fresh"
+
+
+def test_put_is_dropped_when_invalidation_records_were_forgotten() -> None:
+    cache = ResponseCache(max_entries=2, ttl=60)
+    generation = cache.generation
+
+    # 記録できる数を超えて無効化すると、最初に無効化したタグは判定できなくなる
+    cache.invalidate(["a"])
+    cache.invalidate(["b"])
+    cache.invalidate(["c"])
+    cache.put(("GetUser", b"a"), b"stale", ["a"], generation)
+
+    assert cache.get(("GetUser", b"a")) is None
+
+
+def test_invalidate_removes_entries_with_the_tag() -> None:
+    cache = ResponseCache(max_entries=10, ttl=60)
+    cache.put(("GetUser", b"a"), b"a", ["a"], cache.generation)
+    cache.put(("GetUser", b"b"), b"b", ["b"], cache.generation)
+
+    cache.invalidate(["a"])
+
+    assert cache.get(("GetUser", b"a")) is None
+    assert cache.get(("GetUser", b"b")) == b"b"
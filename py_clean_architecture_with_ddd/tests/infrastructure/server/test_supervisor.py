@@ -0,0 +1,37 @@
+import signal
+import threading
+import time
+
+import pytest
+
+from app.infrastructure.server.supervisor import MAX_RESTART_BACKOFF, WorkerSupervisor
+
+
+class ExitedProcess:
+    pid = 1
+    exitcode = 1
+
+    def is_alive(self) -> bool:
+        return False
+
+    def join(self, _timeout: float | None = None) -> None:
+        pass
+
+
+def test_stop_request_interrupts_the_restart_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    supervisor = WorkerSupervisor(target=print, workers=1)
+    started: list[int] = []
+    monkeypatch.setattr(supervisor, "_start", started.append)
+    # 起動直後のクラッシュを繰り返しており、最大の待機時間で再起動を待つ
+    supervisor._processes[0] = ExitedProcess()  # type: ignore[assignment]  # noqa: SLF001
+    supervisor._started_at[0] = time.monotonic()  # noqa: SLF001
+    supervisor._backoff[0] = MAX_RESTART_BACKOFF  # noqa: SLF001
+
+    timer = threading.Timer(0.1, supervisor._request_stop, args=(signal.SIGTERM, None))  # noqa: SLF001
+    timer.start()
+    started_at = time.monotonic()
+    supervisor._restart_exited()  # noqa: SLF001
+    timer.join()
+
+    assert time.monotonic() - started_at < MAX_RESTART_BACKOFF / 2
+    assert started == []
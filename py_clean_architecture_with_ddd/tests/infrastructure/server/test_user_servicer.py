@@ -0,0 +1,78 @@
+import asyncio
+import random
+
+import pytest
+
+from app.infrastructure.proto.v1.user.batch_get_pb2 import BatchGetUsersRequest, BatchGetUsersResponse
+from app.infrastructure.proto.v1.user.create_pb2 import CreateUserRequest, CreateUserResponse
+from app.infrastructure.proto.v1.user.get_pb2 import GetUserRequest, GetUserResponse
+from app.infrastructure.proto.v1.user.model_pb2 import User
+from app.infrastructure.proto.v1.user.service_pb2_grpc import UserServiceStub
+
+# 同時に発行するリクエスト数 取得と作成を合わせて4倍の呼び出しを行う
+CONCURRENCY = 1000
+# スレッドプール型サーバーの環境変数 CreateUserはデモのための1秒の遅延の間もスレッドを占有するためワーカーを増やす
+SERVER_MODE_ENVS = {
+    "aio": {"SERVER_MODE": "aio"},
+    "thread": {"SERVER_MODE": "thread", "SERVER_MAX_WORKERS": "250"},
+}
+
+
+def create_request(index: int) -> CreateUserRequest:
+    return CreateUserRequest(user=User(name=f"user{index}", email=f"user{index}@example.com"))
+
+
+@pytest.mark.parametrize(
+    "server_env",
+    [
+        {**mode_env, **env}
+        for mode_env in SERVER_MODE_ENVS.values()
+        for env in ({}, {"SERVER_GROUP_COMMIT_MAX_DELAY": "0"}, {"SERVER_RESPONSE_CACHE_SIZE": "0"})
+    ],
+    ids=[
+        f"{mode}-{name}"
+        for mode in SERVER_MODE_ENVS
+        for name in ("default", "without_group_commit", "without_cache")
+    ],
+)
+async def test_concurrent_requests_receive_their_own_responses(user_stub: UserServiceStub) -> None:
+    # プレゼンターやUnitOfWorkを共有していれば、並行したリクエストの結果が入れ替わる
+    created: list[CreateUserResponse] = await asyncio.gather(
+        *(user_stub.CreateUser(create_request(i)) for i in range(CONCURRENCY)),
+    )
+    for index, response in enumerate(created):
+        assert (response.user.name, response.user.email) == (f"user{index}", f"user{index}@example.com")
+    assert len({response.user.id for response in created}) == CONCURRENCY
+
+    # 既存ユーザーの取得と新規作成を混ぜて同時に発行する
+    calls: list[tuple[str, int]] = [("get", i) for i in range(CONCURRENCY)]
+    calls += [("create", CONCURRENCY + i) for i in range(CONCURRENCY)]
+    random.shuffle(calls)
+
+    async def call(kind: str, index: int) -> None:
+        if kind == "get":
+            expected = created[index].user
+            response: GetUserResponse = await user_stub.GetUser(GetUserRequest(id=expected.id))
+            assert response.user == expected
+        else:
+            response_created: CreateUserResponse = await user_stub.CreateUser(create_request(index))
+            assert response_created.user.email == f"user{index}@example.com"
+            got: GetUserResponse = await user_stub.GetUser(GetUserRequest(id=response_created.user.id))
+            assert got.user == response_created.user
+
+    await asyncio.gather(*(call(kind, index) for kind, index in calls))
+
+
+async def test_batch_get_users_returns_duplicate_ids_once(user_stub: UserServiceStub) -> None:
+    created: list[CreateUserResponse] = await asyncio.gather(
+        *(user_stub.CreateUser(create_request(i)) for i in range(2)),
+    )
+    first, second = (response.user for response in created)
+    missing = "00000000-0000-0000-0000-000000000000"
+
+    response: BatchGetUsersResponse = await user_stub.BatchGetUsers(
+        BatchGetUsersRequest(ids=[second.id, first.id, missing, second.id.upper(), "invalid", missing, first.id]),
+    )
+
+    assert list(response.users) == [second, first]
+    assert list(response.not_found_ids) == [missing, "invalid"]
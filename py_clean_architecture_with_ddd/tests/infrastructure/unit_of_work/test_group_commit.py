@@ -0,0 +1,53 @@
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+
+from app.application.identity_map.user import UserIdentityMap
+from app.domain.value_object.user.name import UserName
+from app.infrastructure.repository.user import PendingChanges, ReadUserRepositoryImpl, WriteUserRepositoryImpl
+from app.infrastructure.unit_of_work.group_commit import GroupCommitWriter
+from app.infrastructure.unit_of_work.user import UserUnitOfWorkFactoryImpl
+from tests.factory import new_user
+
+pytestmark = pytest.mark.usefixtures("database")
+
+
+async def test_committed_changes_are_published_when_the_caller_is_cancelled() -> None:
+    read_repository = ReadUserRepositoryImpl(identity_map=UserIdentityMap())
+    users = WriteUserRepositoryImpl(read_repository=read_repository)
+    writing = asyncio.Event()
+    resume = asyncio.Event()
+
+    async def write(changes: Sequence[PendingChanges]) -> None:
+        writing.set()
+        await resume.wait()
+        await users.write(changes)
+
+    writer = GroupCommitWriter(write=write, committed=users.publish_written, max_delay=0.001, max_batch_size=100)
+    factory = UserUnitOfWorkFactoryImpl(users=users, group_commit=writer)
+    user = new_user()
+    resume.set()
+    async with factory.create() as uow:
+        await uow.users.save(user)
+    # 変更前の値をIdentityMapに載せておく
+    assert (await read_repository.find_by_id(user.id)).name.value == "taro"
+
+    async def rename() -> None:
+        async with factory.create() as uow:
+            await uow.users.save(user.model_copy(update={"name": UserName(value="jiro")}))
+
+    resume.clear()
+    writing.clear()
+    caller = asyncio.create_task(rename())
+    await writing.wait()
+    # 書き込み中に要求元をキャンセルしても、トランザクションは確定し通知される
+    caller.cancel()
+    resume.set()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    async with asyncio.timeout(5):
+        while writer.transactions < 2:  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+
+    assert (await read_repository.find_by_id(user.id)).name.value == "jiro"
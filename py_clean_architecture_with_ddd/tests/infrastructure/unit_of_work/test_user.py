@@ -0,0 +1,77 @@
+# mypy: disable-error-code="type-abstract"
+import asyncio
+
+import pytest
+from injector import Injector
+
+from app.application.unit_of_work.user import UserUnitOfWorkFactory
+from app.domain.repository.user import ReadUserRepository, WriteUserRepository
+from app.infrastructure.database.config import Config as DatabaseConfig
+from app.infrastructure.repository.user import WriteUserRepositoryImpl
+from tests.factory import new_user
+
+
+class RollbackError(Exception):
+    pass
+
+
+@pytest.mark.parametrize(
+    "server_env",
+    [{}, {"SERVER_GROUP_COMMIT_MAX_DELAY": "0"}],
+    ids=["default", "without_group_commit"],
+)
+async def test_rollback_does_not_affect_a_concurrent_unit_of_work(
+    injector: Injector,
+    database: DatabaseConfig,
+    server_env: dict[str, str],
+) -> None:
+    if server_env and database.engine == "sqlite":
+        # SQLiteは接続毎にトランザクションを直列化するため、UnitOfWork毎のトランザクションは並行しない
+        pytest.skip("SQLiteのトランザクションは並行して開始できません")
+
+    factory = injector.get(UserUnitOfWorkFactory)
+    rolled_back_user = new_user(name="rollback")
+    committed_user = new_user(name="commit")
+    rolled_back_saved = asyncio.Event()
+    committed_saved = asyncio.Event()
+    rolled_back = asyncio.Event()
+
+    async def save_and_fail() -> None:
+        async with factory.create() as uow:
+            await uow.users.save(rolled_back_user)
+            rolled_back_saved.set()
+            await committed_saved.wait()
+            raise RollbackError
+
+    async def roll_back() -> None:
+        with pytest.raises(RollbackError):
+            await save_and_fail()
+        rolled_back.set()
+
+    async def commit() -> None:
+        async with factory.create() as uow:
+            await uow.users.save(committed_user)
+            committed_saved.set()
+            await rolled_back_saved.wait()
+            # もう一方のロールバックが済んでから、保留中の変更を書き込む
+            await rolled_back.wait()
+
+    async with asyncio.timeout(10):
+        await asyncio.gather(roll_back(), commit())
+
+    found = await injector.get(ReadUserRepository).find_by_ids([rolled_back_user.id, committed_user.id])
+    assert list(found) == [committed_user.id]
+
+
+async def test_write_repository_interface_does_not_share_pending_changes(injector: Injector) -> None:
+    first = injector.get(WriteUserRepository)
+    second = injector.get(WriteUserRepository)
+    assert isinstance(first, WriteUserRepositoryImpl)
+    assert isinstance(second, WriteUserRepositoryImpl)
+    assert first is not second
+    assert first is not injector.get(WriteUserRepositoryImpl)
+
+    await first.save(new_user())
+
+    assert not second.take_pending().entities
+    assert not injector.get(WriteUserRepositoryImpl).take_pending().entities